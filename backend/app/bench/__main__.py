@@ -0,0 +1,74 @@
+import argparse
+import json
+import sys
+
+from ..database import db
+from ..database.pool import connect
+from .dataset import generate_dataset
+from .endpoints import SCENARIOS, run_endpoint_benchmark
+from .serialization import run_serialization_benchmark
+from .soak import run_soak
+
+
+def write_report(report, path) -> None:
+    output = json.dumps(report, indent=2)
+    if path:
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(output + "\n")
+    print(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serialization = commands.add_parser("serialization", help="compare row serialization cost before and after")
+    serialization.add_argument("--rows", type=int, default=10000)
+    serialization.add_argument("--repeat", type=int, default=5)
+    generate = commands.add_parser("generate", help="bulk-load synthetic items and audit history into the database")
+    generate.add_argument("--items", type=int, default=10000)
+    generate.add_argument("--history", type=int, default=4, help="mean lifecycle events per item")
+    generate.add_argument("--seed", type=int, default=1)
+    endpoints = commands.add_parser("endpoints", help="measure endpoint latency against a synthetic dataset")
+    endpoints.add_argument("--items", type=int, default=10000)
+    endpoints.add_argument("--history", type=int, default=4, help="mean lifecycle events per item")
+    endpoints.add_argument("--requests", type=int, default=200, help="measured requests per endpoint")
+    endpoints.add_argument("--warmup", type=int, default=20)
+    endpoints.add_argument("--seed", type=int, default=1)
+    endpoints.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="repeat to pick endpoints")
+    endpoints.add_argument("--output", help="write the JSON report to this file")
+    soak = commands.add_parser("soak", help="run concurrent writers and readers, then check consistency")
+    soak.add_argument("--duration", type=float, default=30.0, help="seconds to run the workload")
+    soak.add_argument("--writers", type=int, default=8)
+    soak.add_argument("--readers", type=int, default=4)
+    soak.add_argument("--items", type=int, default=2000)
+    soak.add_argument("--seed", type=int, default=1)
+    soak.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+    if args.command == "serialization":
+        print(json.dumps(run_serialization_benchmark(args.rows, args.repeat), indent=2))
+    elif args.command == "generate":
+        db.init_db()
+        conn = connect(db.DB_PATH)
+        try:
+            print(json.dumps(generate_dataset(conn, args.items, history=args.history, seed=args.seed), indent=2))
+        finally:
+            conn.close()
+    elif args.command == "endpoints":
+        report = run_endpoint_benchmark(
+            args.items,
+            history=args.history,
+            requests=args.requests,
+            warmup=args.warmup,
+            seed=args.seed,
+            scenarios=args.scenario,
+        )
+        write_report(report, args.output)
+    elif args.command == "soak":
+        report = run_soak(args.duration, args.writers, args.readers, args.items, args.seed)
+        write_report(report, args.output)
+        return 0 if report["consistency"]["ok"] and not report["worker_failures"] else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+import json
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from itertools import combinations_with_replacement
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..common import cable_signature_keys, normalize_cable_ends, normalize_cable_length
+from ..core.constants import STATUS_DEPLOYED, STATUS_IN_STOCK, STATUS_RETIRED
+from ..database.data_version import bump_data_version
+
+CATALOG = {
+    "Laptop": [
+        ("Dell", "Latitude 5420"),
+        ("Dell", "Latitude 5440"),
+        ("Dell", "Precision 3571"),
+        ("Dell", "Precision 3591"),
+        ("Lenovo", "ThinkPad T14 Gen 4"),
+        ("Lenovo", "ThinkPad X1 Carbon"),
+        ("HP", "EliteBook 840 G10"),
+        ("Apple", "MacBook Pro 14"),
+    ],
+    "Desktop": [
+        ("Dell", "Precision 7910"),
+        ("Dell", "Precision 3660"),
+        ("Dell", "OptiPlex Micro 7010"),
+        ("Dell", "OptiPlex Micro 7020"),
+        ("HP", "EliteDesk 800 G9"),
+        ("Lenovo", "ThinkCentre M90q"),
+    ],
+    "Monitor": [
+        ("Dell", "P2422H"),
+        ("Dell", "U2720Q"),
+        ("Dell", "U2723QE"),
+        ("LG", "27UK850"),
+        ("Samsung", "S27R650"),
+    ],
+    "Dock": [("Dell", "WD19S"), ("Dell", "WD19DCS"), ("Dell", "WD22TB4"), ("Lenovo", "ThinkPad USB-C Dock")],
+    "Part": [
+        ("Western Digital", "Blue 1TB"),
+        ("Samsung", "870 EVO 500GB"),
+        ("Crucial", "16GB DDR4 3200"),
+        ("NVIDIA", "Quadro P2000"),
+        ("NVIDIA", "RTX A2000"),
+    ],
+}
+CATEGORY_WEIGHTS = {"Laptop": 40, "Desktop": 20, "Monitor": 25, "Dock": 10, "Part": 5}
+CABLE_ENDS = ("HDMI", "DisplayPort", "Mini DisplayPort", "USB C", "USB A", "Ethernet", "Thunderbolt", "VGA")
+CABLE_LENGTHS = ("1", "3", "6", "10", "15", "25", "50")
+CABLE_SHARE = 0.02
+FIRST_NAMES = (
+    "Alice", "Bob", "Carol", "David", "Evan", "Fatima", "Grace", "Hiro", "Ines", "Jordan",
+    "Kai", "Lucia", "Miguel", "Nina", "Omar", "Priya", "Quinn", "Riley", "Sofia", "Taylor",
+)
+LAST_NAMES = (
+    "Carter", "Martinez", "Johnson", "King", "Reed", "Torres", "Perez", "Ortiz", "Brooks", "Lee",
+    "Chen", "Patel", "Nguyen", "Schmidt", "Okafor", "Rossi", "Silva", "Kowalski", "Haddad", "Sato",
+)
+ACTORS = ("owner", "admin", "user")
+SERVICE_TAG_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ0123456789"
+
+ItemRow = Tuple[Any, ...]
+EventRow = Tuple[Any, ...]
+
+
+def _service_tag(rng: random.Random, category: str, index: int) -> str:
+    suffix = "".join(rng.choice(SERVICE_TAG_ALPHABET) for _ in range(5))
+    return f"{category[0]}{suffix}{index:x}".upper()
+
+
+def _cable_signatures(rng: random.Random, limit: int) -> List[Tuple[str, str]]:
+    signatures = [
+        (normalize_cable_ends(f"{left}-{right}"), normalize_cable_length(length))
+        for left, right in combinations_with_replacement(CABLE_ENDS, 2)
+        for length in CABLE_LENGTHS
+    ]
+    rng.shuffle(signatures)
+    return signatures[:limit]
+
+
+def _timestamps(rng: random.Random, start: datetime, end: datetime, count: int) -> List[datetime]:
+    span = max((end - start).total_seconds(), 1.0)
+    offsets = sorted(rng.random() * span for _ in range(count))
+    return [start + timedelta(seconds=offset) for offset in offsets]
+
+
+def _asset_history(
+    rng: random.Random,
+    item_id: int,
+    people: List[str],
+    times: List[datetime],
+) -> Tuple[List[EventRow], str, Optional[str]]:
+    events: List[EventRow] = []
+    status, assigned_user = STATUS_IN_STOCK, None
+    for moment in times:
+        if status == STATUS_RETIRED:
+            action, next_status, next_user = "restore", STATUS_IN_STOCK, None
+        elif status == STATUS_DEPLOYED:
+            if rng.random() < 0.15:
+                action, next_status, next_user = "deploy", STATUS_DEPLOYED, rng.choice(people)
+                if next_user == assigned_user:
+                    continue
+            else:
+                action, next_status, next_user = "return", STATUS_IN_STOCK, None
+        elif rng.random() < 0.1:
+            action, next_status, next_user = "retire", STATUS_RETIRED, None
+        else:
+            action, next_status, next_user = "deploy", STATUS_DEPLOYED, rng.choice(people)
+        changes = {
+            "status": {"old": status, "new": next_status},
+            "assigned_user": {"old": assigned_user, "new": next_user},
+        }
+        events.append((item_id, rng.choice(ACTORS), moment.isoformat(), action, json.dumps(changes), None))
+        status, assigned_user = next_status, next_user
+    return events, status, assigned_user
+
+
+def _cable_history(
+    rng: random.Random,
+    item_id: int,
+    times: List[datetime],
+) -> Tuple[List[EventRow], int]:
+    events: List[EventRow] = []
+    quantity = 0
+    for moment in times:
+        delta = rng.randint(5, 40) if quantity < 10 or rng.random() < 0.3 else -rng.randint(1, min(quantity, 10))
+        changes = {"quantity": {"old": quantity, "new": quantity + delta}}
+        note = "Restock" if delta > 0 else None
+        events.append((item_id, rng.choice(ACTORS), moment.isoformat(), "quantity_adjust", json.dumps(changes), note))
+        quantity += delta
+    return events, quantity
+
+
+def _build_batch(
+    rng: random.Random,
+    first_id: int,
+    count: int,
+    cables: List[Tuple[str, str]],
+    people: List[str],
+    history: int,
+    start: datetime,
+    end: datetime,
+) -> Tuple[List[ItemRow], List[EventRow]]:
+    categories = list(CATEGORY_WEIGHTS)
+    weights = list(CATEGORY_WEIGHTS.values())
+    items: List[ItemRow] = []
+    events: List[EventRow] = []
+    for item_id in range(first_id, first_id + count):
+        cable = cables.pop() if cables and rng.random() < CABLE_SHARE * 2 else None
+        if cable is not None:
+            category, (make, model), service_tag = "Cable", cable, "N/A"
+        else:
+            category = rng.choices(categories, weights)[0]
+            make, model = rng.choice(CATALOG[category])
+            service_tag = _service_tag(rng, category, item_id)
+        event_count = max(0, int(rng.expovariate(1 / history))) if history > 0 else 0
+        times = _timestamps(rng, start, end, event_count + 1)
+        created_at = times[0].isoformat()
+        row = f"{chr(65 + rng.randrange(12))}{rng.randint(1, 40)}"
+        if cable is not None:
+            history_events, quantity = _cable_history(rng, item_id, times[1:])
+            status, assigned_user = STATUS_IN_STOCK, None
+        else:
+            history_events, status, assigned_user = _asset_history(rng, item_id, people, times[1:])
+            quantity = 1
+        add_changes = {
+            "category": {"old": None, "new": category},
+            "make": {"old": None, "new": make},
+            "model": {"old": None, "new": model},
+            "service_tag": {"old": None, "new": service_tag},
+            "quantity": {"old": None, "new": 0 if cable is not None else 1},
+            "row": {"old": None, "new": row},
+            "note": {"old": None, "new": None},
+            "status": {"old": None, "new": STATUS_IN_STOCK},
+        }
+        if cable is None:
+            add_changes["assigned_user"] = {"old": None, "new": None}
+        updated_at = history_events[-1][2] if history_events else created_at
+        actor = rng.choice(ACTORS)
+        items.append(
+            (
+                item_id, category, make, model, service_tag, quantity, row, None, status, assigned_user,
+                created_at, actor, updated_at, *cable_signature_keys(category, make, model),
+            )
+        )
+        events.append((item_id, actor, created_at, "add", json.dumps(add_changes), None))
+        events.extend(history_events)
+    return items, events
+
+
+def generate_dataset(
+    conn: sqlite3.Connection,
+    items: int,
+    history: int = 4,
+    seed: int = 1,
+    years: float = 3.0,
+    batch_size: int = 5000,
+) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    end = datetime.utcnow()
+    start = end - timedelta(days=365 * years)
+    people = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+    existing = {
+        (row[0], row[1])
+        for row in conn.execute("SELECT cable_ends_key, cable_length_key FROM items WHERE cable_ends_key IS NOT NULL")
+    }
+    cables = [
+        signature
+        for signature in _cable_signatures(rng, int(items * CABLE_SHARE) + len(existing))
+        if cable_signature_keys("Cable", *signature) not in existing
+    ]
+    next_id = conn.execute(
+        """
+        SELECT MAX(
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'items'), 0),
+            COALESCE((SELECT MAX(id) FROM items), 0)
+        )
+        """
+    ).fetchone()[0] + 1
+    totals = {"items": 0, "cables": 0, "events": 0}
+    remaining = items
+    while remaining > 0:
+        count = min(batch_size, remaining)
+        item_rows, event_rows = _build_batch(rng, next_id, count, cables, people, history, start, end)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                """
+                INSERT INTO items (
+                    id, category, make, model, service_tag, quantity, row, note, status, assigned_user,
+                    created_at, created_by, updated_at, cable_ends_key, cable_length_key
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                item_rows,
+            )
+            conn.executemany(
+                "INSERT INTO audit_events (item_id, actor, timestamp, action, changes, note) VALUES (?, ?, ?, ?, ?, ?)",
+                event_rows,
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        totals["items"] += len(item_rows)
+        totals["cables"] += sum(1 for row in item_rows if row[1] == "Cable")
+        totals["events"] += len(event_rows)
+        next_id += count
+        remaining -= count
+    bump_data_version(conn)
+    conn.commit()
+    return {**totals, "seed": seed, "seconds": round(time.perf_counter() - started, 2)}
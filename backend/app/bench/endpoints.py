@@ -0,0 +1,217 @@
+import math
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi.testclient import TestClient
+
+from ..core.compression import response_cache
+from ..database import db
+from ..database.pool import connect
+from ..main import app
+from .dataset import CATALOG, CATEGORY_WEIGHTS, FIRST_NAMES, LAST_NAMES, generate_dataset
+
+SEARCH_TERMS = ("latitude", "precision", "thinkpad", "dock", "hdmi", "carter", "monitor", "optiplex")
+PAGE_SIZE = 50
+
+Request = Tuple[str, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class BenchContext:
+    def __init__(self, rng: random.Random, conn: sqlite3.Connection):
+        self.rng = rng
+        self.item_ids = [row[0] for row in conn.execute("SELECT id FROM items")]
+        self.in_stock = [
+            row[0]
+            for row in conn.execute("SELECT id FROM items WHERE status = 'In Stock' AND category != 'Cable'")
+        ]
+        rng.shuffle(self.in_stock)
+        self.deployed: List[int] = []
+        self.categories = list(CATEGORY_WEIGHTS) + ["Cable"]
+        self.busiest_category = conn.execute(
+            """
+            SELECT i.category FROM audit_events a JOIN items i ON i.id = a.item_id
+            GROUP BY i.category ORDER BY COUNT(*) DESC LIMIT 1
+            """
+        ).fetchone()[0]
+        self.cursors: Dict[str, Optional[str]] = {}
+        self.following: Optional[str] = None
+
+    def item_id(self) -> int:
+        return self.rng.choice(self.item_ids)
+
+    def next_page(self, key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.following = key
+        cursor = self.cursors.get(key)
+        return {**params, "cursor": cursor} if cursor else params
+
+    def follow(self, response: Any) -> None:
+        if self.following is None:
+            return
+        key, self.following = self.following, None
+        self.cursors[key] = response.json().get("next_cursor") if response.status_code == 200 else None
+
+
+def _list_items(ctx: BenchContext) -> Request:
+    params: Dict[str, Any] = {"limit": PAGE_SIZE, "sort": ctx.rng.choice(("id", "updated", "created"))}
+    if ctx.rng.random() < 0.5:
+        params["category"] = ctx.rng.choice(ctx.categories)
+    if ctx.rng.random() < 0.3:
+        params["status"] = ctx.rng.choice(("In Stock", "Deployed"))
+    return "GET", "/api/items", params, None
+
+
+def _list_items_deep(ctx: BenchContext) -> Request:
+    return "GET", "/api/items", ctx.next_page("items", {"limit": PAGE_SIZE, "sort": "updated"}), None
+
+
+def _search_items(ctx: BenchContext) -> Request:
+    params = {"q": ctx.rng.choice(SEARCH_TERMS), "limit": PAGE_SIZE, "sort": "relevance"}
+    return "GET", "/api/items", params, None
+
+
+def _category_summary(ctx: BenchContext) -> Request:
+    return "GET", f"/api/items/category/{ctx.rng.choice(list(CATALOG))}/summary", None, None
+
+
+def _item_stats(ctx: BenchContext) -> Request:
+    return "GET", "/api/items/stats", {"include_models": ctx.rng.random() < 0.5}, None
+
+
+def _item_detail(ctx: BenchContext) -> Request:
+    return "GET", f"/api/items/{ctx.item_id()}", None, None
+
+
+def _item_history(ctx: BenchContext) -> Request:
+    return "GET", f"/api/items/{ctx.item_id()}/history", {"limit": PAGE_SIZE}, None
+
+
+def _category_history_deep(ctx: BenchContext) -> Request:
+    path = f"/api/items/category/{ctx.busiest_category}/history"
+    return "GET", path, ctx.next_page(path, {"limit": PAGE_SIZE}), None
+
+
+def _deploy_item(ctx: BenchContext) -> Request:
+    item_id = ctx.in_stock.pop() if ctx.in_stock else ctx.item_id()
+    ctx.deployed.append(item_id)
+    assigned_user = f"{ctx.rng.choice(FIRST_NAMES)} {ctx.rng.choice(LAST_NAMES)}"
+    return "POST", f"/api/items/{item_id}/deploy", None, {"assigned_user": assigned_user}
+
+
+def _return_item(ctx: BenchContext) -> Request:
+    item_id = ctx.deployed.pop() if ctx.deployed else ctx.item_id()
+    ctx.in_stock.insert(0, item_id)
+    return "POST", f"/api/items/{item_id}/return", None, {}
+
+
+SCENARIOS: Dict[str, Callable[[BenchContext], Request]] = {
+    "list_items": _list_items,
+    "list_items_deep": _list_items_deep,
+    "search_items": _search_items,
+    "category_summary": _category_summary,
+    "item_stats": _item_stats,
+    "item_detail": _item_detail,
+    "item_history": _item_history,
+    "category_history_deep": _category_history_deep,
+    "deploy_item": _deploy_item,
+    "return_item": _return_item,
+}
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], elapsed: float, statuses: Dict[str, int], sizes: List[int]) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else None,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if ordered else None,
+        "mean_bytes": round(sum(sizes) / len(sizes)) if sizes else None,
+        "statuses": statuses,
+    }
+
+
+def run_scenario(
+    client: TestClient,
+    ctx: BenchContext,
+    build: Callable[[BenchContext], Request],
+    requests: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    sizes: List[int] = []
+    statuses: Dict[str, int] = {}
+    elapsed = 0.0
+    cache_hits = 0
+    for index in range(warmup + requests):
+        method, path, params, body = build(ctx)
+        response_cache.clear()
+        hits_before = response_cache.stats()["hits"]
+        started = time.perf_counter()
+        response = client.request(method, path, params=params, json=body)
+        duration = time.perf_counter() - started
+        ctx.follow(response)
+        if index < warmup:
+            continue
+        elapsed += duration
+        latencies.append(duration)
+        sizes.append(len(response.content))
+        statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+        cache_hits += response_cache.stats()["hits"] - hits_before
+    return {**summarize(latencies, elapsed, statuses, sizes), "response_cache_hits": cache_hits}
+
+
+def run_endpoint_benchmark(
+    items: int = 10000,
+    history: int = 4,
+    requests: int = 200,
+    warmup: int = 20,
+    seed: int = 1,
+    scenarios: Optional[Sequence[str]] = None,
+) -> Dict[str, Any]:
+    selected = list(scenarios or SCENARIOS)
+    unknown = [name for name in selected if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}")
+    original_path = db.DB_PATH
+    with tempfile.TemporaryDirectory() as directory:
+        db.DB_PATH = os.path.join(directory, "bench.db")
+        try:
+            db.init_db()
+            conn = connect(db.DB_PATH)
+            dataset = generate_dataset(conn, items, history=history, seed=seed)
+            ctx = BenchContext(random.Random(seed), conn)
+            conn.close()
+            results = {}
+            with TestClient(app) as client:
+                token = client.post("/api/token", data={"username": "owner", "password": "owner"}).json()
+                client.headers["Authorization"] = f"Bearer {token['access_token']}"
+                for name in selected:
+                    results[name] = run_scenario(client, ctx, SCENARIOS[name], requests, warmup)
+        finally:
+            db.close_db()
+            db.DB_PATH = original_path
+    return {
+        "dataset": {**dataset, "history": history},
+        "requests_per_endpoint": requests,
+        "warmup": warmup,
+        "environment": {
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "endpoints": results,
+    }
@@ -0,0 +1,143 @@
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from ..common import FastJSONResponse, history_serializer, item_serializer, tuple_cursor
+from ..database import db
+from ..database.pool import connect
+
+
+def legacy_row_to_item(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "category": row["category"],
+        "make": row["make"],
+        "model": row["model"],
+        "service_tag": row["service_tag"],
+        "quantity": row["quantity"] if "quantity" in row.keys() else 1,
+        "row": row["row"] if "row" in row.keys() else None,
+        "note": row["note"] if "note" in row.keys() else None,
+        "status": row["status"],
+        "assigned_user": row["assigned_user"],
+        "created_at": row["created_at"],
+        "created_by": row["created_by"],
+        "updated_at": row["updated_at"] if "updated_at" in row.keys() else row["created_at"],
+    }
+
+
+def legacy_build_history(events: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+    history = []
+    for event in events:
+        history.append(
+            {
+                "id": event["id"],
+                "actor": event["actor"],
+                "timestamp": event["timestamp"],
+                "action": event["action"],
+                "changes": json.loads(event["changes"]) if event["changes"] else None,
+                "note": event["note"],
+            }
+        )
+    return history
+
+
+def populate(conn: sqlite3.Connection, rows: int) -> None:
+    conn.execute("DELETE FROM audit_events")
+    conn.execute("DELETE FROM items")
+    conn.executemany(
+        """
+        INSERT INTO items (id, category, make, model, service_tag, status, assigned_user, created_at, created_by,
+                           updated_at, row, note, quantity)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+        """,
+        [
+            (
+                index,
+                ("Laptop", "Desktop", "Monitor", "Dock")[index % 4],
+                ("Dell", "HP", "Lenovo")[index % 3],
+                f"Model {index % 97}",
+                f"TAG{index:07d}",
+                ("In Stock", "Deployed")[index % 2],
+                f"User {index % 53}" if index % 2 else None,
+                "2024-01-01T00:00:00",
+                "owner",
+                "2024-06-01T00:00:00",
+                f"R{index % 40}",
+                None,
+            )
+            for index in range(1, rows + 1)
+        ],
+    )
+    changes = json.dumps({"status": {"old": "In Stock", "new": "Deployed"}, "assigned_user": {"old": None, "new": "User"}})
+    conn.executemany(
+        "INSERT INTO audit_events (item_id, actor, timestamp, action, changes, note) VALUES (?, ?, ?, ?, ?, ?)",
+        [(index, "owner", "2024-06-01T00:00:00", "deploy", changes, None) for index in range(1, rows + 1)],
+    )
+    conn.commit()
+
+
+def best_of(repeat: int, fn: Callable[[], bytes]) -> Dict[str, Any]:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(fn())
+        timings.append(time.perf_counter() - started)
+    return {"best_ms": round(min(timings) * 1000, 2), "mean_ms": round(sum(timings) / len(timings) * 1000, 2), "bytes": size}
+
+
+def run_serialization_benchmark(rows: int = 10000, repeat: int = 5) -> Dict[str, Any]:
+    original_path = db.DB_PATH
+    with tempfile.TemporaryDirectory() as directory:
+        db.DB_PATH = os.path.join(directory, "bench.db")
+        try:
+            db.init_db()
+            conn = connect(db.DB_PATH)
+            populate(conn, rows)
+
+            def items_before() -> bytes:
+                found = conn.execute("SELECT * FROM items ORDER BY id").fetchall()
+                content = {"items": [legacy_row_to_item(row) for row in found], "total": len(found)}
+                return JSONResponse(jsonable_encoder(content)).body
+
+            def items_after() -> bytes:
+                cursor = tuple_cursor(conn, "SELECT * FROM items ORDER BY id")
+                serialize = item_serializer(cursor.description)
+                found = [serialize(row) for row in cursor.fetchall()]
+                return FastJSONResponse({"items": found, "total": len(found)}).body
+
+            def history_before() -> bytes:
+                found = conn.execute("SELECT * FROM audit_events ORDER BY id DESC").fetchall()
+                return JSONResponse(jsonable_encoder({"history": legacy_build_history(found)})).body
+
+            def history_after() -> bytes:
+                cursor = tuple_cursor(conn, "SELECT * FROM audit_events ORDER BY id DESC")
+                serialize = history_serializer(cursor.description)
+                return FastJSONResponse({"history": [serialize(row) for row in cursor.fetchall()]}).body
+
+            results = {}
+            for name, before, after in (
+                ("items", items_before, items_after),
+                ("history", history_before, history_after),
+            ):
+                before_result = best_of(repeat, before)
+                after_result = best_of(repeat, after)
+                scale = 10000 / rows
+                results[name] = {
+                    "before": before_result,
+                    "after": after_result,
+                    "before_ms_per_10k_rows": round(before_result["best_ms"] * scale, 2),
+                    "after_ms_per_10k_rows": round(after_result["best_ms"] * scale, 2),
+                    "speedup": round(before_result["best_ms"] / after_result["best_ms"], 2),
+                }
+            conn.close()
+        finally:
+            db.close_db()
+            db.DB_PATH = original_path
+    return {"rows": rows, "repeat": repeat, "results": results}
@@ -0,0 +1,279 @@
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi.testclient import TestClient
+
+from ..database import db
+from ..database.pool import connect
+from ..database.rollup import rebuild_item_rollup
+from ..main import app
+from .dataset import FIRST_NAMES, LAST_NAMES, generate_dataset
+from .endpoints import percentile
+
+SOAK_MAX_RETRIES = 5
+SOAK_RETRY_BACKOFF_SECONDS = 0.05
+REPLAYED_FIELDS = ("category", "make", "model", "service_tag", "quantity", "row", "note", "status", "assigned_user")
+
+Operation = Tuple[str, str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class SoakRecorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._operations: Dict[str, Dict[str, Any]] = {}
+        self.quantity_deltas: Dict[int, int] = {}
+        self.applied_writes = 0
+
+    def record(self, name: str, latency: float, status: int, retries: int, lock_error: bool) -> None:
+        with self._lock:
+            stats = self._operations.setdefault(
+                name, {"latencies": [], "statuses": {}, "retries": 0, "lock_errors": 0}
+            )
+            stats["latencies"].append(latency)
+            stats["statuses"][str(status)] = stats["statuses"].get(str(status), 0) + 1
+            stats["retries"] += retries
+            stats["lock_errors"] += int(lock_error)
+
+    def applied(self, writes: int, cable_id: Optional[int] = None, delta: int = 0) -> None:
+        with self._lock:
+            self.applied_writes += writes
+            if cable_id is not None:
+                self.quantity_deltas[cable_id] = self.quantity_deltas.get(cable_id, 0) + delta
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        with self._lock:
+            operations = {}
+            for name, stats in sorted(self._operations.items()):
+                ordered = sorted(stats["latencies"])
+                operations[name] = {
+                    "requests": len(ordered),
+                    "throughput_rps": round(len(ordered) / elapsed, 1) if elapsed else None,
+                    "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+                    "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+                    "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+                    "max_ms": round(ordered[-1] * 1000, 3) if ordered else None,
+                    "statuses": stats["statuses"],
+                    "retries": stats["retries"],
+                    "lock_errors": stats["lock_errors"],
+                }
+            total = sum(operation["requests"] for operation in operations.values())
+            return {
+                "requests": total,
+                "throughput_rps": round(total / elapsed, 1) if elapsed else None,
+                "lock_errors": sum(operation["lock_errors"] for operation in operations.values()),
+                "retries": sum(operation["retries"] for operation in operations.values()),
+                "server_errors": sum(
+                    count
+                    for operation in operations.values()
+                    for status, count in operation["statuses"].items()
+                    if status.startswith("5")
+                ),
+                "operations": operations,
+            }
+
+
+def is_lock_error(status: int, body: bytes) -> bool:
+    return status == 503 or (status >= 500 and b"locked" in body.lower())
+
+
+def send(client: TestClient, recorder: SoakRecorder, name: str, operation: Operation) -> Any:
+    method, path, params, body = operation
+    retries = 0
+    lock_error = False
+    started = time.perf_counter()
+    while True:
+        response = client.request(method, path, params=params, json=body)
+        if not is_lock_error(response.status_code, response.content):
+            break
+        lock_error = True
+        if retries >= SOAK_MAX_RETRIES:
+            break
+        retries += 1
+        time.sleep(SOAK_RETRY_BACKOFF_SECONDS * retries)
+    recorder.record(name, time.perf_counter() - started, response.status_code, retries, lock_error)
+    return response
+
+
+class SoakWorkload:
+    def __init__(self, conn: sqlite3.Connection):
+        self.assets = [
+            row[0]
+            for row in conn.execute("SELECT id FROM items WHERE category != 'Cable' AND status != 'Retired'")
+        ]
+        self.cables = [row[0] for row in conn.execute("SELECT id FROM items WHERE category = 'Cable'")]
+        self.categories = [row[0] for row in conn.execute("SELECT DISTINCT category FROM items")]
+
+    def writer(self, client: TestClient, recorder: SoakRecorder, rng: random.Random) -> None:
+        roll = rng.random()
+        if roll < 0.35 and self.cables:
+            cable_id = rng.choice(self.cables)
+            delta = rng.choice((-2, -1, 1, 2, 5))
+            response = send(
+                client,
+                recorder,
+                "adjust_quantity",
+                ("POST", f"/api/items/{cable_id}/quantity", None, {"delta": delta}),
+            )
+            if response.status_code == 200:
+                recorder.applied(1, cable_id, delta)
+        elif roll < 0.65:
+            assigned_user = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            response = send(
+                client,
+                recorder,
+                "deploy_item",
+                ("POST", f"/api/items/{rng.choice(self.assets)}/deploy", None, {"assigned_user": assigned_user}),
+            )
+            if response.status_code == 200:
+                recorder.applied(1)
+        elif roll < 0.9:
+            response = send(client, recorder, "return_item", ("POST", f"/api/items/{rng.choice(self.assets)}/return", None, {}))
+            if response.status_code == 200:
+                recorder.applied(1)
+        else:
+            action = rng.choice(("deploy", "return"))
+            payload: Dict[str, Any] = {"ids": rng.sample(self.assets, min(10, len(self.assets))), "mode": "best_effort"}
+            if action == "deploy":
+                payload["assigned_user"] = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            response = send(client, recorder, f"bulk_{action}", ("POST", f"/api/items/bulk/{action}", None, payload))
+            if response.status_code == 200:
+                recorder.applied(response.json()["applied"])
+
+    def reader(self, client: TestClient, recorder: SoakRecorder, rng: random.Random) -> None:
+        roll = rng.random()
+        if roll < 0.4:
+            params = {"limit": 50, "category": rng.choice(self.categories)}
+            send(client, recorder, "list_items", ("GET", "/api/items", params, None))
+        elif roll < 0.7:
+            item_id = rng.choice(self.assets + self.cables)
+            send(client, recorder, "item_detail", ("GET", f"/api/items/{item_id}", None, None))
+        else:
+            send(client, recorder, "item_stats", ("GET", "/api/items/stats", None, None))
+
+
+def _run_workers(
+    client: TestClient,
+    recorder: SoakRecorder,
+    workers: List[Tuple[Callable[[TestClient, SoakRecorder, random.Random], None], random.Random]],
+    duration: float,
+) -> Tuple[float, List[str]]:
+    deadline = time.perf_counter() + duration
+    failures: List[str] = []
+
+    def loop(step, rng) -> None:
+        try:
+            while time.perf_counter() < deadline:
+                step(client, recorder, rng)
+        except Exception as exc:
+            failures.append(repr(exc))
+
+    threads = [threading.Thread(target=loop, args=worker, daemon=True) for worker in workers]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, failures
+
+
+def replay_item_state(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    state: Dict[int, Dict[str, Any]] = {}
+    for item_id, changes in conn.execute("SELECT item_id, changes FROM audit_events ORDER BY id ASC"):
+        fields = state.setdefault(item_id, {})
+        for field, change in (json.loads(changes) if changes else {}).items():
+            if isinstance(change, dict) and "new" in change:
+                fields[field] = change["new"]
+    mismatches = []
+    for row in conn.execute(f"SELECT id, {', '.join(REPLAYED_FIELDS)} FROM items"):
+        replayed = state.get(row[0], {})
+        for field, value in zip(REPLAYED_FIELDS, row[1:]):
+            if field in replayed and replayed[field] != value:
+                mismatches.append({"item_id": row[0], "field": field, "item": value, "audit": replayed[field]})
+    return mismatches
+
+
+def check_consistency(
+    conn: sqlite3.Connection,
+    recorder: SoakRecorder,
+    baseline_events: int,
+    baseline_quantities: Dict[int, int],
+) -> Dict[str, Any]:
+    state_mismatches = replay_item_state(conn)
+    events = conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0] - baseline_events
+    quantity_mismatches = []
+    for cable_id, delta in sorted(recorder.quantity_deltas.items()):
+        quantity = conn.execute("SELECT quantity FROM items WHERE id = ?", (cable_id,)).fetchone()[0]
+        if quantity != baseline_quantities[cable_id] + delta:
+            quantity_mismatches.append(
+                {"item_id": cable_id, "expected": baseline_quantities[cable_id] + delta, "actual": quantity}
+            )
+    rollup = sorted(conn.execute("SELECT * FROM item_rollup").fetchall())
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        rebuild_item_rollup(conn)
+        rebuilt = sorted(conn.execute("SELECT * FROM item_rollup").fetchall())
+    finally:
+        conn.rollback()
+    checks = {
+        "item_state_matches_audit": not state_mismatches,
+        "audit_events_match_applied_writes": events == recorder.applied_writes,
+        "cable_quantities_match_ledger": not quantity_mismatches,
+        "rollup_matches_rebuild": rollup == rebuilt,
+    }
+    return {
+        "ok": all(checks.values()),
+        "checks": checks,
+        "audit_events_written": events,
+        "applied_writes": recorder.applied_writes,
+        "state_mismatches": state_mismatches[:20],
+        "quantity_mismatches": quantity_mismatches[:20],
+    }
+
+
+def run_soak(
+    duration: float = 30.0,
+    writers: int = 8,
+    readers: int = 4,
+    items: int = 2000,
+    seed: int = 1,
+) -> Dict[str, Any]:
+    original_path = db.DB_PATH
+    with tempfile.TemporaryDirectory() as directory:
+        db.DB_PATH = os.path.join(directory, "soak.db")
+        try:
+            db.init_db()
+            conn = connect(db.DB_PATH)
+            conn.row_factory = None
+            generate_dataset(conn, items, seed=seed)
+            workload = SoakWorkload(conn)
+            baseline_events = conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0]
+            baseline_quantities = dict(conn.execute("SELECT id, quantity FROM items WHERE category = 'Cable'").fetchall())
+            recorder = SoakRecorder()
+            rng = random.Random(seed)
+            workers = [(workload.writer, random.Random(rng.random())) for _ in range(writers)]
+            workers += [(workload.reader, random.Random(rng.random())) for _ in range(readers)]
+            with TestClient(app, raise_server_exceptions=False) as client:
+                token = client.post("/api/token", data={"username": "owner", "password": "owner"}).json()
+                client.headers["Authorization"] = f"Bearer {token['access_token']}"
+                elapsed, failures = _run_workers(client, recorder, workers, duration)
+            consistency = check_consistency(conn, recorder, baseline_events, baseline_quantities)
+            conn.close()
+        finally:
+            db.close_db()
+            db.DB_PATH = original_path
+    return {
+        "duration_seconds": round(elapsed, 2),
+        "writers": writers,
+        "readers": readers,
+        "items": items,
+        "seed": seed,
+        **recorder.report(elapsed),
+        "worker_failures": failures,
+        "consistency": consistency,
+    }
@@ -1,17 +1,30 @@
 from .cable import (
     CABLE_DUPLICATE_ERROR,
     cable_signature,
+    cable_signature_keys,
     is_cable_unique_integrity_error,
     normalize_cable_ends,
     normalize_cable_length,
     raise_if_cable_unique_integrity_error,
 )
+from .etag import etag_headers, etag_matches, not_modified, weak_etag
+from .pagination import decode_cursor, encode_cursor
+from .serialization import (
+    FastJSONResponse,
+    column_index,
+    dumps_json,
+    history_serializer,
+    item_serializer,
+    tuple_cursor,
+)
 from .utils import (
     capitalize_first,
     create_audit_event,
+    create_audit_events,
     create_user_audit_log,
     is_cable_category,
     now_iso,
+    parse_iso_timestamp,
     require_nonempty,
     row_to_item,
     title_case_words,
@@ -20,15 +33,30 @@ from .utils import (
 __all__ = [
     "CABLE_DUPLICATE_ERROR",
     "cable_signature",
+    "cable_signature_keys",
     "is_cable_unique_integrity_error",
     "normalize_cable_ends",
     "normalize_cable_length",
     "raise_if_cable_unique_integrity_error",
+    "etag_headers",
+    "etag_matches",
+    "not_modified",
+    "weak_etag",
+    "decode_cursor",
+    "encode_cursor",
+    "FastJSONResponse",
+    "column_index",
+    "dumps_json",
+    "history_serializer",
+    "item_serializer",
+    "tuple_cursor",
     "capitalize_first",
     "create_audit_event",
+    "create_audit_events",
     "create_user_audit_log",
     "is_cable_category",
     "now_iso",
+    "parse_iso_timestamp",
     "require_nonempty",
     "row_to_item",
     "title_case_words",
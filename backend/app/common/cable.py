@@ -3,6 +3,8 @@ from typing import Optional, Tuple
 
 from fastapi import HTTPException
 
+from .utils import is_cable_category
+
 
 CABLE_DUPLICATE_ERROR = (
     "A cable with the same ends and length already exists. "
@@ -46,8 +48,15 @@ def cable_signature(make: str, model: str) -> Tuple[str, str]:
     )
 
 
+def cable_signature_keys(category: str, make: str, model: str) -> Tuple[Optional[str], Optional[str]]:
+    if not is_cable_category(category):
+        return None, None
+    return cable_signature(make, model)
+
+
 def is_cable_unique_integrity_error(exc: sqlite3.IntegrityError) -> bool:
-    return "idx_items_cable_unique_signature" in str(exc)
+    message = str(exc)
+    return "idx_items_cable_unique_signature" in message or "items.cable_ends_key" in message
 
 
 def raise_if_cable_unique_integrity_error(exc: sqlite3.IntegrityError) -> None:
@@ -0,0 +1,32 @@
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+
+def weak_etag(version: str) -> str:
+    return f'W/"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def etag_headers(version: str) -> Dict[str, str]:
+    return {"ETag": weak_etag(version), "Cache-Control": "private, no-cache"}
+
+
+def not_modified(request: Request, headers: Dict[str, str]) -> Optional[Response]:
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return None
@@ -0,0 +1,28 @@
+import base64
+import json
+from typing import Any, List, Optional
+
+from fastapi import HTTPException
+
+CURSOR_VALUE_TYPES = (str, int, float)
+
+
+def encode_cursor(scope: str, values: List[Any]) -> str:
+    payload = json.dumps({"s": scope, "k": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], scope: str, size: int) -> Optional[List[Any]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        values = payload["k"]
+        if payload["s"] != scope or not isinstance(values, list) or len(values) != size:
+            raise ValueError("cursor scope mismatch")
+        if not all(value is None or isinstance(value, CURSOR_VALUE_TYPES) for value in values):
+            raise ValueError("cursor values must be scalars")
+    except (ValueError, KeyError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    return values
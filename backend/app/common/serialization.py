@@ -0,0 +1,101 @@
+import json
+import sqlite3
+from operator import itemgetter
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ITEM_FIELDS = (
+    "id",
+    "category",
+    "make",
+    "model",
+    "service_tag",
+    "quantity",
+    "row",
+    "note",
+    "status",
+    "assigned_user",
+    "created_at",
+    "created_by",
+    "updated_at",
+)
+ITEM_DEFAULTS = {"quantity": 1, "row": None, "note": None}
+HISTORY_FIELDS = ("id", "actor", "timestamp", "action", "changes", "note")
+
+Description = Sequence[Tuple[Any, ...]]
+RowSerializer = Callable[[Tuple[Any, ...]], Dict[str, Any]]
+
+
+def dumps_json(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+def tuple_cursor(conn: sqlite3.Connection, query: str, params: Sequence[Any] = ()) -> sqlite3.Cursor:
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor.execute(query, params)
+
+
+def column_index(description: Description) -> Dict[str, int]:
+    columns: Dict[str, int] = {}
+    for index, column in enumerate(description):
+        columns.setdefault(column[0], index)
+    return columns
+
+
+def _field_getter(columns: Dict[str, int], fields: Sequence[str]) -> Callable[[Tuple[Any, ...]], Tuple[Any, ...]]:
+    getter = itemgetter(*(columns[field] for field in fields))
+    if len(fields) == 1:
+        return lambda row: (getter(row),)
+    return getter
+
+
+def item_serializer(description: Description) -> RowSerializer:
+    columns = column_index(description)
+    present = tuple(field for field in ITEM_FIELDS if field in columns)
+    getter = _field_getter(columns, present)
+    if present == ITEM_FIELDS:
+        return lambda row: dict(zip(ITEM_FIELDS, getter(row)))
+
+    def serialize(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        values = dict(zip(present, getter(row)))
+        item = {}
+        for field in ITEM_FIELDS:
+            if field in values:
+                item[field] = values[field]
+            elif field == "updated_at":
+                item[field] = values.get("created_at")
+            else:
+                item[field] = ITEM_DEFAULTS.get(field)
+        return item
+
+    return serialize
+
+
+def history_serializer(description: Description, extra: Optional[Dict[str, str]] = None) -> RowSerializer:
+    columns = column_index(description)
+    extra = extra or {}
+    fields = HISTORY_FIELDS + tuple(extra)
+    getter = _field_getter(columns, HISTORY_FIELDS + tuple(extra.values()))
+    loads = json.loads
+
+    def serialize(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        entry = dict(zip(fields, getter(row)))
+        changes = entry["changes"]
+        entry["changes"] = loads(changes) if changes else None
+        return entry
+
+    return serialize
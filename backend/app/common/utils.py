@@ -1,7 +1,7 @@
 import json
 import sqlite3
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from fastapi import HTTPException
 
@@ -17,6 +17,18 @@ def require_nonempty(value: str, field_name: str) -> str:
     return cleaned
 
 
+def parse_iso_timestamp(value: Optional[str], field_name: str) -> Optional[str]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"{field_name} must be an ISO 8601 timestamp") from exc
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat()
+
+
 def title_case_words(value: str) -> str:
     return " ".join(
         [word[:1].upper() + word[1:].lower() for word in value.strip().split()]
@@ -36,20 +48,21 @@ def is_cable_category(value: Optional[str]) -> bool:
 
 
 def row_to_item(row: sqlite3.Row) -> Dict[str, Any]:
+    keys = row.keys()
     return {
         "id": row["id"],
         "category": row["category"],
         "make": row["make"],
         "model": row["model"],
         "service_tag": row["service_tag"],
-        "quantity": row["quantity"] if "quantity" in row.keys() else 1,
-        "row": row["row"] if "row" in row.keys() else None,
-        "note": row["note"] if "note" in row.keys() else None,
+        "quantity": row["quantity"] if "quantity" in keys else 1,
+        "row": row["row"] if "row" in keys else None,
+        "note": row["note"] if "note" in keys else None,
         "status": row["status"],
         "assigned_user": row["assigned_user"],
         "created_at": row["created_at"],
         "created_by": row["created_by"],
-        "updated_at": row["updated_at"] if "updated_at" in row.keys() else row["created_at"],
+        "updated_at": row["updated_at"] if "updated_at" in keys else row["created_at"],
     }
 
 
@@ -71,6 +84,24 @@ def create_audit_event(
     )
 
 
+def create_audit_events(
+    conn: sqlite3.Connection,
+    events: Iterable[Tuple[int, str, str, Optional[Dict[str, Dict[str, Any]]], Optional[str]]],
+    timestamp: Optional[str] = None,
+) -> None:
+    event_time = timestamp or now_iso()
+    conn.executemany(
+        """
+        INSERT INTO audit_events (item_id, actor, timestamp, action, changes, note)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (item_id, actor, event_time, action, json.dumps(changes) if changes else None, note)
+            for item_id, actor, action, changes, note in events
+        ],
+    )
+
+
 def create_user_audit_log(
     conn: sqlite3.Connection,
     actor: str,
@@ -0,0 +1,325 @@
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import anyio
+from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..common import dumps_json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("STOCKROOM_COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("STOCKROOM_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("STOCKROOM_BROTLI_QUALITY", "5"))
+COMPRESSION_OFFLOAD_SIZE = 64 * 1024
+RESPONSE_CACHE_SIZE = int(os.getenv("STOCKROOM_RESPONSE_CACHE_SIZE", "256"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("STOCKROOM_RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/manifest+json",
+    "image/svg+xml",
+)
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    if not accept_encoding:
+        return None
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type == "text/event-stream":
+        return False
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+class CompressionStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._encodings: Dict[str, Dict[str, float]] = {}
+        self._skipped = {"small": 0, "uncompressible": 0, "identity": 0}
+
+    def record(self, encoding: str, bytes_in: int, bytes_out: int, cpu_seconds: float, streamed: bool = False) -> None:
+        with self._lock:
+            stats = self._encodings.setdefault(
+                encoding,
+                {"responses": 0, "streamed": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0},
+            )
+            if not streamed:
+                stats["responses"] += 1
+            stats["bytes_in"] += bytes_in
+            stats["bytes_out"] += bytes_out
+            stats["cpu_seconds"] += cpu_seconds
+
+    def record_stream(self, encoding: str) -> None:
+        with self._lock:
+            self._encodings.setdefault(
+                encoding,
+                {"responses": 0, "streamed": 0, "bytes_in": 0, "bytes_out": 0, "cpu_seconds": 0.0},
+            )["streamed"] += 1
+
+    def skip(self, reason: str) -> None:
+        with self._lock:
+            self._skipped[reason] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            encodings = {}
+            for encoding, values in self._encodings.items():
+                encodings[encoding] = {
+                    **values,
+                    "ratio": (values["bytes_in"] / values["bytes_out"]) if values["bytes_out"] else None,
+                }
+            return {
+                "min_size": COMPRESSION_MIN_SIZE,
+                "available": list(supported_encodings()),
+                "encodings": encodings,
+                "skipped": dict(self._skipped),
+            }
+
+
+compression_stats = CompressionStats()
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    started = time.thread_time()
+    if encoding == "br":
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        compressed = compressor.compress(body) + compressor.flush()
+    compression_stats.record(encoding, len(body), len(compressed), time.thread_time() - started)
+    return compressed
+
+
+class StreamCompressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes, final: bool) -> bytes:
+        started = time.thread_time()
+        if self.encoding == "br":
+            output = self._compressor.process(chunk)
+            output += self._compressor.finish() if final else self._compressor.flush()
+        else:
+            output = self._compressor.compress(chunk)
+            output += self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+        compression_stats.record(self.encoding, len(chunk), len(output), time.thread_time() - started, streamed=True)
+        return output
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            compression_stats.skip("identity")
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self._start: Optional[Message] = None
+        self._mode: Optional[str] = None
+        self._stream: Optional[StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self._mode is None:
+            await self._begin(message)
+            return
+        if self._mode == "stream":
+            final = not message.get("more_body", False)
+            message["body"] = self._stream.compress(message.get("body", b""), final)
+        await self._send(message)
+
+    async def _begin(self, message: Message) -> None:
+        start = self._start
+        headers = MutableHeaders(raw=start["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if (
+            start["status"] < 200
+            or start["status"] in (204, 304)
+            or "content-encoding" in headers
+            or not is_compressible(headers.get("content-type"))
+        ):
+            if "content-encoding" not in headers:
+                compression_stats.skip("uncompressible")
+            self._mode = "passthrough"
+            await self._send(start)
+            await self._send(message)
+            return
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body:
+            self._mode = "passthrough"
+            if len(body) < self.minimum_size:
+                compression_stats.skip("small")
+                await self._send(start)
+                await self._send(message)
+                return
+            if len(body) >= COMPRESSION_OFFLOAD_SIZE:
+                compressed = await anyio.to_thread.run_sync(compress_body, body, self.encoding)
+            else:
+                compressed = compress_body(body, self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(compressed))
+            message["body"] = compressed
+            await self._send(start)
+            await self._send(message)
+            return
+        self._mode = "stream"
+        self._stream = StreamCompressor(self.encoding)
+        compression_stats.record_stream(self.encoding)
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["content-length"]
+        message["body"] = self._stream.compress(body, False)
+        await self._send(start)
+        await self._send(message)
+
+
+CachedBody = Tuple[Optional[str], bytes]
+
+
+class ResponseCache:
+    def __init__(self, size: int = RESPONSE_CACHE_SIZE, max_bytes: int = RESPONSE_CACHE_MAX_BYTES):
+        self.size = max(0, size)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, CachedBody]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: str, etag: str, encoding: str) -> Tuple[Optional[CachedBody], Optional[bytes]]:
+        with self._lock:
+            variants = self._entries.get((key, etag))
+            if variants is None:
+                self._stats["misses"] += 1
+                return None, None
+            self._entries.move_to_end((key, etag))
+            identity = variants.get("identity")
+            body = variants.get(encoding)
+            self._stats["hits" if body is not None else "misses"] += 1
+            return body, identity[1] if identity is not None else None
+
+    def put(self, key: str, etag: str, encoding: str, body: CachedBody) -> None:
+        if self.size <= 0 or len(body[1]) > self.max_bytes:
+            return
+        with self._lock:
+            for stale in [entry for entry in self._entries if entry[0] == key and entry[1] != etag]:
+                self._drop(stale)
+            variants = self._entries.setdefault((key, etag), {})
+            if encoding in variants:
+                self._bytes -= len(variants[encoding][1])
+            variants[encoding] = body
+            self._bytes += len(body[1])
+            self._entries.move_to_end((key, etag))
+            while self._entries and (len(self._entries) > self.size or self._bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, entry: Tuple[str, str]) -> None:
+        variants = self._entries.pop(entry)
+        self._bytes -= sum(len(body) for _, body in variants.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": (self._stats["hits"] / lookups) if lookups else None,
+            }
+
+
+response_cache = ResponseCache()
+
+
+def cached_json_response(
+    request: Request,
+    headers: Dict[str, str],
+    build: Callable[[], Any],
+) -> Response:
+    key = f"{request.url.path}?{request.url.query}"
+    etag = headers["ETag"]
+    encoding = choose_encoding(request.headers.get("accept-encoding")) or "identity"
+    cached, raw = response_cache.get(key, etag, encoding)
+    if cached is None:
+        if raw is None:
+            raw = dumps_json(build())
+            response_cache.put(key, etag, "identity", (None, raw))
+        if encoding == "identity" or len(raw) < COMPRESSION_MIN_SIZE:
+            cached = (None, raw)
+        else:
+            cached = (encoding, compress_body(raw, encoding))
+        if encoding != "identity":
+            response_cache.put(key, etag, encoding, cached)
+    content_encoding, body = cached
+    response_headers = {**headers, "Vary": "Accept-Encoding"}
+    if content_encoding is not None:
+        response_headers["Content-Encoding"] = content_encoding
+    return Response(body, media_type="application/json", headers=response_headers)
+
+
+def get_compression_stats() -> Dict[str, Any]:
+    return {**compression_stats.stats(), "response_cache": response_cache.stats()}
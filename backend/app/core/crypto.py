@@ -1,3 +1,174 @@
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException
 from passlib.context import CryptContext
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+PASSWORD_WORKERS = int(os.getenv("STOCKROOM_PASSWORD_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_MAX_PENDING = int(os.getenv("STOCKROOM_PASSWORD_MAX_PENDING", str(max(1, PASSWORD_WORKERS) * 4)))
+PASSWORD_TIMEOUT_SECONDS = float(os.getenv("STOCKROOM_PASSWORD_TIMEOUT", "10"))
+PASSWORD_START_METHOD = os.getenv("STOCKROOM_PASSWORD_START_METHOD", "spawn")
+
+
+def _timed_hash(password: str) -> Tuple[str, float]:
+    started = time.perf_counter()
+    return pwd_context.hash(password), time.perf_counter() - started
+
+
+def _timed_verify(password: str, password_hash: str) -> Tuple[bool, float]:
+    started = time.perf_counter()
+    return pwd_context.verify(password, password_hash), time.perf_counter() - started
+
+
+def _warm() -> None:
+    pwd_context.identify("")
+
+
+class PasswordPool:
+    def __init__(
+        self,
+        workers: int = PASSWORD_WORKERS,
+        max_pending: int = PASSWORD_MAX_PENDING,
+        timeout: float = PASSWORD_TIMEOUT_SECONDS,
+    ):
+        self.workers = workers
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {
+            operation: {
+                "count": 0,
+                "rejected": 0,
+                "errors": 0,
+                "compute_seconds": 0.0,
+                "total_seconds": 0.0,
+                "max_seconds": 0.0,
+            }
+            for operation in ("hash", "verify")
+        }
+
+    def _ensure_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.workers > 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(PASSWORD_START_METHOD),
+            )
+        return self._executor
+
+    def _release(self, _future: Optional[Future] = None) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def start(self) -> None:
+        with self._lock:
+            executor = self._ensure_executor()
+        if executor is not None:
+            for _ in range(self.workers):
+                executor.submit(_warm)
+
+    def run(self, operation: str, fn: Callable[..., Tuple[Any, float]], *args: Any) -> Any:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._stats[operation]["rejected"] += 1
+                raise HTTPException(
+                    status_code=503,
+                    detail="Server is busy, try again shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+            executor = self._ensure_executor()
+        started = time.perf_counter()
+        try:
+            if executor is None:
+                try:
+                    result, compute_seconds = fn(*args)
+                finally:
+                    self._release()
+            else:
+                try:
+                    future: Future = executor.submit(fn, *args)
+                except Exception:
+                    self._release()
+                    raise
+                future.add_done_callback(self._release)
+                try:
+                    result, compute_seconds = future.result(timeout=self.timeout)
+                except FutureTimeoutError as exc:
+                    future.cancel()
+                    raise HTTPException(status_code=503, detail="Server is busy, try again shortly") from exc
+        except BrokenProcessPool:
+            with self._lock:
+                self._stats[operation]["errors"] += 1
+                if self._executor is executor:
+                    self._executor = None
+            raise
+        except Exception:
+            with self._lock:
+                self._stats[operation]["errors"] += 1
+            raise
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            stats = self._stats[operation]
+            stats["count"] += 1
+            stats["compute_seconds"] += compute_seconds
+            stats["total_seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            operations = {}
+            for operation, values in self._stats.items():
+                count = values["count"]
+                operations[operation] = {
+                    **values,
+                    "avg_compute_seconds": (values["compute_seconds"] / count) if count else None,
+                    "avg_total_seconds": (values["total_seconds"] / count) if count else None,
+                }
+            return {
+                "workers": self.workers,
+                "start_method": PASSWORD_START_METHOD,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "cpu_count": os.cpu_count(),
+                "operations": operations,
+            }
+
+
+password_pool = PasswordPool()
+
+
+def hash_password(password: str) -> str:
+    return password_pool.run("hash", _timed_hash, password)
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    return password_pool.run("verify", _timed_verify, password, password_hash)
+
+
+def start_password_pool() -> None:
+    password_pool.start()
+
+
+def shutdown_password_pool() -> None:
+    password_pool.shutdown()
+
+
+def get_password_pool_stats() -> Dict[str, Any]:
+    return password_pool.stats()
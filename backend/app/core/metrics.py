@@ -0,0 +1,183 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..database.pool import get_pool_stats
+from ..database.timing import current_sql_tally, start_sql_tally, stop_sql_tally
+from ..database.writer import get_write_queue_stats
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+
+RouteKey = Tuple[str, str]
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class RequestMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._in_flight: Dict[RouteKey, int] = {}
+        self._latency: Dict[RouteKey, Histogram] = {}
+        self._sql_latency: Dict[RouteKey, Histogram] = {}
+        self._sql_statements: Dict[RouteKey, int] = {}
+
+    def start(self, key: RouteKey) -> None:
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def finish(self, key: RouteKey, status: int, seconds: float, sql_statements: int, sql_seconds: float) -> None:
+        with self._lock:
+            self._in_flight[key] -= 1
+            request_key = (key[0], key[1], str(status))
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+            self._latency.setdefault(key, Histogram()).observe(seconds)
+            self._sql_latency.setdefault(key, Histogram()).observe(sql_seconds)
+            self._sql_statements[key] = self._sql_statements.get(key, 0) + sql_statements
+
+    def render(self) -> List[str]:
+        with self._lock:
+            lines = [
+                "# HELP stockroom_http_requests_total HTTP requests by route and status code.",
+                "# TYPE stockroom_http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self._requests.items()):
+                lines.append(f"stockroom_http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+            lines += [
+                "# HELP stockroom_http_requests_in_flight HTTP requests currently being served.",
+                "# TYPE stockroom_http_requests_in_flight gauge",
+            ]
+            for (method, route), count in sorted(self._in_flight.items()):
+                lines.append(f"stockroom_http_requests_in_flight{_labels(method=method, route=route)} {count}")
+            lines += _render_histograms(
+                "stockroom_http_request_duration_seconds",
+                "HTTP request latency by route.",
+                self._latency,
+            )
+            lines += _render_histograms(
+                "stockroom_sql_request_duration_seconds",
+                "Time spent in SQLite statements per HTTP request.",
+                self._sql_latency,
+            )
+            lines += [
+                "# HELP stockroom_sql_statements_total SQLite statements executed while serving requests.",
+                "# TYPE stockroom_sql_statements_total counter",
+            ]
+            for (method, route), count in sorted(self._sql_statements.items()):
+                lines.append(f"stockroom_sql_statements_total{_labels(method=method, route=route)} {count}")
+            return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _render_histograms(name: str, help_text: str, histograms: Dict[RouteKey, Histogram]) -> List[str]:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for (method, route), histogram in sorted(histograms.items()):
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS, histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=repr(bound))} {cumulative}")
+        lines.append(f"{name}_bucket{_labels(method=method, route=route, le='+Inf')} {histogram.count}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {histogram.total}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {histogram.count}")
+    return lines
+
+
+request_metrics = RequestMetrics()
+
+
+def route_template(scope: Scope) -> str:
+    app = scope.get("app")
+    router = getattr(app, "router", None)
+    partial = None
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+        if match == Match.PARTIAL and partial is None:
+            partial = getattr(route, "path", None)
+    return partial or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        key = (scope["method"], route_template(scope))
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = start_sql_tally(f"{key[0]} {key[1]}")
+        request_metrics.start(key)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            tally = current_sql_tally()
+            stop_sql_tally(token)
+            request_metrics.finish(key, status, time.perf_counter() - started, tally.statements, tally.seconds)
+
+
+def _render_stats(
+    prefix: str,
+    help_text: str,
+    stats: Optional[Dict[str, Any]],
+    counters: Tuple[str, ...],
+) -> List[str]:
+    lines = []
+    for field, value in (stats or {}).items():
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            continue
+        kind = "counter" if field in counters else "gauge"
+        name = f"{prefix}_{field}_total" if kind == "counter" else f"{prefix}_{field}"
+        lines += [f"# HELP {name} {help_text} ({field}).", f"# TYPE {name} {kind}", f"{name} {value}"]
+    return lines
+
+
+def render_metrics() -> str:
+    lines = request_metrics.render()
+    lines += _render_stats(
+        "stockroom_db_pool",
+        "SQLite connection pool",
+        get_pool_stats(),
+        ("hits", "misses", "waits", "wait_seconds", "timeouts", "discarded"),
+    )
+    lines += _render_stats(
+        "stockroom_db_writer",
+        "SQLite write queue",
+        get_write_queue_stats(),
+        ("jobs", "failed_jobs", "batches", "commit_errors", "writer_errors"),
+    )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,80 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("STOCKROOM_PRINCIPAL_CACHE_TTL", "30"))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("STOCKROOM_PRINCIPAL_CACHE_SIZE", "1024"))
+
+
+class PrincipalCache:
+    def __init__(self, ttl: float = PRINCIPAL_CACHE_TTL_SECONDS, size: int = PRINCIPAL_CACHE_SIZE):
+        self.ttl = ttl
+        self.size = max(1, size)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "invalidations": 0}
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Any, generation: int) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl,
+                "hit_rate": (self._stats["hits"] / lookups) if lookups else None,
+            }
+
+
+principal_cache = PrincipalCache()
+
+
+def invalidate_principal(username: str) -> None:
+    principal_cache.invalidate(username.strip().lower())
+
+
+def get_principal_cache_stats() -> Dict[str, Any]:
+    return principal_cache.stats()
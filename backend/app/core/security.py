@@ -1,27 +1,31 @@
 import os
 from datetime import datetime, timedelta
+from typing import Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 
-from .crypto import pwd_context
-from ..database.db import get_db
+from .crypto import verify_password
+from .principal_cache import principal_cache
+from .stream_tickets import stream_tickets
+from ..database.db import request_connection
 
 SECRET_KEY = os.getenv("SECRET_KEY", "change-me-in-production")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_MINUTES = 60 * 24
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/token", auto_error=False)
 
 
-def authenticate_user(conn, username: str, password: str):
+def authenticate_user(username: str, password: str):
     normalized = username.strip().lower()
-    cur = conn.execute("SELECT * FROM users WHERE lower(username) = ?", (normalized,))
-    row = cur.fetchone()
+    with request_connection() as conn:
+        row = conn.execute("SELECT * FROM users WHERE lower(username) = ?", (normalized,)).fetchone()
     if not row:
         return None
-    if not pwd_context.verify(password, row["password_hash"]):
+    if not verify_password(password, row["password_hash"]):
         return None
     return row
 
@@ -33,15 +37,30 @@ def create_access_token(data: dict, expires_minutes: int = ACCESS_TOKEN_MINUTES)
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    conn=Depends(get_db),
-):
-    credentials_error = HTTPException(
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def load_principal(username: str):
+    normalized = username.strip().lower()
+    row = principal_cache.get(normalized)
+    if row is not None:
+        return row
+    generation = principal_cache.generation()
+    with request_connection() as conn:
+        row = conn.execute("SELECT * FROM users WHERE lower(username) = ?", (normalized,)).fetchone()
+    if not row:
+        raise credentials_exception()
+    principal_cache.put(normalized, row, generation)
+    return row
+
+
+def get_current_user(token: str = Depends(oauth2_scheme)):
+    credentials_error = credentials_exception()
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username = payload.get("sub")
@@ -49,12 +68,19 @@ def get_current_user(
             raise credentials_error
     except JWTError as exc:
         raise credentials_error from exc
-    normalized = username.strip().lower()
-    cur = conn.execute("SELECT * FROM users WHERE lower(username) = ?", (normalized,))
-    row = cur.fetchone()
-    if not row:
-        raise credentials_error
-    return row
+    return load_principal(username)
+
+
+def get_stream_user(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    ticket: Optional[str] = Query(None),
+):
+    if token:
+        return get_current_user(token)
+    username = stream_tickets.redeem(ticket) if ticket else None
+    if username is None:
+        raise credentials_exception()
+    return load_principal(username)
 
 
 def require_admin(current_user=Depends(get_current_user)):
@@ -0,0 +1,59 @@
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+STREAM_TICKET_TTL_SECONDS = float(os.getenv("STOCKROOM_STREAM_TICKET_TTL", "30"))
+STREAM_TICKET_LIMIT = int(os.getenv("STOCKROOM_STREAM_TICKET_LIMIT", "4096"))
+
+
+class StreamTicketStore:
+    def __init__(self, ttl: float = STREAM_TICKET_TTL_SECONDS, size: int = STREAM_TICKET_LIMIT):
+        self.ttl = ttl
+        self.size = max(1, size)
+        self._tickets: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"issued": 0, "redeemed": 0, "rejected": 0, "expired": 0, "evictions": 0}
+
+    def issue(self, username: str) -> str:
+        ticket = secrets.token_urlsafe(32)
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            self._tickets[ticket] = (now + self.ttl, username)
+            while len(self._tickets) > self.size:
+                self._tickets.popitem(last=False)
+                self._stats["evictions"] += 1
+            self._stats["issued"] += 1
+        return ticket
+
+    def redeem(self, ticket: str) -> Optional[str]:
+        with self._lock:
+            entry = self._tickets.pop(ticket, None)
+            if entry is None:
+                self._stats["rejected"] += 1
+                return None
+            expires_at, username = entry
+            if expires_at <= time.monotonic():
+                self._stats["expired"] += 1
+                self._stats["rejected"] += 1
+                return None
+            self._stats["redeemed"] += 1
+            return username
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "outstanding": len(self._tickets), "ttl_seconds": self.ttl}
+
+    def _prune(self, now: float) -> None:
+        while self._tickets:
+            ticket, (expires_at, _) = next(iter(self._tickets.items()))
+            if expires_at > now:
+                return
+            del self._tickets[ticket]
+            self._stats["expired"] += 1
+
+
+stream_tickets = StreamTicketStore()
@@ -0,0 +1,98 @@
+import argparse
+import sys
+from contextlib import nullcontext
+
+from .archive import (
+    AUDIT_ARCHIVE_CHUNK_SIZE,
+    AUDIT_RETENTION_DAYS,
+    archive_audit_events,
+    audit_archive_cutoff,
+    audit_archive_path,
+    get_audit_archive_stats,
+)
+from .db import DB_PATH, init_db
+from .migrations import MIGRATIONS, get_applied_migrations, get_pending_migrations
+from .pool import connect
+from .rollup import rebuild_item_rollup
+
+
+def show_status() -> int:
+    conn = connect(DB_PATH)
+    try:
+        applied = get_applied_migrations(conn)
+        pending = get_pending_migrations(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    print(f"database: {DB_PATH}")
+    for version, name, _ in MIGRATIONS:
+        state = f"applied {applied[version]}" if version in applied else "pending"
+        print(f"{version:>4}  {name:<32} {state}")
+    print(f"{len(pending)} pending migration(s)")
+    return 1 if pending else 0
+
+
+def rebuild_rollup() -> int:
+    init_db()
+    conn = connect(DB_PATH)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        groups = rebuild_item_rollup(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    print(f"rebuilt item rollup: {groups} group(s)")
+    return 0
+
+
+def archive_audit(days: int, chunk_size: int, vacuum: bool) -> int:
+    init_db()
+    conn = connect(DB_PATH)
+
+    def run_write(job):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = job(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return result
+
+    try:
+        result = archive_audit_events(lambda: nullcontext(conn), run_write, audit_archive_cutoff(days), chunk_size)
+        if vacuum and result["archived"]:
+            conn.execute("VACUUM main")
+        stats = get_audit_archive_stats(conn)
+    finally:
+        conn.close()
+    print(f"archive: {audit_archive_path(DB_PATH)}")
+    print(f"archived {result['archived']} audit event(s) older than {result['cutoff']} in {result['chunks']} chunk(s)")
+    for name in ("hot", "archive"):
+        print(f"{name:>8}: {stats[name]['events']} event(s), {stats[name]['file_bytes']} bytes")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.database")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="list applied and pending schema migrations")
+    commands.add_parser("migrate", help="create the schema and apply pending migrations")
+    commands.add_parser("rebuild-rollup", help="recompute the item rollup table from the items table")
+    archive = commands.add_parser("archive-audit", help="move old audit events into the archive database")
+    archive.add_argument("--days", type=int, default=AUDIT_RETENTION_DAYS, help="keep this many days of events hot")
+    archive.add_argument("--chunk-size", type=int, default=AUDIT_ARCHIVE_CHUNK_SIZE, help="events moved per transaction")
+    archive.add_argument("--vacuum", action="store_true", help="shrink the main database file afterwards")
+    args = parser.parse_args()
+    if args.command == "status":
+        return show_status()
+    if args.command == "rebuild-rollup":
+        return rebuild_rollup()
+    if args.command == "archive-audit":
+        return archive_audit(args.days, args.chunk_size, args.vacuum)
+    init_db()
+    return show_status()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, ContextManager, Dict, Optional, Tuple
+
+AUDIT_ARCHIVE_SCHEMA = "archive"
+AUDIT_SCHEMAS = ("main", AUDIT_ARCHIVE_SCHEMA)
+AUDIT_RETENTION_DAYS = int(os.getenv("STOCKROOM_AUDIT_RETENTION_DAYS", "365"))
+AUDIT_ARCHIVE_CHUNK_SIZE = int(os.getenv("STOCKROOM_AUDIT_ARCHIVE_CHUNK", "5000"))
+
+AUDIT_EVENT_COLUMNS = "id, item_id, actor, timestamp, action, changes, note"
+AUDIT_CHANGE_COLUMNS = "event_id, item_id, field, old_value, new_value, timestamp"
+
+WriteRunner = Callable[[Callable[[sqlite3.Connection], Any]], Any]
+ConnectionFactory = Callable[[], ContextManager[sqlite3.Connection]]
+
+_archive_lock = threading.Lock()
+
+
+def audit_archive_path(db_path: str) -> str:
+    configured = os.getenv("STOCKROOM_AUDIT_ARCHIVE_PATH")
+    if configured:
+        return configured
+    root, _ = os.path.splitext(db_path)
+    return f"{root}-archive.db"
+
+
+def attach_audit_archive(conn: sqlite3.Connection, db_path: str) -> None:
+    conn.execute(f"ATTACH DATABASE ? AS {AUDIT_ARCHIVE_SCHEMA}", (audit_archive_path(db_path),))
+
+
+def ensure_audit_archive(conn: sqlite3.Connection) -> None:
+    conn.execute(f"PRAGMA {AUDIT_ARCHIVE_SCHEMA}.journal_mode = WAL")
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {AUDIT_ARCHIVE_SCHEMA}.audit_events (
+            id INTEGER PRIMARY KEY,
+            item_id INTEGER NOT NULL,
+            actor TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            action TEXT NOT NULL,
+            changes TEXT,
+            note TEXT
+        )
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {AUDIT_ARCHIVE_SCHEMA}.audit_changes (
+            event_id INTEGER NOT NULL,
+            item_id INTEGER NOT NULL,
+            field TEXT NOT NULL,
+            old_value COLLATE NOCASE,
+            new_value COLLATE NOCASE,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY (event_id, field)
+        ) WITHOUT ROWID
+        """
+    )
+    for name, columns in (
+        ("idx_audit_item_event", "audit_events(item_id, id)"),
+        ("idx_audit_timestamp", "audit_events(timestamp, id)"),
+        ("idx_audit_changes_field_new", "audit_changes(field, new_value, event_id)"),
+        ("idx_audit_changes_field_old", "audit_changes(field, old_value, event_id)"),
+        ("idx_audit_changes_field_time", "audit_changes(field, timestamp, event_id)"),
+        ("idx_audit_changes_item", "audit_changes(item_id, field, event_id)"),
+    ):
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {AUDIT_ARCHIVE_SCHEMA}.{name} ON {columns}")
+
+
+def audit_archive_cutoff(retention_days: int = AUDIT_RETENTION_DAYS) -> str:
+    return (datetime.utcnow() - timedelta(days=retention_days)).isoformat()
+
+
+def audit_archive_boundary(conn: sqlite3.Connection, cutoff: str) -> int:
+    row = conn.execute("SELECT MIN(id) FROM main.audit_events WHERE timestamp >= ?", (cutoff,)).fetchone()
+    if row[0] is not None:
+        return row[0]
+    row = conn.execute("SELECT MAX(id) FROM main.audit_events").fetchone()
+    return (row[0] or 0) + 1
+
+
+def copy_audit_chunk(conn: sqlite3.Connection, boundary: int, chunk_size: int) -> Optional[Tuple[int, int, int]]:
+    conn.execute("BEGIN")
+    try:
+        ids = conn.execute(
+            "SELECT id FROM main.audit_events WHERE id < ? ORDER BY id ASC LIMIT ?",
+            (boundary, chunk_size),
+        ).fetchall()
+        if not ids:
+            conn.rollback()
+            return None
+        first_id, last_id = ids[0][0], ids[-1][0]
+        copied = conn.execute(
+            f"""
+            INSERT OR IGNORE INTO {AUDIT_ARCHIVE_SCHEMA}.audit_events ({AUDIT_EVENT_COLUMNS})
+            SELECT {AUDIT_EVENT_COLUMNS} FROM main.audit_events WHERE id BETWEEN ? AND ?
+            """,
+            (first_id, last_id),
+        ).rowcount
+        conn.execute(
+            f"""
+            INSERT OR IGNORE INTO {AUDIT_ARCHIVE_SCHEMA}.audit_changes ({AUDIT_CHANGE_COLUMNS})
+            SELECT {AUDIT_CHANGE_COLUMNS} FROM main.audit_changes WHERE event_id BETWEEN ? AND ?
+            """,
+            (first_id, last_id),
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return first_id, last_id, copied
+
+
+def delete_archived_audit_chunk(conn: sqlite3.Connection, first_id: int, last_id: int) -> int:
+    return conn.execute(
+        f"""
+        DELETE FROM main.audit_events
+        WHERE id BETWEEN ? AND ?
+          AND id IN (SELECT id FROM {AUDIT_ARCHIVE_SCHEMA}.audit_events WHERE id BETWEEN ? AND ?)
+        """,
+        (first_id, last_id, first_id, last_id),
+    ).rowcount
+
+
+def archive_audit_events(
+    connection: ConnectionFactory,
+    run_write: WriteRunner,
+    cutoff: str,
+    chunk_size: int = AUDIT_ARCHIVE_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    if not _archive_lock.acquire(blocking=False):
+        raise RuntimeError("Audit archival is already running")
+    try:
+        with connection() as conn:
+            boundary = audit_archive_boundary(conn, cutoff)
+        archived = chunks = 0
+        while True:
+            with connection() as conn:
+                chunk = copy_audit_chunk(conn, boundary, max(1, chunk_size))
+            if chunk is None:
+                break
+            first_id, last_id, _ = chunk
+            archived += run_write(lambda write_conn: delete_archived_audit_chunk(write_conn, first_id, last_id))
+            chunks += 1
+        return {"cutoff": cutoff, "archived": archived, "chunks": chunks}
+    finally:
+        _archive_lock.release()
+
+
+def get_audit_archive_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    stats: Dict[str, Any] = {}
+    for schema in AUDIT_SCHEMAS:
+        row = conn.execute(
+            f"SELECT COUNT(*), MIN(timestamp), MAX(timestamp), MAX(id) FROM {schema}.audit_events"
+        ).fetchone()
+        page_count = conn.execute(f"PRAGMA {schema}.page_count").fetchone()[0]
+        page_size = conn.execute(f"PRAGMA {schema}.page_size").fetchone()[0]
+        freelist = conn.execute(f"PRAGMA {schema}.freelist_count").fetchone()[0]
+        stats["hot" if schema == "main" else "archive"] = {
+            "events": row[0],
+            "oldest": row[1],
+            "newest": row[2],
+            "last_event_id": row[3],
+            "file_bytes": page_count * page_size,
+            "free_bytes": freelist * page_size,
+        }
+    stats["retention_days"] = AUDIT_RETENTION_DAYS
+    return stats
@@ -0,0 +1,29 @@
+import secrets
+import sqlite3
+
+NEXT_CHANGE_SEQ_SQL = "(SELECT version + 1 FROM data_version WHERE id = 1)"
+
+
+def ensure_data_version(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS data_version (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            epoch TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        "INSERT OR IGNORE INTO data_version (id, epoch, version) VALUES (1, ?, 0)",
+        (secrets.token_hex(4),),
+    )
+
+
+def bump_data_version(conn: sqlite3.Connection) -> None:
+    conn.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+
+
+def get_data_version(conn: sqlite3.Connection) -> str:
+    row = conn.execute("SELECT epoch, version FROM data_version WHERE id = 1").fetchone()
+    return f"{row['epoch']}-{row['version']}"
@@ -1,26 +1,64 @@
 import os
-import sqlite3
+from contextlib import contextmanager
 
+from fastapi import HTTPException
+
+from .archive import ensure_audit_archive
+from .data_version import bump_data_version
 from .migrations import ensure_migrations
+from .pool import PoolTimeoutError, close_pool, connect, get_pool
 from .seed import seed_items, seed_owner
+from .writer import WriteTimeoutError, close_write_queue, get_write_queue
 
-DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "app.db")
+DB_PATH = os.getenv(
+    "STOCKROOM_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "app.db"),
+)
 
 
 def get_db():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    with request_connection() as conn:
+        yield conn
+
+
+@contextmanager
+def request_connection():
+    pool = get_pool(DB_PATH)
+    try:
+        conn = pool.acquire()
+    except PoolTimeoutError as exc:
+        raise HTTPException(status_code=503, detail="Database is busy, try again") from exc
     try:
         yield conn
     finally:
-        conn.close()
+        pool.release(conn)
+
+
+@contextmanager
+def db_connection():
+    pool = get_pool(DB_PATH)
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+def run_write(job):
+    try:
+        return get_write_queue(DB_PATH).submit(job)
+    except WriteTimeoutError as exc:
+        raise HTTPException(status_code=503, detail="Database is busy, try again") from exc
+
+
+def close_db():
+    close_write_queue()
+    close_pool()
 
 
 def init_db():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    conn = connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode = WAL")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS users (
@@ -64,9 +102,6 @@ def init_db():
         )
         """
     )
-    conn.execute(
-        "CREATE INDEX IF NOT EXISTS idx_audit_item_id ON audit_events(item_id)"
-    )
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS user_audit_logs (
@@ -81,12 +116,11 @@ def init_db():
         )
         """
     )
-    conn.execute(
-        "CREATE INDEX IF NOT EXISTS idx_user_audit_timestamp ON user_audit_logs(timestamp DESC)"
-    )
 
     ensure_migrations(conn)
     conn.commit()
+    ensure_audit_archive(conn)
+    conn.commit()
 
     cur = conn.execute("SELECT COUNT(*) AS count FROM users")
     row = cur.fetchone()
@@ -100,4 +134,6 @@ def init_db():
         seed_items(conn)
         conn.commit()
 
+    bump_data_version(conn)
+    conn.commit()
     conn.close()
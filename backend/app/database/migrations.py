@@ -1,8 +1,10 @@
 import sqlite3
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Tuple
 
-from ..common import cable_signature, normalize_cable_ends, normalize_cable_length
+from ..common import cable_signature, normalize_cable_ends, normalize_cable_length, now_iso
 from ..core.constants import STATUS_IN_STOCK, STATUS_RETIRED
+from .data_version import NEXT_CHANGE_SEQ_SQL, ensure_data_version
+from .rollup import rebuild_item_rollup
 
 
 def _canonicalize_and_merge_cable_duplicates(conn: sqlite3.Connection) -> None:
@@ -26,10 +28,22 @@ def _canonicalize_and_merge_cable_duplicates(conn: sqlite3.Connection) -> None:
         if len(grouped) == 1:
             row = grouped[0]
             quantity = int(row["quantity"] or 0)
+            if (
+                row["category"] == "Cable"
+                and row["make"] == canonical_make
+                and row["model"] == canonical_model
+                and row["service_tag"] == "N/A"
+                and quantity >= 0
+                and row["assigned_user"] is None
+                and row["cable_ends_key"] == normalized_make
+                and row["cable_length_key"] == normalized_model
+            ):
+                continue
             conn.execute(
                 """
                 UPDATE items
-                SET category = ?, make = ?, model = ?, service_tag = ?, quantity = ?, assigned_user = ?, updated_at = ?
+                SET category = ?, make = ?, model = ?, service_tag = ?, quantity = ?, assigned_user = ?, updated_at = ?,
+                    cable_ends_key = ?, cable_length_key = ?
                 WHERE id = ?
                 """,
                 (
@@ -40,6 +54,8 @@ def _canonicalize_and_merge_cable_duplicates(conn: sqlite3.Connection) -> None:
                     max(0, quantity),
                     None,
                     row["updated_at"] or row["created_at"],
+                    normalized_make,
+                    normalized_model,
                     row["id"],
                 ),
             )
@@ -57,7 +73,7 @@ def _canonicalize_and_merge_cable_duplicates(conn: sqlite3.Connection) -> None:
             """
             UPDATE items
             SET category = ?, make = ?, model = ?, service_tag = ?, quantity = ?, row = ?, note = ?,
-                status = ?, assigned_user = ?, updated_at = ?
+                status = ?, assigned_user = ?, updated_at = ?, cable_ends_key = ?, cable_length_key = ?
             WHERE id = ?
             """,
             (
@@ -71,10 +87,13 @@ def _canonicalize_and_merge_cable_duplicates(conn: sqlite3.Connection) -> None:
                 next_status,
                 None,
                 merged_updated_at,
+                normalized_make,
+                normalized_model,
                 keep_id,
             ),
         )
 
+        _create_item_tombstones(conn)
         for duplicate in grouped:
             duplicate_id = int(duplicate["id"])
             if duplicate_id == keep_id:
@@ -84,25 +103,95 @@ def _canonicalize_and_merge_cable_duplicates(conn: sqlite3.Connection) -> None:
                 (keep_id, duplicate_id),
             )
             conn.execute("DELETE FROM items WHERE id = ?", (duplicate_id,))
+            conn.execute(
+                """
+                INSERT INTO item_tombstones (item_id, merged_into, deleted_at, change_seq)
+                VALUES (?, ?, ?, 0)
+                ON CONFLICT(item_id) DO UPDATE SET merged_into = excluded.merged_into
+                """,
+                (duplicate_id, keep_id, now_iso()),
+            )
 
     conn.execute("DROP INDEX IF EXISTS idx_items_cable_unique_signature")
     conn.execute(
         """
         CREATE UNIQUE INDEX IF NOT EXISTS idx_items_cable_unique_signature
-        ON items(lower(make), lower(model))
-        WHERE lower(category) = 'cable'
+        ON items(cable_ends_key, cable_length_key)
+        WHERE cable_ends_key IS NOT NULL
+        """
+    )
+
+
+def _ensure_item_list_indexes(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_items_created ON items(created_at, id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_items_updated ON items(COALESCE(updated_at, created_at), id)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_items_row ON items(COALESCE(row, ''), id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_items_status ON items(status)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_items_category ON items(category, status)")
+
+
+ITEM_SEARCH_COLUMNS = ("category", "make", "model", "service_tag", "row", "assigned_user")
+
+
+def _ensure_item_search_index(conn: sqlite3.Connection) -> None:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'items_fts'"
+    ).fetchone()
+    columns = ", ".join(ITEM_SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in ITEM_SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in ITEM_SEARCH_COLUMNS)
+    conn.execute(
+        f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+            {columns},
+            content = 'items',
+            content_rowid = 'id',
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS items_fts_after_insert AFTER INSERT ON items BEGIN
+            INSERT INTO items_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END
         """
     )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS items_fts_after_delete AFTER DELETE ON items BEGIN
+            INSERT INTO items_fts(items_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS items_fts_after_update AFTER UPDATE OF {columns} ON items BEGIN
+            INSERT INTO items_fts(items_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});
+            INSERT INTO items_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+        """
+    )
+    if not exists:
+        conn.execute("INSERT INTO items_fts(items_fts) VALUES ('rebuild')")
 
 
-def ensure_migrations(conn: sqlite3.Connection) -> None:
+def _add_user_roles(conn: sqlite3.Connection) -> None:
     cols = [r["name"] for r in conn.execute("PRAGMA table_info(users)").fetchall()]
     if "role" not in cols:
         conn.execute("ALTER TABLE users ADD COLUMN role TEXT NOT NULL DEFAULT 'user'")
-
     conn.execute("UPDATE users SET role = 'owner' WHERE username = 'owner'")
     conn.execute("UPDATE users SET role = 'user' WHERE role IS NULL OR role = ''")
 
+
+def _ensure_user_lookup_index(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_users_lower_username ON users(lower(username))")
+
+
+def _add_item_detail_columns(conn: sqlite3.Connection) -> None:
     item_cols = [r["name"] for r in conn.execute("PRAGMA table_info(items)").fetchall()]
     if "updated_at" not in item_cols:
         conn.execute("ALTER TABLE items ADD COLUMN updated_at TEXT")
@@ -114,4 +203,220 @@ def ensure_migrations(conn: sqlite3.Connection) -> None:
     if "quantity" not in item_cols:
         conn.execute("ALTER TABLE items ADD COLUMN quantity INTEGER NOT NULL DEFAULT 1")
     conn.execute("UPDATE items SET quantity = 1 WHERE quantity IS NULL")
-    _canonicalize_and_merge_cable_duplicates(conn)
+
+
+def _add_cable_signature_columns(conn: sqlite3.Connection) -> None:
+    item_cols = [r["name"] for r in conn.execute("PRAGMA table_info(items)").fetchall()]
+    if "cable_ends_key" not in item_cols:
+        conn.execute("ALTER TABLE items ADD COLUMN cable_ends_key TEXT")
+    if "cable_length_key" not in item_cols:
+        conn.execute("ALTER TABLE items ADD COLUMN cable_length_key TEXT")
+
+
+def _ensure_audit_timestamp_index(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_events(timestamp, id)")
+
+
+def _ensure_history_indexes(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_items_lower_category ON items(lower(category))")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_item_event ON audit_events(item_id, id)")
+    conn.execute("DROP INDEX IF EXISTS idx_audit_item_id")
+
+
+def _create_item_tombstones(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS item_tombstones (
+            item_id INTEGER PRIMARY KEY,
+            merged_into INTEGER,
+            deleted_at TEXT NOT NULL,
+            change_seq INTEGER NOT NULL
+        )
+        """
+    )
+
+
+def _ensure_item_change_seq_triggers(conn: sqlite3.Connection) -> None:
+    conn.execute("DROP TRIGGER IF EXISTS items_change_seq_after_insert")
+    conn.execute("DROP TRIGGER IF EXISTS items_change_seq_after_update")
+    conn.execute(
+        f"""
+        CREATE TRIGGER items_change_seq_after_insert AFTER INSERT ON items
+        WHEN new.change_seq = 0 BEGIN
+            UPDATE items SET change_seq = {NEXT_CHANGE_SEQ_SQL} WHERE id = new.id;
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER items_change_seq_after_update AFTER UPDATE ON items
+        WHEN new.change_seq IS old.change_seq BEGIN
+            UPDATE items SET change_seq = {NEXT_CHANGE_SEQ_SQL} WHERE id = new.id;
+        END
+        """
+    )
+
+
+def _ensure_item_change_tracking(conn: sqlite3.Connection) -> None:
+    item_cols = [r["name"] for r in conn.execute("PRAGMA table_info(items)").fetchall()]
+    if "change_seq" not in item_cols:
+        conn.execute("ALTER TABLE items ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0")
+        conn.execute("UPDATE items SET change_seq = (SELECT version FROM data_version WHERE id = 1)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_items_change_seq ON items(change_seq, id)")
+    _create_item_tombstones(conn)
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_item_tombstones_change_seq ON item_tombstones(change_seq, item_id)"
+    )
+    _ensure_item_change_seq_triggers(conn)
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS items_tombstone_after_delete AFTER DELETE ON items BEGIN
+            INSERT OR REPLACE INTO item_tombstones (item_id, merged_into, deleted_at, change_seq)
+            VALUES (old.id, NULL, strftime('%Y-%m-%dT%H:%M:%f', 'now'), {NEXT_CHANGE_SEQ_SQL});
+        END
+        """
+    )
+
+
+AUDIT_CHANGES_SELECT = """
+    SELECT {event}.id, {event}.item_id, changed.key,
+           json_extract(changed.value, '$.old'), json_extract(changed.value, '$.new'), {event}.timestamp
+    FROM {source}json_each(CASE WHEN json_valid({event}.changes) THEN {event}.changes END) AS changed
+    WHERE json_type(changed.value) = 'object'
+"""
+
+
+def _ensure_audit_change_index(conn: sqlite3.Connection) -> None:
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'audit_changes'"
+    ).fetchone()
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audit_changes (
+            event_id INTEGER NOT NULL,
+            item_id INTEGER NOT NULL,
+            field TEXT NOT NULL,
+            old_value COLLATE NOCASE,
+            new_value COLLATE NOCASE,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY (event_id, field)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audit_changes_field_new ON audit_changes(field, new_value, event_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audit_changes_field_old ON audit_changes(field, old_value, event_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audit_changes_field_time ON audit_changes(field, timestamp, event_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audit_changes_item ON audit_changes(item_id, field, event_id)"
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS audit_changes_after_insert
+        AFTER INSERT ON audit_events WHEN new.changes IS NOT NULL BEGIN
+            INSERT OR REPLACE INTO audit_changes (event_id, item_id, field, old_value, new_value, timestamp)
+            {AUDIT_CHANGES_SELECT.format(event="new", source="")};
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS audit_changes_after_item_update
+        AFTER UPDATE OF item_id ON audit_events BEGIN
+            UPDATE audit_changes SET item_id = new.item_id WHERE event_id = new.id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS audit_changes_after_delete AFTER DELETE ON audit_events BEGIN
+            DELETE FROM audit_changes WHERE event_id = old.id;
+        END
+        """
+    )
+    if not exists:
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO audit_changes (event_id, item_id, field, old_value, new_value, timestamp)
+            {AUDIT_CHANGES_SELECT.format(event="audit_events", source="audit_events, ")}
+            """
+        )
+
+
+def _ensure_user_audit_indexes(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_user_audit_time ON user_audit_logs(timestamp, id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_audit_actor ON user_audit_logs(lower(actor), timestamp, id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_audit_target ON user_audit_logs(lower(target_user), timestamp, id)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_user_audit_action ON user_audit_logs(action, timestamp, id)")
+    conn.execute("DROP INDEX IF EXISTS idx_user_audit_timestamp")
+
+
+Migration = Tuple[int, str, Callable[[sqlite3.Connection], None]]
+
+MIGRATIONS: List[Migration] = [
+    (1, "add_user_roles", _add_user_roles),
+    (2, "user_lookup_index", _ensure_user_lookup_index),
+    (3, "item_detail_columns", _add_item_detail_columns),
+    (4, "cable_signature_columns", _add_cable_signature_columns),
+    (5, "merge_cable_duplicates", _canonicalize_and_merge_cable_duplicates),
+    (6, "item_list_indexes", _ensure_item_list_indexes),
+    (7, "item_search_index", _ensure_item_search_index),
+    (8, "audit_timestamp_index", _ensure_audit_timestamp_index),
+    (9, "item_history_indexes", _ensure_history_indexes),
+    (10, "item_rollup", rebuild_item_rollup),
+    (11, "data_version", ensure_data_version),
+    (12, "item_change_tracking", _ensure_item_change_tracking),
+    (13, "audit_change_index", _ensure_audit_change_index),
+    (14, "user_audit_indexes", _ensure_user_audit_indexes),
+    (15, "item_change_seq_triggers", _ensure_item_change_seq_triggers),
+]
+
+
+def _ensure_migration_ledger(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
+
+
+def get_applied_migrations(conn: sqlite3.Connection) -> Dict[int, str]:
+    _ensure_migration_ledger(conn)
+    rows = conn.execute("SELECT version, applied_at FROM schema_migrations").fetchall()
+    return {int(row["version"]): row["applied_at"] for row in rows}
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    _ensure_migration_ledger(conn)
+    row = conn.execute("SELECT MAX(version) FROM schema_migrations").fetchone()
+    return int(row[0] or 0)
+
+
+def get_pending_migrations(conn: sqlite3.Connection) -> List[Migration]:
+    current = get_schema_version(conn)
+    return [migration for migration in MIGRATIONS if migration[0] > current]
+
+
+def ensure_migrations(conn: sqlite3.Connection) -> List[Migration]:
+    pending = get_pending_migrations(conn)
+    for version, name, step in pending:
+        step(conn)
+        conn.execute(
+            "INSERT INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
+            (version, name, now_iso()),
+        )
+        conn.commit()
+    return pending
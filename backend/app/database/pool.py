@@ -0,0 +1,154 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .archive import attach_audit_archive
+from .timing import TimedConnection
+
+POOL_SIZE = int(os.getenv("STOCKROOM_DB_POOL_SIZE", "8"))
+POOL_TIMEOUT_SECONDS = float(os.getenv("STOCKROOM_DB_POOL_TIMEOUT", "10"))
+BUSY_TIMEOUT_MS = int(os.getenv("STOCKROOM_DB_BUSY_TIMEOUT_MS", "5000"))
+CACHE_SIZE_KIB = int(os.getenv("STOCKROOM_DB_CACHE_SIZE_KIB", "65536"))
+MMAP_SIZE_BYTES = int(os.getenv("STOCKROOM_DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+STATEMENT_CACHE_SIZE = int(os.getenv("STOCKROOM_DB_STATEMENT_CACHE", "256"))
+
+
+class PoolTimeoutError(sqlite3.OperationalError):
+    pass
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        timeout=BUSY_TIMEOUT_MS / 1000,
+        cached_statements=STATEMENT_CACHE_SIZE,
+        factory=TimedConnection,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    attach_audit_archive(conn, db_path)
+    return conn
+
+
+class ConnectionPool:
+    def __init__(self, db_path: str, size: int = POOL_SIZE, timeout: float = POOL_TIMEOUT_SECONDS):
+        self.db_path = db_path
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._idle: List[sqlite3.Connection] = []
+        self._created = 0
+        self._closed = False
+        self._lock = threading.Condition()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0,
+            "discarded": 0,
+        }
+
+    def acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed")
+            if self._idle:
+                self._stats["hits"] += 1
+                return self._idle.pop()
+            if self._created >= self.size:
+                self._stats["waits"] += 1
+                started = time.perf_counter()
+                deadline = started + self.timeout
+                while not self._idle and self._created >= self.size:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        self._stats["wait_seconds"] += time.perf_counter() - started
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeoutError("Timed out waiting for a database connection")
+                    self._lock.wait(remaining)
+                self._stats["wait_seconds"] += time.perf_counter() - started
+                if self._idle:
+                    return self._idle.pop()
+            else:
+                self._stats["misses"] += 1
+            self._created += 1
+        try:
+            return connect(self.db_path)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+                self._lock.notify()
+            raise
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        healthy = True
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            healthy = False
+        with self._lock:
+            if healthy and not self._closed:
+                self._idle.append(conn)
+                self._lock.notify()
+                return
+            self._created -= 1
+            self._stats["discarded"] += 1
+            self._lock.notify()
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            acquired = self._stats["hits"] + self._stats["misses"] + self._stats["waits"]
+            return {
+                **self._stats,
+                "size": self.size,
+                "open": self._created,
+                "idle": len(self._idle),
+                "in_use": self._created - len(self._idle),
+                "hit_rate": (self._stats["hits"] / acquired) if acquired else None,
+            }
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    global _pool
+    if _pool is None or _pool.db_path != db_path:
+        with _pool_lock:
+            if _pool is None or _pool.db_path != db_path:
+                if _pool is not None:
+                    _pool.close()
+                _pool = ConnectionPool(db_path)
+    return _pool
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+def get_pool_stats() -> Optional[Dict[str, Any]]:
+    pool = _pool
+    return pool.stats() if pool is not None else None
@@ -0,0 +1,79 @@
+import sqlite3
+
+ROLLUP_KEY_COLUMNS = ("category", "status", "make", "model")
+ROLLUP_UNIT_SQL = "CASE WHEN lower({row}.category) = 'cable' THEN MAX(COALESCE({row}.quantity, 0), 0) ELSE 1 END"
+
+
+def _rollup_add_sql(row: str) -> str:
+    keys = ", ".join(f"{row}.{column}" for column in ROLLUP_KEY_COLUMNS)
+    return f"""
+        INSERT INTO item_rollup (category, status, make, model, item_count, unit_count)
+        VALUES ({keys}, 1, {ROLLUP_UNIT_SQL.format(row=row)})
+        ON CONFLICT (category, status, make, model) DO UPDATE SET
+            item_count = item_count + 1,
+            unit_count = unit_count + excluded.unit_count;
+    """
+
+
+def _rollup_remove_sql(row: str) -> str:
+    match = " AND ".join(f"{column} = {row}.{column}" for column in ROLLUP_KEY_COLUMNS)
+    return f"""
+        UPDATE item_rollup
+        SET item_count = item_count - 1,
+            unit_count = unit_count - {ROLLUP_UNIT_SQL.format(row=row)}
+        WHERE {match};
+        DELETE FROM item_rollup WHERE {match} AND item_count <= 0;
+    """
+
+
+def ensure_item_rollup(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS item_rollup (
+            category TEXT NOT NULL,
+            status TEXT NOT NULL,
+            make TEXT NOT NULL,
+            model TEXT NOT NULL,
+            item_count INTEGER NOT NULL DEFAULT 0,
+            unit_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (category, status, make, model)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS item_rollup_after_insert AFTER INSERT ON items BEGIN
+            {_rollup_add_sql("new")}
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS item_rollup_after_delete AFTER DELETE ON items BEGIN
+            {_rollup_remove_sql("old")}
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS item_rollup_after_update
+        AFTER UPDATE OF category, status, make, model, quantity ON items BEGIN
+            {_rollup_remove_sql("old")}
+            {_rollup_add_sql("new")}
+        END
+        """
+    )
+
+
+def rebuild_item_rollup(conn: sqlite3.Connection) -> int:
+    ensure_item_rollup(conn)
+    conn.execute("DELETE FROM item_rollup")
+    conn.execute(
+        f"""
+        INSERT INTO item_rollup (category, status, make, model, item_count, unit_count)
+        SELECT category, status, make, model, COUNT(*), SUM({ROLLUP_UNIT_SQL.format(row="items")})
+        FROM items
+        GROUP BY category, status, make, model
+        """
+    )
+    return conn.execute("SELECT COUNT(*) FROM item_rollup").fetchone()[0]
@@ -0,0 +1,155 @@
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("STOCKROOM_SLOW_QUERY_MS", "100"))
+SLOW_QUERY_LOG_RATE = int(os.getenv("STOCKROOM_SLOW_QUERY_LOG_RATE", "20"))
+SLOW_QUERY_LOG_WINDOW_SECONDS = 60.0
+SLOW_QUERY_SQL_LIMIT = 2000
+SLOW_QUERY_PLAN_CACHE_SIZE = 256
+SLOW_QUERY_RECENT_SIZE = 50
+EXPLAINABLE_PREFIXES = ("select", "with", "insert", "update", "delete", "replace")
+
+logger = logging.getLogger("stockroom.slow_query")
+
+_whitespace = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    return _whitespace.sub(" ", sql).strip()
+
+
+def parameter_shape(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, (str, bytes)):
+        return f"{type(value).__name__}({len(value)})"
+    return type(value).__name__
+
+
+def parameter_shapes(parameters: Any) -> Any:
+    if isinstance(parameters, dict):
+        return {name: parameter_shape(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [parameter_shape(value) for value in parameters]
+    return parameter_shape(parameters)
+
+
+def plan_flags(plan: List[str]) -> Dict[str, bool]:
+    return {
+        "full_scan": any(step.startswith("SCAN ") and not step.startswith("SCAN CONSTANT") for step in plan),
+        "temp_btree": any("TEMP B-TREE" in step for step in plan),
+    }
+
+
+class SlowQueryLog:
+    def __init__(
+        self,
+        threshold_ms: float = SLOW_QUERY_THRESHOLD_MS,
+        rate: int = SLOW_QUERY_LOG_RATE,
+        window_seconds: float = SLOW_QUERY_LOG_WINDOW_SECONDS,
+    ):
+        self.threshold = threshold_ms / 1000 if threshold_ms > 0 else None
+        self.rate = max(1, rate)
+        self.window_seconds = window_seconds
+        self._tokens = float(self.rate)
+        self._refilled = time.monotonic()
+        self._lock = threading.Lock()
+        self._plans: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=SLOW_QUERY_RECENT_SIZE)
+        self._stats = {"slow": 0, "logged": 0, "suppressed": 0, "full_scans": 0}
+        self._pending_suppressed = 0
+
+    def _take_token(self) -> Optional[int]:
+        with self._lock:
+            self._stats["slow"] += 1
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.rate),
+                self._tokens + (now - self._refilled) * self.rate / self.window_seconds,
+            )
+            self._refilled = now
+            if self._tokens < 1:
+                self._stats["suppressed"] += 1
+                self._pending_suppressed += 1
+                return None
+            self._tokens -= 1
+            suppressed, self._pending_suppressed = self._pending_suppressed, 0
+            return suppressed
+
+    def _plan(self, conn: sqlite3.Connection, sql: str, parameters: Any) -> Optional[List[str]]:
+        with self._lock:
+            plan = self._plans.get(sql)
+            if plan is not None:
+                self._plans.move_to_end(sql)
+                return plan
+        try:
+            rows = conn.cursor(sqlite3.Cursor).execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        except sqlite3.Error:
+            return None
+        plan = [row[3] for row in rows]
+        with self._lock:
+            self._plans[sql] = plan
+            while len(self._plans) > SLOW_QUERY_PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)
+        return plan
+
+    def observe(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        parameters: Any,
+        seconds: float,
+        route: Optional[str],
+        batch: bool = False,
+    ) -> None:
+        statement = normalize_sql(sql)
+        if not statement.lower().startswith(EXPLAINABLE_PREFIXES):
+            return
+        suppressed = self._take_token()
+        if suppressed is None:
+            return
+        explain_parameters = parameters
+        if batch:
+            explain_parameters = parameters[0] if isinstance(parameters, (list, tuple)) and parameters else None
+        plan = self._plan(conn, statement, explain_parameters) if explain_parameters is not None else None
+        record: Dict[str, Any] = {
+            "event": "slow_query",
+            "duration_ms": round(seconds * 1000, 3),
+            "threshold_ms": round(self.threshold * 1000, 3),
+            "route": route,
+            "sql": statement[:SLOW_QUERY_SQL_LIMIT],
+            "params": parameter_shapes(explain_parameters),
+            "batch": batch,
+            "plan": plan,
+            **plan_flags(plan or []),
+            "suppressed": suppressed,
+        }
+        with self._lock:
+            self._stats["logged"] += 1
+            self._stats["full_scans"] += int(record["full_scan"])
+            self._recent.append(record)
+        logger.warning(json.dumps(record, default=str))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "threshold_ms": self.threshold * 1000 if self.threshold is not None else None,
+                "rate_per_window": self.rate,
+                "window_seconds": self.window_seconds,
+                "recent": list(self._recent),
+            }
+
+
+slow_query_log = SlowQueryLog()
+
+
+def get_slow_query_stats() -> Dict[str, Any]:
+    return slow_query_log.stats()
@@ -0,0 +1,112 @@
+import sqlite3
+import time
+from contextvars import ContextVar
+from typing import Any, Iterable, Optional
+
+from .slow_query import slow_query_log
+
+
+class SqlTally:
+    __slots__ = ("statements", "seconds", "route")
+
+    def __init__(self, route: Optional[str] = None):
+        self.statements = 0
+        self.seconds = 0.0
+        self.route = route
+
+
+_sql_tally: ContextVar[Optional[SqlTally]] = ContextVar("stockroom_sql_tally", default=None)
+
+
+def start_sql_tally(route: Optional[str] = None) -> Any:
+    return _sql_tally.set(SqlTally(route))
+
+
+def current_sql_tally() -> Optional[SqlTally]:
+    return _sql_tally.get()
+
+
+def stop_sql_tally(token: Any) -> None:
+    _sql_tally.reset(token)
+
+
+class TimedCursor(sqlite3.Cursor):
+    _statement: Optional[str] = None
+    _parameters: Any = None
+    _batch = False
+    _elapsed = 0.0
+    _reported = False
+
+    def _begin(self, sql: str, parameters: Any, batch: bool) -> None:
+        self._statement = sql
+        self._parameters = parameters
+        self._batch = batch
+        self._elapsed = 0.0
+        self._reported = False
+
+    def _finish(self, seconds: float, statement: bool) -> None:
+        tally = _sql_tally.get()
+        if tally is not None:
+            tally.statements += int(statement)
+            tally.seconds += seconds
+        self._elapsed += seconds
+        threshold = slow_query_log.threshold
+        if threshold is not None and not self._reported and self._elapsed >= threshold and self._statement:
+            self._reported = True
+            slow_query_log.observe(
+                self.connection,
+                self._statement,
+                self._parameters,
+                self._elapsed,
+                tally.route if tally is not None else None,
+                self._batch,
+            )
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        self._begin(sql, parameters, False)
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._finish(time.perf_counter() - started, True)
+
+    def executemany(self, sql: str, parameters: Iterable[Any]) -> sqlite3.Cursor:
+        self._begin(sql, parameters, True)
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, parameters)
+        finally:
+            self._finish(time.perf_counter() - started, True)
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            self._finish(time.perf_counter() - started, False)
+
+    def fetchmany(self, size: Optional[int] = None) -> list:
+        size = self.arraysize if size is None else size
+        started = time.perf_counter()
+        try:
+            return super().fetchmany(size)
+        finally:
+            self._finish(time.perf_counter() - started, False)
+
+    def fetchall(self) -> list:
+        started = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            self._finish(time.perf_counter() - started, False)
+
+
+class TimedConnection(sqlite3.Connection):
+    def cursor(self, factory: type = TimedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, parameters: Iterable[Any]) -> sqlite3.Cursor:
+        return self.cursor().executemany(sql, parameters)
@@ -0,0 +1,212 @@
+import contextvars
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future, InvalidStateError
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .data_version import bump_data_version
+from .pool import connect
+
+WRITE_BATCH_SIZE = int(os.getenv("STOCKROOM_DB_WRITE_BATCH", "64"))
+WRITE_TIMEOUT_SECONDS = float(os.getenv("STOCKROOM_DB_WRITE_TIMEOUT", "30"))
+
+WriteJob = Callable[[sqlite3.Connection], Any]
+
+
+class WriteTimeoutError(sqlite3.OperationalError):
+    pass
+
+
+def _fail(future: Future, exc: BaseException) -> None:
+    try:
+        future.set_exception(exc)
+    except InvalidStateError:
+        pass
+
+
+_commit_listeners: List[Callable[[], None]] = []
+
+
+def add_commit_listener(listener: Callable[[], None]) -> None:
+    if listener not in _commit_listeners:
+        _commit_listeners.append(listener)
+
+
+class WriteQueue:
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = WRITE_BATCH_SIZE,
+        jobs: "Optional[queue.Queue[Optional[Tuple[WriteJob, Future]]]]" = None,
+    ):
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self._jobs: "queue.Queue[Optional[Tuple[WriteJob, Future]]]" = jobs if jobs is not None else queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "jobs": 0,
+            "failed_jobs": 0,
+            "batches": 0,
+            "max_batch": 0,
+            "commit_errors": 0,
+            "writer_errors": 0,
+        }
+        self._thread = threading.Thread(target=self._run, name="stockroom-db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: WriteJob, timeout: float = WRITE_TIMEOUT_SECONDS) -> Any:
+        future: Future = Future()
+        context = contextvars.copy_context()
+        self._jobs.put((lambda conn: context.run(job, conn), future))
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as exc:
+            if future.cancel():
+                raise WriteTimeoutError("Timed out waiting for the database writer") from exc
+        return future.result()
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def close(self) -> None:
+        self._jobs.put(None)
+        self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {**self._stats, "queued": self._jobs.qsize()}
+
+    def _next_batch(self) -> Tuple[List[Tuple[WriteJob, Future]], bool]:
+        first = self._jobs.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                pending = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if pending is None:
+                return batch, True
+            batch.append(pending)
+        return batch, False
+
+    def _run(self) -> None:
+        conn: Optional[sqlite3.Connection] = None
+        stopping = False
+        try:
+            while not stopping:
+                batch, stopping = self._next_batch()
+                if not batch:
+                    continue
+                try:
+                    if conn is None:
+                        conn = connect(self.db_path)
+                        conn.isolation_level = None
+                    self._apply(conn, batch)
+                except Exception as exc:
+                    conn = self._reset(conn)
+                    for _, future in batch:
+                        _fail(future, exc)
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def _reset(self, conn: Optional[sqlite3.Connection]) -> Optional[sqlite3.Connection]:
+        with self._stats_lock:
+            self._stats["writer_errors"] += 1
+        if conn is None:
+            return None
+        try:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return conn
+        except sqlite3.Error:
+            conn.close()
+            return None
+
+    def _apply(self, conn: sqlite3.Connection, batch: List[Tuple[WriteJob, Future]]) -> None:
+        outcomes: List[Tuple[Future, bool, Any]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as exc:
+            for _, future in batch:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(exc)
+            return
+        for job, future in batch:
+            if not future.set_running_or_notify_cancel():
+                continue
+            conn.execute("SAVEPOINT write_job")
+            try:
+                result = job(conn)
+            except Exception as exc:
+                conn.execute("ROLLBACK TO write_job")
+                conn.execute("RELEASE write_job")
+                outcomes.append((future, False, exc))
+            else:
+                conn.execute("RELEASE write_job")
+                outcomes.append((future, True, result))
+        committed = any(ok for _, ok, _ in outcomes)
+        try:
+            if committed:
+                bump_data_version(conn)
+            conn.execute("COMMIT")
+        except sqlite3.Error as exc:
+            committed = False
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            with self._stats_lock:
+                self._stats["commit_errors"] += 1
+            outcomes = [(future, False, exc) for future, _, _ in outcomes]
+        failed = 0
+        for future, ok, value in outcomes:
+            if ok:
+                future.set_result(value)
+            else:
+                failed += 1
+                future.set_exception(value)
+        with self._stats_lock:
+            self._stats["jobs"] += len(outcomes)
+            self._stats["failed_jobs"] += failed
+            self._stats["batches"] += 1
+            self._stats["max_batch"] = max(self._stats["max_batch"], len(outcomes))
+        if committed:
+            for listener in list(_commit_listeners):
+                listener()
+
+
+_writer: Optional[WriteQueue] = None
+_writer_lock = threading.Lock()
+
+
+def get_write_queue(db_path: str) -> WriteQueue:
+    global _writer
+    writer = _writer
+    if writer is None or writer.db_path != db_path or not writer.alive:
+        with _writer_lock:
+            if _writer is None or _writer.db_path != db_path:
+                if _writer is not None:
+                    _writer.close()
+                _writer = WriteQueue(db_path)
+            elif not _writer.alive:
+                _writer = WriteQueue(db_path, jobs=_writer._jobs)
+            writer = _writer
+    return writer
+
+
+def close_write_queue() -> None:
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+            _writer = None
+
+
+def get_write_queue_stats() -> Optional[Dict[str, Any]]:
+    writer = _writer
+    return writer.stats() if writer is not None else None
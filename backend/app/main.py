@@ -1,8 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .database.db import init_db
-from .routes import auth, items, users
+from .core.compression import CompressionMiddleware
+from .core.crypto import shutdown_password_pool, start_password_pool
+from .core.metrics import MetricsMiddleware
+from .database.db import close_db, init_db
+from .routes import audit, auth, events, exports, imports, items, system, users
+from .services import close_event_stream
 
 app = FastAPI()
 API_PREFIX = "/api"
@@ -19,12 +23,27 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(auth.router, prefix=API_PREFIX)
 app.include_router(items.router, prefix=API_PREFIX)
+app.include_router(imports.router, prefix=API_PREFIX)
+app.include_router(exports.router, prefix=API_PREFIX)
+app.include_router(events.router, prefix=API_PREFIX)
+app.include_router(audit.router, prefix=API_PREFIX)
 app.include_router(users.router, prefix=API_PREFIX)
+app.include_router(system.router, prefix=API_PREFIX)
 
 
 @app.on_event("startup")
 def startup():
     init_db()
+    start_password_pool()
+
+
+@app.on_event("shutdown")
+def shutdown():
+    close_event_stream()
+    close_db()
+    shutdown_password_pool()
@@ -1,4 +1,5 @@
 from .schemas import (
+    BulkLifecycleRequest,
     DeployRequest,
     ItemCreate,
     ItemUpdate,
@@ -10,6 +11,7 @@ from .schemas import (
 )
 
 __all__ = [
+    "BulkLifecycleRequest",
     "DeployRequest",
     "ItemCreate",
     "ItemUpdate",
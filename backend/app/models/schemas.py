@@ -1,5 +1,5 @@
 import re
-from typing import Optional, Literal
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -37,6 +37,14 @@ class ReturnRequest(BaseModel):
     zero_stock: bool = False
 
 
+class BulkLifecycleRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+    assigned_user: Optional[str] = None
+    note: Optional[str] = None
+    zero_stock: bool = False
+    mode: Literal["all_or_nothing", "best_effort"] = "all_or_nothing"
+
+
 class QuantityAdjustRequest(BaseModel):
     delta: int
     note: Optional[str] = None
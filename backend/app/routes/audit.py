@@ -0,0 +1,54 @@
+import sqlite3
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from ..common import FastJSONResponse, parse_iso_timestamp, require_nonempty
+from ..core.security import get_current_user
+from ..database.db import get_db
+from ..services import (
+    HISTORY_DEFAULT_LIMIT,
+    HISTORY_MAX_LIMIT,
+    fetch_assignee_history,
+    fetch_field_history,
+)
+
+router = APIRouter()
+
+
+@router.get("/audit/assignees/{assignee}")
+def get_assignee_history(
+    assignee: str,
+    limit: int = Query(HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT),
+    cursor: Optional[str] = Query(None),
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    assignee = require_nonempty(assignee, "assignee")
+    return FastJSONResponse(fetch_assignee_history(conn, assignee, limit, cursor))
+
+
+@router.get("/audit/fields/{field}")
+def get_field_history(
+    field: str,
+    item_id: Optional[int] = Query(None),
+    value: Optional[str] = Query(None),
+    since: Optional[str] = Query(None),
+    until: Optional[str] = Query(None),
+    limit: int = Query(HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT),
+    cursor: Optional[str] = Query(None),
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    return FastJSONResponse(
+        fetch_field_history(
+            conn,
+            field,
+            limit,
+            cursor,
+            since=parse_iso_timestamp(since, "since"),
+            until=parse_iso_timestamp(until, "until"),
+            item_id=item_id,
+            value=value,
+        )
+    )
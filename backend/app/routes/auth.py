@@ -2,17 +2,13 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 
 from ..core.security import authenticate_user, create_access_token, get_current_user
-from ..database.db import get_db
 
 router = APIRouter()
 
 
 @router.post("/token")
-def login(
-    form: OAuth2PasswordRequestForm = Depends(),
-    conn=Depends(get_db),
-):
-    user = authenticate_user(conn, form.username, form.password)
+def login(form: OAuth2PasswordRequestForm = Depends()):
+    user = authenticate_user(form.username, form.password)
     if not user:
         raise HTTPException(status_code=401, detail="Incorrect username or password")
     token = create_access_token({"sub": user["username"]})
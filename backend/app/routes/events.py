@@ -0,0 +1,80 @@
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from ..core.security import get_current_user, get_stream_user
+from ..core.stream_tickets import stream_tickets
+from ..services import (
+    EVENT_STREAM_HEARTBEAT_SECONDS,
+    event_broker,
+    format_event,
+    load_event_backlog,
+)
+
+router = APIRouter()
+
+EVENT_STREAM_RETRY_MS = 3000
+
+
+def parse_event_id(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+@router.post("/events/ticket")
+def issue_stream_ticket(current_user=Depends(get_current_user)):
+    return {"ticket": stream_tickets.issue(current_user["username"]), "expires_in": stream_tickets.ttl}
+
+
+@router.get("/events/stream")
+async def stream_events(
+    request: Request,
+    after: Optional[int] = Query(None, ge=0),
+    last_event_id: Optional[str] = Header(None),
+    current_user=Depends(get_stream_user),
+):
+    resume_from = parse_event_id(last_event_id)
+    if resume_from is None:
+        resume_from = after
+    subscriber = event_broker.subscribe(asyncio.get_running_loop())
+
+    async def body():
+        last_sent = resume_from or 0
+        try:
+            yield f"retry: {EVENT_STREAM_RETRY_MS}\n\n"
+            if resume_from is not None:
+                backlog = await run_in_threadpool(load_event_backlog, resume_from)
+                if backlog is None:
+                    yield format_event("reset", {"reason": "backlog", "last_event_id": last_sent})
+                    return
+                for event in backlog:
+                    last_sent = event["id"]
+                    yield format_event("item_change", event, event["id"])
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), EVENT_STREAM_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": heartbeat\n\n"
+                    continue
+                if event is None:
+                    yield format_event("reset", {"reason": "overflow", "last_event_id": last_sent})
+                    return
+                if event["id"] <= last_sent:
+                    continue
+                last_sent = event["id"]
+                yield format_event("item_change", event, event["id"])
+        finally:
+            event_broker.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,156 @@
+import csv
+import io
+import json
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from ..common import column_index, dumps_json, item_serializer, parse_iso_timestamp, tuple_cursor
+from ..core.security import get_current_user
+from ..database.archive import AUDIT_SCHEMAS
+from ..database.db import db_connection
+
+router = APIRouter()
+
+EXPORT_BATCH_SIZE = 500
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+ITEM_EXPORT_FIELDS = (
+    "id",
+    "category",
+    "make",
+    "model",
+    "service_tag",
+    "quantity",
+    "row",
+    "note",
+    "status",
+    "assigned_user",
+    "created_at",
+    "created_by",
+    "updated_at",
+)
+AUDIT_EXPORT_FIELDS = ("id", "item_id", "actor", "timestamp", "action", "changes", "note")
+
+
+def audit_event_serializer(description) -> Callable[[Tuple[Any, ...]], Dict[str, Any]]:
+    columns = column_index(description)
+    indexes = [columns[field] for field in AUDIT_EXPORT_FIELDS]
+    changes_index = columns["changes"]
+    loads = json.loads
+
+    def serialize(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        record = {field: row[index] for field, index in zip(AUDIT_EXPORT_FIELDS, indexes)}
+        record["changes"] = loads(row[changes_index]) if row[changes_index] else None
+        return record
+
+    return serialize
+
+
+PageQuery = Callable[[Optional[Tuple[Any, ...]]], Tuple[str, List[Any]]]
+
+
+def stream_rows(
+    page_query: PageQuery,
+    key_fields: Tuple[str, ...],
+    serializer: Callable[[Any], Callable[[Tuple[Any, ...]], Dict[str, Any]]],
+    export_format: str,
+    fields: Tuple[str, ...],
+) -> Iterator[bytes]:
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        yield buffer.getvalue().encode("utf-8")
+    after: Optional[Tuple[Any, ...]] = None
+    while True:
+        query, params = page_query(after)
+        with db_connection() as conn:
+            cursor = tuple_cursor(conn, f"{query} LIMIT ?", [*params, EXPORT_BATCH_SIZE])
+            serialize = serializer(cursor.description)
+            columns = column_index(cursor.description)
+            rows = cursor.fetchall()
+        if not rows:
+            break
+        after = tuple(rows[-1][columns[field]] for field in key_fields)
+        records: List[Dict[str, Any]] = [serialize(row) for row in rows]
+        if export_format == "csv":
+            buffer.seek(0)
+            buffer.truncate()
+            for record in records:
+                if isinstance(record.get("changes"), dict):
+                    record["changes"] = json.dumps(record["changes"])
+                writer.writerow(record)
+            yield buffer.getvalue().encode("utf-8")
+        else:
+            yield b"".join(dumps_json(record) + b"\n" for record in records)
+        if len(rows) < EXPORT_BATCH_SIZE:
+            break
+
+
+def export_response(
+    name: str,
+    export_format: str,
+    rows: Iterator[bytes],
+) -> StreamingResponse:
+    return StreamingResponse(
+        rows,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'},
+    )
+
+
+@router.get("/export/items")
+def export_items(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    since: Optional[str] = Query(None),
+    current_user=Depends(get_current_user),
+):
+    since = parse_iso_timestamp(since, "since")
+
+    def page_query(after: Optional[Tuple[Any, ...]]) -> Tuple[str, List[Any]]:
+        filters: List[str] = []
+        params: List[Any] = []
+        if since:
+            filters.append("COALESCE(updated_at, created_at) >= ?")
+            params.append(since)
+        if after is not None:
+            filters.append("id > ?")
+            params.append(after[0])
+        where = f" WHERE {' AND '.join(filters)}" if filters else ""
+        return f"SELECT * FROM items{where} ORDER BY id ASC", params
+
+    return export_response(
+        "items",
+        format,
+        stream_rows(page_query, ("id",), item_serializer, format, ITEM_EXPORT_FIELDS),
+    )
+
+
+@router.get("/export/audit-events")
+def export_audit_events(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    since: Optional[str] = Query(None),
+    current_user=Depends(get_current_user),
+):
+    since = parse_iso_timestamp(since, "since")
+    key_fields = ("timestamp", "id") if since else ("id",)
+
+    def page_query(after: Optional[Tuple[Any, ...]]) -> Tuple[str, List[Any]]:
+        filters: List[str] = []
+        params: List[Any] = []
+        if since:
+            filters.append("timestamp >= ?")
+            params.append(since)
+        if after is not None:
+            filters.append(f"({', '.join(key_fields)}) > ({', '.join('?' for _ in key_fields)})")
+            params.extend(after)
+        where = f" WHERE {' AND '.join(filters)}" if filters else ""
+        query = " UNION ALL ".join(f"SELECT * FROM {schema}.audit_events{where}" for schema in AUDIT_SCHEMAS)
+        return f"{query} ORDER BY {', '.join(f'{field} ASC' for field in key_fields)}", params * len(AUDIT_SCHEMAS)
+
+    return export_response(
+        "audit-events",
+        format,
+        stream_rows(page_query, key_fields, audit_event_serializer, format, AUDIT_EXPORT_FIELDS),
+    )
@@ -0,0 +1,258 @@
+import codecs
+import csv
+import json
+import sqlite3
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Literal, Optional, Set, Tuple
+
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+
+from ..common import CABLE_DUPLICATE_ERROR, cable_signature, is_cable_category
+from ..core.security import get_current_user
+from ..database.db import request_connection, run_write
+from ..models import ItemCreate
+from ..services import insert_new_items, prepare_new_item
+from .items import find_existing_cable_conflict
+
+router = APIRouter()
+
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_REPORTED_ERRORS = 1000
+IMPORT_FIELDS = ("category", "make", "model", "service_tag", "row", "note")
+IMPORT_CONTENT_TYPES = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+ImportRecord = Tuple[int, Dict[str, Any]]
+
+
+def resolve_import_format(request: Request, requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    content_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    resolved = IMPORT_CONTENT_TYPES.get(content_type)
+    if not resolved:
+        raise HTTPException(
+            status_code=415,
+            detail="Send text/csv or application/x-ndjson, or pass format=csv|ndjson",
+        )
+    return resolved
+
+
+def iter_text_lines(read_chunk: Callable[[], Optional[bytes]]) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    while True:
+        chunk = read_chunk()
+        if chunk is None:
+            break
+        buffer += decoder.decode(chunk)
+        end = buffer.rfind("\n")
+        if end < 0:
+            continue
+        complete, buffer = buffer[:end], buffer[end + 1 :]
+        for line in complete.split("\n"):
+            yield line + "\n"
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
+def iter_csv_records(lines: Iterator[str]) -> Iterator[ImportRecord]:
+    reader = csv.DictReader(lines)
+    for index, record in enumerate(reader, start=1):
+        yield index, record
+
+
+def iter_ndjson_records(lines: Iterator[str]) -> Iterator[ImportRecord]:
+    for index, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield index, {"__error__": f"Invalid JSON: {exc.msg}"}
+            continue
+        if not isinstance(record, dict):
+            yield index, {"__error__": "Each line must be a JSON object"}
+            continue
+        yield index, record
+
+
+def prepare_import_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    if "__error__" in record:
+        raise ValueError(record["__error__"])
+    values = {}
+    for field in IMPORT_FIELDS:
+        value = record.get(field)
+        if isinstance(value, str) and not value.strip() and field not in ("category", "make", "model"):
+            value = None
+        values[field] = value
+    try:
+        payload = ItemCreate(**values)
+    except ValidationError as exc:
+        first = exc.errors()[0]
+        location = ".".join(str(part) for part in first.get("loc", ()))
+        raise ValueError(f"{location}: {first.get('msg')}" if location else first.get("msg")) from exc
+    try:
+        return prepare_new_item(payload)
+    except HTTPException as exc:
+        raise ValueError(exc.detail) from exc
+
+
+class ImportChunkResult:
+    def __init__(self):
+        self.imported = 0
+        self.failures: List[Tuple[int, str]] = []
+        self.cables: Set[Tuple[str, str]] = set()
+
+
+class ImportReport:
+    def __init__(self, import_format: str, dry_run: bool):
+        self.import_format = import_format
+        self.dry_run = dry_run
+        self.total_rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.chunks = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.seen_cables: Set[Tuple[str, str]] = set()
+
+    def fail(self, row_number: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row_number, "error": message})
+
+    def merge(self, result: ImportChunkResult) -> None:
+        self.chunks += 1
+        self.imported += result.imported
+        self.seen_cables |= result.cables
+        for row_number, message in result.failures:
+            self.fail(row_number, message)
+
+    def as_response(self) -> Dict[str, Any]:
+        return {
+            "format": self.import_format,
+            "dry_run": self.dry_run,
+            "total_rows": self.total_rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda error: error["row"]),
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def apply_import_chunk(
+    conn: sqlite3.Connection,
+    chunk: List[Tuple[int, Dict[str, Any]]],
+    seen_cables: FrozenSet[Tuple[str, str]],
+    dry_run: bool,
+    actor: str,
+) -> ImportChunkResult:
+    result = ImportChunkResult()
+    accepted: List[Dict[str, Any]] = []
+    for row_number, item in chunk:
+        if is_cable_category(item["category"]):
+            signature = cable_signature(item["make"], item["model"])
+            if (
+                signature in seen_cables
+                or signature in result.cables
+                or find_existing_cable_conflict(conn, item["make"], item["model"]) is not None
+            ):
+                result.failures.append((row_number, CABLE_DUPLICATE_ERROR))
+                continue
+            result.cables.add(signature)
+        accepted.append(item)
+    if not dry_run:
+        insert_new_items(conn, accepted, actor)
+    result.imported = len(accepted)
+    return result
+
+
+def import_failure(
+    report: ImportReport,
+    chunk: List[Tuple[int, Dict[str, Any]]],
+    exc: Exception,
+) -> HTTPException:
+    status_code = exc.status_code if isinstance(exc, HTTPException) else 500
+    error = exc.detail if isinstance(exc, HTTPException) else "Database error while importing"
+    return HTTPException(
+        status_code=status_code,
+        detail={
+            **report.as_response(),
+            "error": error,
+            "failed_chunk": {"index": report.chunks, "first_row": chunk[0][0], "last_row": chunk[-1][0]},
+        },
+        headers=exc.headers if isinstance(exc, HTTPException) else None,
+    )
+
+
+def run_import(
+    records: Iterator[ImportRecord],
+    report: ImportReport,
+    actor: str,
+) -> Dict[str, Any]:
+    chunk: List[Tuple[int, Dict[str, Any]]] = []
+
+    def flush() -> None:
+        if not chunk:
+            return
+        seen_cables = frozenset(report.seen_cables)
+        try:
+            if report.dry_run:
+                with request_connection() as conn:
+                    result = apply_import_chunk(conn, chunk, seen_cables, True, actor)
+            else:
+                result = run_write(lambda writer: apply_import_chunk(writer, chunk, seen_cables, False, actor))
+        except (HTTPException, sqlite3.Error) as exc:
+            raise import_failure(report, chunk, exc) from exc
+        report.merge(result)
+        chunk.clear()
+
+    try:
+        for row_number, record in records:
+            report.total_rows += 1
+            try:
+                chunk.append((row_number, prepare_import_record(record)))
+            except ValueError as exc:
+                report.fail(row_number, str(exc))
+                continue
+            if len(chunk) >= IMPORT_CHUNK_SIZE:
+                flush()
+    except (csv.Error, UnicodeDecodeError) as exc:
+        flush()
+        report.fail(report.total_rows + 1, f"Could not parse input: {exc}")
+        return report.as_response()
+    flush()
+    return report.as_response()
+
+
+@router.post("/items/import")
+async def import_items(
+    request: Request,
+    format: Optional[Literal["csv", "ndjson"]] = Query(None),
+    dry_run: bool = Query(False),
+    current_user=Depends(get_current_user),
+):
+    import_format = resolve_import_format(request, format)
+    body = request.stream()
+
+    async def next_chunk() -> Optional[bytes]:
+        try:
+            return await body.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    def read_chunk() -> Optional[bytes]:
+        return anyio.from_thread.run(next_chunk)
+
+    lines = iter_text_lines(read_chunk)
+    records = iter_csv_records(lines) if import_format == "csv" else iter_ndjson_records(lines)
+    report = ImportReport(import_format, dry_run)
+    return await run_in_threadpool(run_import, records, report, current_user["username"])
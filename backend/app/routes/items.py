@@ -1,363 +1,576 @@
+import json
 import sqlite3
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from ..common import (
     CABLE_DUPLICATE_ERROR,
+    FastJSONResponse,
     capitalize_first,
     cable_signature,
+    cable_signature_keys,
+    column_index,
     create_audit_event,
+    decode_cursor,
+    encode_cursor,
+    etag_headers,
     is_cable_category,
+    item_serializer,
     now_iso,
     normalize_cable_ends,
     normalize_cable_length,
+    not_modified,
     raise_if_cable_unique_integrity_error,
     require_nonempty,
     row_to_item,
     title_case_words,
+    tuple_cursor,
 )
-from ..core.constants import STATUS_DEPLOYED, STATUS_IN_STOCK, STATUS_RETIRED
+from ..core.constants import STATUS_RETIRED
+from ..core.compression import cached_json_response
 from ..core.security import get_current_user
-from ..database.db import get_db
+from ..database.data_version import NEXT_CHANGE_SEQ_SQL, get_data_version
+from ..database.db import get_db, run_write
 from ..models import (
+    BulkLifecycleRequest,
     DeployRequest,
     ItemCreate,
     ItemUpdate,
     QuantityAdjustRequest,
     ReturnRequest,
 )
-from ..services import apply_item_status_change, build_history, get_item_or_404, get_item_response
+from ..services import (
+    CHANGES_DEFAULT_LIMIT,
+    CHANGES_MAX_LIMIT,
+    HISTORY_DEFAULT_LIMIT,
+    HISTORY_MAX_LIMIT,
+    apply_lifecycle_changes,
+    build_item_search_match,
+    category_history_scope,
+    fetch_category_history,
+    fetch_item_changes,
+    fetch_item_history,
+    fetch_item_stats,
+    get_item_or_404,
+    get_item_response,
+    insert_new_items,
+    item_history_scope,
+    item_search_snippet_sql,
+    plan_lifecycle_change,
+    prepare_new_item,
+    render_search_snippet,
+)
 
 router = APIRouter()
 
 
-def normalize_service_tag(category: str, value: Optional[str]) -> str:
-    if value is None:
-        if is_cable_category(category):
-            return "N/A"
-        raise HTTPException(status_code=400, detail="service_tag is required")
-    cleaned = value.strip()
-    if cleaned:
-        return cleaned
-    if is_cable_category(category):
-        return "N/A"
-    raise HTTPException(status_code=400, detail="service_tag is required")
-
 def find_existing_cable_conflict(
     conn: sqlite3.Connection,
     make: str,
     model: str,
     exclude_item_id: Optional[int] = None,
 ) -> Optional[int]:
-    params: List[Any] = []
-    query = "SELECT id, make, model FROM items WHERE lower(category) = 'cable'"
+    ends_key, length_key = cable_signature(make, model)
+    params: List[Any] = [ends_key, length_key]
+    query = "SELECT id FROM items WHERE cable_ends_key = ? AND cable_length_key = ?"
     if exclude_item_id is not None:
         query += " AND id != ?"
         params.append(exclude_item_id)
-    rows = conn.execute(query, params).fetchall()
-    target_signature = cable_signature(make, model)
-    for existing in rows:
-        if cable_signature(existing["make"], existing["model"]) == target_signature:
-            return int(existing["id"])
-    return None
+    existing = conn.execute(query + " LIMIT 1", params).fetchone()
+    return int(existing["id"]) if existing else None
+
+
+ITEM_SORT_EXPRESSIONS = {
+    "id": "items.id",
+    "created": "items.created_at",
+    "updated": "COALESCE(items.updated_at, items.created_at)",
+    "row": "COALESCE(items.row, '')",
+    "relevance": "bm25(items_fts)",
+}
+MAX_ITEMS_PAGE_SIZE = 500
 
 
 @router.get("/items")
 def list_items(
+    request: Request,
     q: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    category: Optional[str] = Query(None),
+    hide_retired: bool = Query(False),
+    sort: Literal["id", "created", "updated", "row", "relevance"] = Query("id"),
+    direction: Literal["asc", "desc"] = Query("desc"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_ITEMS_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
     conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    base_query = "SELECT * FROM items"
-    params: List[Any] = []
-    if q:
-        like_q = f"%{q}%"
-        base_query += (
-            " WHERE category LIKE ? OR make LIKE ? OR model LIKE ?"
-            " OR service_tag LIKE ? OR row LIKE ? OR assigned_user LIKE ?"
+    if q is None and sort == "relevance":
+        raise HTTPException(status_code=400, detail="sort=relevance requires a search query")
+    match = build_item_search_match(q)
+    order_direction = "asc" if sort == "relevance" else direction
+    cursor_scope = f"items:{sort}:{order_direction}"
+    after = decode_cursor(cursor, cursor_scope, 2)
+    headers = etag_headers(get_data_version(conn))
+    cached = not_modified(request, headers)
+    if cached is not None:
+        return cached
+
+    def build() -> Dict[str, Any]:
+        source = "items"
+        select_extra = ""
+        filters: List[str] = []
+        params: List[Any] = []
+        if match:
+            source = "items JOIN items_fts ON items_fts.rowid = items.id"
+            select_extra = f", {item_search_snippet_sql()} AS search_snippet"
+            filters.append("items_fts MATCH ?")
+            params.append(match)
+        elif q is not None:
+            return {"items": [], "total": 0, "next_cursor": None}
+        if status:
+            filters.append("items.status = ?")
+            params.append(status)
+        elif hide_retired:
+            filters.append("items.status != ?")
+            params.append(STATUS_RETIRED)
+        if category:
+            filters.append("items.category = ?")
+            params.append(category)
+        where_clause = f" WHERE {' AND '.join(filters)}" if filters else ""
+        total = conn.execute(f"SELECT COUNT(*) FROM {source}{where_clause}", params).fetchone()[0]
+
+        sort_expression = ITEM_SORT_EXPRESSIONS[sort]
+        page_filters = list(filters)
+        page_params = list(params)
+        if after is not None:
+            comparator = "<" if order_direction == "desc" else ">"
+            page_filters.append(f"({sort_expression}, items.id) {comparator} (?, ?)")
+            page_params.extend(after)
+        page_where = f" WHERE {' AND '.join(page_filters)}" if page_filters else ""
+        order = order_direction.upper()
+        query = (
+            f"SELECT items.*, {sort_expression} AS sort_key{select_extra} FROM {source}{page_where}"
+            f" ORDER BY {sort_expression} {order}, items.id {order}"
         )
-        params.extend([like_q, like_q, like_q, like_q, like_q, like_q])
-    base_query += " ORDER BY id DESC"
-    rows = conn.execute(base_query, params).fetchall()
-    return {"items": [row_to_item(row) for row in rows]}
+        if limit is not None:
+            query += " LIMIT ?"
+            page_params.append(limit + 1)
+        rows_cursor = tuple_cursor(conn, query, page_params)
+        columns = column_index(rows_cursor.description)
+        serialize = item_serializer(rows_cursor.description)
+        rows = rows_cursor.fetchall()
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(cursor_scope, [last[columns["sort_key"]], last[columns["id"]]])
+        items = [serialize(row) for row in rows]
+        if match:
+            snippet_index = columns["search_snippet"]
+            for item, row in zip(items, rows):
+                item["search_snippet"] = render_search_snippet(row[snippet_index])
+        return {"items": items, "total": total, "next_cursor": next_cursor}
+
+    return cached_json_response(request, headers, build)
 
 
 @router.post("/items", status_code=201)
 def add_item(
     payload: ItemCreate,
-    conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    created_at = now_iso()
-    category = capitalize_first(require_nonempty(payload.category, "category"))
-    make = require_nonempty(payload.make, "make")
-    model = require_nonempty(payload.model, "model")
-    if is_cable_category(category):
-        make = normalize_cable_ends(make)
-        model = normalize_cable_length(model)
-    service_tag = normalize_service_tag(category, payload.service_tag)
-    quantity = 0 if is_cable_category(category) else 1
-    row = payload.row.strip() if payload.row else None
-    note = payload.note.strip() if payload.note else None
-    if is_cable_category(category):
-        existing_id = find_existing_cable_conflict(conn, make, model)
-        if existing_id is not None:
+    item = prepare_new_item(payload)
+
+    def write(conn: sqlite3.Connection) -> Dict[str, Any]:
+        if is_cable_category(item["category"]):
+            existing_id = find_existing_cable_conflict(conn, item["make"], item["model"])
+            if existing_id is not None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        "This cable already exists with the same ends and length. "
+                        "Use Cable Manager to adjust quantity (+/-) instead of adding a new item."
+                    ),
+                )
+        try:
+            item_id = insert_new_items(conn, [item], current_user["username"])[0]
+        except sqlite3.IntegrityError as exc:
+            raise_if_cable_unique_integrity_error(exc)
+            raise
+        return get_item_response(conn, item_id)
+
+    return run_write(write)
+
+
+@router.post("/items/bulk/{action}")
+def bulk_lifecycle_change(
+    action: Literal["deploy", "return", "retire", "restore"],
+    payload: BulkLifecycleRequest,
+    current_user=Depends(get_current_user),
+):
+    assigned_user = None
+    if action == "deploy":
+        assigned_user = title_case_words(require_nonempty(payload.assigned_user or "", "assigned_user"))
+    item_ids = list(dict.fromkeys(payload.ids))
+    actor = current_user["username"]
+
+    def write(conn: sqlite3.Connection) -> Dict[str, Any]:
+        rows = {
+            row["id"]: row
+            for row in conn.execute(
+                "SELECT * FROM items WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(item_ids),),
+            ).fetchall()
+        }
+        planned: List[Tuple[int, Dict[str, Any]]] = []
+        errors: Dict[int, str] = {}
+        for item_id in item_ids:
+            row = rows.get(item_id)
+            if row is None:
+                errors[item_id] = "Item not found"
+                continue
+            try:
+                plan = plan_lifecycle_change(
+                    row,
+                    action,
+                    assigned_user=assigned_user,
+                    zero_stock=payload.zero_stock,
+                )
+            except HTTPException as exc:
+                errors[item_id] = exc.detail
+                continue
+            planned.append((item_id, plan))
+        if errors and payload.mode == "all_or_nothing":
             raise HTTPException(
                 status_code=400,
-                detail=(
-                    "This cable already exists with the same ends and length. "
-                    "Use Cable Manager to adjust quantity (+/-) instead of adding a new item."
-                ),
+                detail={
+                    "message": "No items were changed because some items cannot be updated",
+                    "results": [
+                        {"id": item_id, "ok": False, "error": errors[item_id]}
+                        for item_id in item_ids
+                        if item_id in errors
+                    ],
+                },
             )
-    try:
-        cur = conn.execute(
-            """
-            INSERT INTO items (
-                category, make, model, service_tag, quantity, row, note, status, assigned_user, created_at, created_by, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                category,
-                make,
-                model,
-                service_tag,
-                quantity,
-                row,
-                note,
-                STATUS_IN_STOCK,
-                None,
-                created_at,
-                current_user["username"],
-                created_at,
-            ),
-        )
-    except sqlite3.IntegrityError as exc:
-        raise_if_cable_unique_integrity_error(exc)
-        raise
-    item_id = cur.lastrowid
-    changes = {
-        "category": {"old": None, "new": category},
-        "make": {"old": None, "new": make},
-        "model": {"old": None, "new": model},
-        "service_tag": {"old": None, "new": service_tag},
-        "quantity": {"old": None, "new": quantity},
-        "row": {"old": None, "new": row},
-        "note": {"old": None, "new": note},
-        "status": {"old": None, "new": STATUS_IN_STOCK},
-    }
-    if not is_cable_category(category):
-        changes["assigned_user"] = {"old": None, "new": None}
-    create_audit_event(
-        conn,
-        item_id,
-        current_user["username"],
-        "add",
-        changes=changes,
-    )
-    conn.commit()
-    row = conn.execute("SELECT * FROM items WHERE id = ?", (item_id,)).fetchone()
-    return {"item": row_to_item(row)}
+        apply_lifecycle_changes(conn, planned, actor=actor, action=action, note=payload.note)
+        updated = {
+            row["id"]: row_to_item(row)
+            for row in conn.execute(
+                "SELECT * FROM items WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps([item_id for item_id, _ in planned]),),
+            ).fetchall()
+        }
+        results = [
+            {"id": item_id, "ok": False, "error": errors[item_id]}
+            if item_id in errors
+            else {"id": item_id, "ok": True, "item": updated[item_id]}
+            for item_id in item_ids
+        ]
+        return {
+            "action": action,
+            "mode": payload.mode,
+            "applied": len(planned),
+            "failed": len(errors),
+            "results": results,
+        }
+
+    return run_write(write)
+
+
+@router.get("/items/stats")
+def get_item_stats(
+    category: Optional[str] = Query(None),
+    include_models: bool = Query(False),
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    return fetch_item_stats(conn, category.strip() if category else None, include_models)
+
+
+@router.get("/items/changes")
+def get_item_changes(
+    since: Optional[str] = Query(None),
+    limit: int = Query(CHANGES_DEFAULT_LIMIT, ge=1, le=CHANGES_MAX_LIMIT),
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    return FastJSONResponse(fetch_item_changes(conn, since, limit))
 
 
 @router.get("/items/category/{category}/summary")
 def get_category_summary(
     category: str,
+    request: Request,
+    include_history: bool = Query(True),
+    history_limit: int = Query(HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT),
+    history_cursor: Optional[str] = Query(None),
     conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     normalized_category = capitalize_first(require_nonempty(category, "category"))
-    rows = conn.execute(
-        "SELECT * FROM items WHERE lower(category) = lower(?) ORDER BY make ASC, model ASC, id ASC",
-        (normalized_category,),
-    ).fetchall()
-    item_map = {row["id"]: row_to_item(row) for row in rows}
-    if not item_map:
-        return {"category": normalized_category, "items": [], "history": []}
-    placeholders = ", ".join(["?"] * len(item_map))
-    events = conn.execute(
-        f"SELECT * FROM audit_events WHERE item_id IN ({placeholders}) ORDER BY id DESC",
-        list(item_map.keys()),
-    ).fetchall()
-    history = []
-    for event in events:
-        parsed = build_history([event])[0]
-        item = item_map.get(event["item_id"])
-        parsed["item_id"] = event["item_id"]
-        length_value = item["model"] if item else ""
-        parsed["item_label"] = (
-            f'{item["make"]} ({length_value})'.strip() if item else f'Item {event["item_id"]}'
+    decode_cursor(history_cursor, category_history_scope(normalized_category), 1)
+    headers = etag_headers(get_data_version(conn))
+    cached = not_modified(request, headers)
+    if cached is not None:
+        return cached
+
+    def build() -> Dict[str, Any]:
+        rows_cursor = tuple_cursor(
+            conn,
+            "SELECT * FROM items WHERE lower(category) = lower(?) ORDER BY make ASC, model ASC, id ASC",
+            (normalized_category,),
         )
-        history.append(parsed)
-    return {"category": normalized_category, "items": list(item_map.values()), "history": history}
+        serialize = item_serializer(rows_cursor.description)
+        items = [serialize(row) for row in rows_cursor.fetchall()]
+        body: Dict[str, Any] = {
+            "category": normalized_category,
+            "items": items,
+            "history": [],
+            "history_next_cursor": None,
+        }
+        if items and include_history:
+            page = fetch_category_history(conn, normalized_category, history_limit, history_cursor)
+            body["history"] = page["history"]
+            body["history_next_cursor"] = page["next_cursor"]
+        return body
+
+    return cached_json_response(request, headers, build)
+
+
+@router.get("/items/category/{category}/history")
+def get_category_history(
+    category: str,
+    request: Request,
+    limit: int = Query(HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT),
+    cursor: Optional[str] = Query(None),
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    normalized_category = capitalize_first(require_nonempty(category, "category"))
+    decode_cursor(cursor, category_history_scope(normalized_category), 1)
+    headers = etag_headers(get_data_version(conn))
+    cached = not_modified(request, headers)
+    if cached is not None:
+        return cached
+    return cached_json_response(
+        request,
+        headers,
+        lambda: fetch_category_history(conn, normalized_category, limit, cursor),
+    )
 
 
 @router.get("/items/{item_id}")
 def get_item(
     item_id: int,
+    request: Request,
+    include_history: bool = Query(True),
+    history_limit: int = Query(HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT),
+    history_cursor: Optional[str] = Query(None),
     conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
+    decode_cursor(history_cursor, item_history_scope(item_id), 1)
+    headers = etag_headers(get_data_version(conn))
     row = get_item_or_404(conn, item_id)
-    events = conn.execute(
-        "SELECT * FROM audit_events WHERE item_id = ? ORDER BY id ASC", (item_id,)
-    ).fetchall()
-    return {"item": row_to_item(row), "history": build_history(events)}
+    cached = not_modified(request, headers)
+    if cached is not None:
+        return cached
+
+    def build() -> Dict[str, Any]:
+        body: Dict[str, Any] = {"item": row_to_item(row), "history": [], "history_next_cursor": None}
+        if include_history:
+            page = fetch_item_history(conn, item_id, history_limit, history_cursor)
+            body["history"] = page["history"]
+            body["history_next_cursor"] = page["next_cursor"]
+        return body
+
+    return cached_json_response(request, headers, build)
+
+
+@router.get("/items/{item_id}/history")
+def get_item_history(
+    item_id: int,
+    request: Request,
+    limit: int = Query(HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT),
+    cursor: Optional[str] = Query(None),
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    decode_cursor(cursor, item_history_scope(item_id), 1)
+    headers = etag_headers(get_data_version(conn))
+    get_item_or_404(conn, item_id)
+    cached = not_modified(request, headers)
+    if cached is not None:
+        return cached
+    return cached_json_response(request, headers, lambda: fetch_item_history(conn, item_id, limit, cursor))
 
 
 @router.put("/items/{item_id}")
 def update_item(
     item_id: int,
     payload: ItemUpdate,
-    conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    row = get_item_or_404(conn, item_id)
-    updates: Dict[str, Any] = {}
-    for field in ["category", "make", "model", "service_tag", "row", "note"]:
-        value = getattr(payload, field)
-        if value is not None:
-            if field in ("row", "note"):
-                normalized = value.strip()
-            elif field == "service_tag":
-                normalized = value.strip()
-            else:
-                normalized = require_nonempty(value, field)
-            if field == "category":
-                normalized = capitalize_first(normalized)
-            if field in ("row", "note") and normalized == "":
-                normalized = None
-            if field == "service_tag" and normalized == "":
-                normalized = None
-            updates[field] = normalized
-    if payload.quantity is not None:
-        raise HTTPException(
-            status_code=400,
-            detail="Use Cable Manager quantity controls to change quantity",
-        )
-    next_category = updates.get("category", row["category"])
-    if is_cable_category(next_category):
-        next_make = updates.get("make", row["make"])
-        next_model = updates.get("model", row["model"])
-        normalized_make = normalize_cable_ends(next_make)
-        normalized_model = normalize_cable_length(next_model)
-        if normalized_make != next_make:
-            updates["make"] = normalized_make
-        if normalized_model != next_model:
-            updates["model"] = normalized_model
-        next_signature = cable_signature(normalized_make, normalized_model)
-        current_signature = (
-            cable_signature(row["make"], row["model"])
-            if is_cable_category(row["category"])
-            else None
-        )
-        if current_signature != next_signature:
-            existing_id = find_existing_cable_conflict(
-                conn,
-                normalized_make,
-                normalized_model,
-                exclude_item_id=item_id,
+    def write(conn: sqlite3.Connection) -> Dict[str, Any]:
+        row = get_item_or_404(conn, item_id)
+        updates: Dict[str, Any] = {}
+        for field in ["category", "make", "model", "service_tag", "row", "note"]:
+            value = getattr(payload, field)
+            if value is not None:
+                if field in ("row", "note"):
+                    normalized = value.strip()
+                elif field == "service_tag":
+                    normalized = value.strip()
+                else:
+                    normalized = require_nonempty(value, field)
+                if field == "category":
+                    normalized = capitalize_first(normalized)
+                if field in ("row", "note") and normalized == "":
+                    normalized = None
+                if field == "service_tag" and normalized == "":
+                    normalized = None
+                updates[field] = normalized
+        if payload.quantity is not None:
+            raise HTTPException(
+                status_code=400,
+                detail="Use Cable Manager quantity controls to change quantity",
             )
-            if existing_id is not None:
-                raise HTTPException(
-                    status_code=400,
-                    detail=CABLE_DUPLICATE_ERROR,
+        next_category = updates.get("category", row["category"])
+        if is_cable_category(next_category):
+            next_make = updates.get("make", row["make"])
+            next_model = updates.get("model", row["model"])
+            normalized_make = normalize_cable_ends(next_make)
+            normalized_model = normalize_cable_length(next_model)
+            if normalized_make != next_make:
+                updates["make"] = normalized_make
+            if normalized_model != next_model:
+                updates["model"] = normalized_model
+            next_signature = cable_signature(normalized_make, normalized_model)
+            current_signature = (
+                cable_signature(row["make"], row["model"])
+                if is_cable_category(row["category"])
+                else None
+            )
+            if current_signature != next_signature:
+                existing_id = find_existing_cable_conflict(
+                    conn,
+                    normalized_make,
+                    normalized_model,
+                    exclude_item_id=item_id,
                 )
-    next_service_tag = updates.get("service_tag", row["service_tag"])
-    if not next_service_tag and not is_cable_category(next_category):
-        raise HTTPException(status_code=400, detail="service_tag is required")
-    if not next_service_tag and is_cable_category(next_category):
-        updates["service_tag"] = "N/A"
-    if "category" in updates and not is_cable_category(next_category) and row["quantity"] != 1:
-        updates["quantity"] = 1
-    changes: Dict[str, Dict[str, Any]] = {}
-    for field, new_value in updates.items():
-        old_value = row[field]
-        if new_value != old_value:
-            changes[field] = {"old": old_value, "new": new_value}
-    if not changes:
-        raise HTTPException(status_code=400, detail="No changes to apply")
-    set_clause = ", ".join([f"{field} = ?" for field in changes.keys()])
-    updated_at = now_iso()
-    try:
-        conn.execute(
-            f"UPDATE items SET {set_clause}, updated_at = ? WHERE id = ?",
-            [changes[field]["new"] for field in changes.keys()] + [updated_at, item_id],
+                if existing_id is not None:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=CABLE_DUPLICATE_ERROR,
+                    )
+        next_service_tag = updates.get("service_tag", row["service_tag"])
+        if not next_service_tag and not is_cable_category(next_category):
+            raise HTTPException(status_code=400, detail="service_tag is required")
+        if not next_service_tag and is_cable_category(next_category):
+            updates["service_tag"] = "N/A"
+        if "category" in updates and not is_cable_category(next_category) and row["quantity"] != 1:
+            updates["quantity"] = 1
+        changes: Dict[str, Dict[str, Any]] = {}
+        for field, new_value in updates.items():
+            old_value = row[field]
+            if new_value != old_value:
+                changes[field] = {"old": old_value, "new": new_value}
+        if not changes:
+            raise HTTPException(status_code=400, detail="No changes to apply")
+        set_clause = ", ".join([f"{field} = ?" for field in changes.keys()])
+        updated_at = now_iso()
+        signature_keys = cable_signature_keys(
+            next_category,
+            updates.get("make", row["make"]),
+            updates.get("model", row["model"]),
         )
-    except sqlite3.IntegrityError as exc:
-        raise_if_cable_unique_integrity_error(exc)
-        raise
-    create_audit_event(
-        conn,
-        item_id,
-        current_user["username"],
-        "edit",
-        changes=changes,
-    )
-    conn.commit()
-    return get_item_response(conn, item_id)
+        try:
+            conn.execute(
+                f"UPDATE items SET {set_clause}, updated_at = ?, cable_ends_key = ?, cable_length_key = ?, "
+                f"change_seq = {NEXT_CHANGE_SEQ_SQL} WHERE id = ?",
+                [changes[field]["new"] for field in changes.keys()] + [updated_at, *signature_keys, item_id],
+            )
+        except sqlite3.IntegrityError as exc:
+            raise_if_cable_unique_integrity_error(exc)
+            raise
+        create_audit_event(
+            conn,
+            item_id,
+            current_user["username"],
+            "edit",
+            changes=changes,
+        )
+        return get_item_response(conn, item_id)
+
+    return run_write(write)
 
 
 @router.post("/items/{item_id}/quantity")
 def adjust_quantity(
     item_id: int,
     payload: QuantityAdjustRequest,
-    conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    row = get_item_or_404(conn, item_id)
-    if not is_cable_category(row["category"]):
-        raise HTTPException(status_code=400, detail="Quantity adjustments are only available for cables")
-    if payload.delta == 0:
-        raise HTTPException(status_code=400, detail="No changes to apply")
-    old_quantity = int(row["quantity"] or 0)
-    new_quantity = old_quantity + payload.delta
-    if new_quantity < 0:
-        raise HTTPException(status_code=400, detail="Quantity cannot be negative")
-    changes = {"quantity": {"old": old_quantity, "new": new_quantity}}
-    conn.execute(
-        "UPDATE items SET quantity = ?, updated_at = ? WHERE id = ?",
-        (new_quantity, now_iso(), item_id),
-    )
-    create_audit_event(
-        conn,
-        item_id,
-        current_user["username"],
-        "quantity_adjust",
-        changes=changes,
-        note=payload.note.strip() if payload.note else None,
-    )
-    conn.commit()
-    return get_item_response(conn, item_id)
+    def write(conn: sqlite3.Connection) -> Dict[str, Any]:
+        row = get_item_or_404(conn, item_id)
+        if not is_cable_category(row["category"]):
+            raise HTTPException(status_code=400, detail="Quantity adjustments are only available for cables")
+        if payload.delta == 0:
+            raise HTTPException(status_code=400, detail="No changes to apply")
+        old_quantity = int(row["quantity"] or 0)
+        new_quantity = old_quantity + payload.delta
+        if new_quantity < 0:
+            raise HTTPException(status_code=400, detail="Quantity cannot be negative")
+        changes = {"quantity": {"old": old_quantity, "new": new_quantity}}
+        conn.execute(
+            f"UPDATE items SET quantity = ?, updated_at = ?, change_seq = {NEXT_CHANGE_SEQ_SQL} WHERE id = ?",
+            (new_quantity, now_iso(), item_id),
+        )
+        create_audit_event(
+            conn,
+            item_id,
+            current_user["username"],
+            "quantity_adjust",
+            changes=changes,
+            note=payload.note.strip() if payload.note else None,
+        )
+        return get_item_response(conn, item_id)
+
+    return run_write(write)
+
+
+def apply_single_lifecycle_change(
+    item_id: int,
+    action: str,
+    actor: str,
+    note: Optional[str],
+    *,
+    assigned_user: Optional[str] = None,
+    zero_stock: bool = False,
+) -> Dict[str, Any]:
+    def write(conn: sqlite3.Connection) -> Dict[str, Any]:
+        row = get_item_or_404(conn, item_id)
+        plan = plan_lifecycle_change(row, action, assigned_user=assigned_user, zero_stock=zero_stock)
+        apply_lifecycle_changes(conn, [(item_id, plan)], actor=actor, action=action, note=note)
+        return get_item_response(conn, item_id)
+
+    return run_write(write)
 
 
 @router.post("/items/{item_id}/deploy")
 def deploy_item(
     item_id: int,
     payload: DeployRequest,
-    conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    row = get_item_or_404(conn, item_id)
-    if is_cable_category(row["category"]):
-        raise HTTPException(
-            status_code=400,
-            detail="Cable items do not use deploy/assigned user tracking",
-        )
-    if row["status"] == STATUS_RETIRED:
-        raise HTTPException(status_code=400, detail="Item is retired")
     assigned_user = title_case_words(require_nonempty(payload.assigned_user, "assigned_user"))
-    if row["status"] == STATUS_DEPLOYED and assigned_user == row["assigned_user"]:
-        raise HTTPException(status_code=400, detail="No changes to apply")
-    return apply_item_status_change(
-        conn=conn,
-        row=row,
-        item_id=item_id,
-        next_status=STATUS_DEPLOYED,
-        next_assigned_user=assigned_user,
-        actor=current_user["username"],
-        action="deploy",
-        note=payload.note,
+    return apply_single_lifecycle_change(
+        item_id,
+        "deploy",
+        current_user["username"],
+        payload.note,
+        assigned_user=assigned_user,
     )
 
 
@@ -365,86 +578,30 @@ def deploy_item(
 def return_item(
     item_id: int,
     payload: ReturnRequest,
-    conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    row = get_item_or_404(conn, item_id)
-    if row["status"] == STATUS_RETIRED:
-        raise HTTPException(status_code=400, detail="Item is retired")
-    if row["status"] == STATUS_IN_STOCK and row["assigned_user"] is None:
-        raise HTTPException(status_code=400, detail="Item already in stock")
-    return apply_item_status_change(
-        conn=conn,
-        row=row,
-        item_id=item_id,
-        next_status=STATUS_IN_STOCK,
-        next_assigned_user=None,
-        actor=current_user["username"],
-        action="return",
-        note=payload.note,
-        include_assigned_user_change=not is_cable_category(row["category"]),
-    )
+    return apply_single_lifecycle_change(item_id, "return", current_user["username"], payload.note)
 
 
 @router.post("/items/{item_id}/retire")
 def retire_item(
     item_id: int,
     payload: ReturnRequest,
-    conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    row = get_item_or_404(conn, item_id)
-    if row["status"] == STATUS_DEPLOYED and not is_cable_category(row["category"]):
-        raise HTTPException(status_code=400, detail="Item is deployed")
-    if row["status"] == STATUS_RETIRED:
-        raise HTTPException(status_code=400, detail="Item already retired")
-    is_cable = is_cable_category(row["category"])
-    old_quantity = int(row["quantity"] or 0)
-    should_zero_stock = is_cable and bool(payload.zero_stock) and old_quantity > 0
-    changes = {"status": {"old": row["status"], "new": STATUS_RETIRED}}
-    if not is_cable:
-        changes["assigned_user"] = {"old": row["assigned_user"], "new": None}
-    if should_zero_stock:
-        changes["quantity"] = {"old": old_quantity, "new": 0}
-        conn.execute(
-            "UPDATE items SET status = ?, assigned_user = ?, quantity = ?, updated_at = ? WHERE id = ?",
-            (STATUS_RETIRED, None, 0, now_iso(), item_id),
-        )
-    else:
-        conn.execute(
-            "UPDATE items SET status = ?, assigned_user = ?, updated_at = ? WHERE id = ?",
-            (STATUS_RETIRED, None, now_iso(), item_id),
-        )
-    create_audit_event(
-        conn,
+    return apply_single_lifecycle_change(
         item_id,
-        current_user["username"],
         "retire",
-        changes=changes,
-        note=payload.note,
+        current_user["username"],
+        payload.note,
+        zero_stock=bool(payload.zero_stock),
     )
-    conn.commit()
-    return get_item_response(conn, item_id)
 
 
 @router.post("/items/{item_id}/restore")
 def restore_item(
     item_id: int,
     payload: ReturnRequest,
-    conn: sqlite3.Connection = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    row = get_item_or_404(conn, item_id)
-    if row["status"] != STATUS_RETIRED:
-        raise HTTPException(status_code=400, detail="Item is not retired")
-    return apply_item_status_change(
-        conn=conn,
-        row=row,
-        item_id=item_id,
-        next_status=STATUS_IN_STOCK,
-        next_assigned_user=None,
-        actor=current_user["username"],
-        action="restore",
-        note=payload.note,
-        include_assigned_user_change=not is_cable_category(row["category"]),
-    )
+    return apply_single_lifecycle_change(item_id, "restore", current_user["username"], payload.note)
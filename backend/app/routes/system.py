@@ -0,0 +1,83 @@
+import sqlite3
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from ..core.compression import get_compression_stats
+from ..core.crypto import get_password_pool_stats
+from ..core.metrics import render_metrics
+from ..core.principal_cache import get_principal_cache_stats
+from ..core.security import require_admin
+from ..core.stream_tickets import stream_tickets
+from ..database.archive import (
+    AUDIT_RETENTION_DAYS,
+    archive_audit_events,
+    audit_archive_cutoff,
+    get_audit_archive_stats,
+)
+from ..database.db import get_db, request_connection, run_write
+from ..database.pool import get_pool_stats
+from ..database.slow_query import get_slow_query_stats
+from ..database.writer import get_write_queue_stats
+from ..services import get_event_stream_stats
+
+router = APIRouter()
+
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics")
+def metrics(current_user=Depends(require_admin)):
+    return PlainTextResponse(render_metrics(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+
+@router.get("/system/db-pool")
+def db_pool_stats(current_user=Depends(require_admin)):
+    return {"pool": get_pool_stats(), "writer": get_write_queue_stats()}
+
+
+@router.get("/system/principal-cache")
+def principal_cache_stats(current_user=Depends(require_admin)):
+    return {"principal_cache": get_principal_cache_stats()}
+
+
+@router.get("/system/password-pool")
+def password_pool_stats(current_user=Depends(require_admin)):
+    return {"password_pool": get_password_pool_stats()}
+
+
+@router.get("/system/event-stream")
+def event_stream_stats(current_user=Depends(require_admin)):
+    return {"event_stream": get_event_stream_stats(), "stream_tickets": stream_tickets.stats()}
+
+
+@router.get("/system/compression")
+def compression_stats(current_user=Depends(require_admin)):
+    return {"compression": get_compression_stats()}
+
+
+@router.get("/system/slow-queries")
+def slow_query_stats(current_user=Depends(require_admin)):
+    return {"slow_queries": get_slow_query_stats()}
+
+
+@router.get("/system/audit-archive")
+def audit_archive_stats(
+    conn: sqlite3.Connection = Depends(get_db),
+    current_user=Depends(require_admin),
+):
+    return {"audit_archive": get_audit_archive_stats(conn)}
+
+
+@router.post("/system/audit-archive")
+def run_audit_archive(
+    days: int = Query(AUDIT_RETENTION_DAYS, ge=0),
+    current_user=Depends(require_admin),
+):
+    try:
+        result = archive_audit_events(request_connection, run_write, audit_archive_cutoff(days))
+    except RuntimeError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    with request_connection() as conn:
+        return {**result, "audit_archive": get_audit_archive_stats(conn)}
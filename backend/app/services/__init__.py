@@ -1,17 +1,82 @@
-from .item_service import apply_item_status_change, build_history, get_item_or_404, get_item_response
+from .audit_service import AUDIT_CHANGE_FIELDS, fetch_assignee_history, fetch_field_history
+from .event_stream import (
+    EVENT_STREAM_HEARTBEAT_SECONDS,
+    close_event_stream,
+    event_broker,
+    format_event,
+    get_event_stream_stats,
+    load_event_backlog,
+)
+from .item_service import (
+    CHANGES_DEFAULT_LIMIT,
+    CHANGES_MAX_LIMIT,
+    HISTORY_DEFAULT_LIMIT,
+    HISTORY_MAX_LIMIT,
+    LIFECYCLE_ACTIONS,
+    apply_lifecycle_changes,
+    build_history,
+    category_history_scope,
+    fetch_category_history,
+    fetch_item_changes,
+    fetch_item_history,
+    get_item_or_404,
+    get_item_response,
+    insert_new_items,
+    item_history_scope,
+    new_item_changes,
+    normalize_service_tag,
+    plan_lifecycle_change,
+    prepare_new_item,
+)
+from .search_service import build_item_search_match, item_search_snippet_sql, render_search_snippet
+from .stats_service import fetch_item_stats
 from .user_service import (
+    USER_AUDIT_DEFAULT_LIMIT,
+    USER_AUDIT_MAX_LIMIT,
     can_reset_password,
+    fetch_user_audit_logs,
     get_user_by_id_or_404,
     get_user_by_username_or_404,
     serialize_user,
 )
 
 __all__ = [
-    "apply_item_status_change",
+    "AUDIT_CHANGE_FIELDS",
+    "fetch_assignee_history",
+    "fetch_field_history",
+    "EVENT_STREAM_HEARTBEAT_SECONDS",
+    "close_event_stream",
+    "event_broker",
+    "format_event",
+    "get_event_stream_stats",
+    "load_event_backlog",
+    "CHANGES_DEFAULT_LIMIT",
+    "CHANGES_MAX_LIMIT",
+    "HISTORY_DEFAULT_LIMIT",
+    "HISTORY_MAX_LIMIT",
+    "LIFECYCLE_ACTIONS",
+    "apply_lifecycle_changes",
     "build_history",
+    "category_history_scope",
+    "fetch_category_history",
+    "fetch_item_changes",
+    "fetch_item_history",
     "get_item_or_404",
     "get_item_response",
+    "insert_new_items",
+    "item_history_scope",
+    "new_item_changes",
+    "normalize_service_tag",
+    "plan_lifecycle_change",
+    "prepare_new_item",
+    "build_item_search_match",
+    "item_search_snippet_sql",
+    "render_search_snippet",
+    "fetch_item_stats",
+    "USER_AUDIT_DEFAULT_LIMIT",
+    "USER_AUDIT_MAX_LIMIT",
     "can_reset_password",
+    "fetch_user_audit_logs",
     "get_user_by_id_or_404",
     "get_user_by_username_or_404",
     "serialize_user",
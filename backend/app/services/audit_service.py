@@ -0,0 +1,138 @@
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException
+
+from ..common import decode_cursor, encode_cursor, tuple_cursor
+from ..database.archive import AUDIT_SCHEMAS
+
+AUDIT_CHANGE_FIELDS = (
+    "category",
+    "make",
+    "model",
+    "service_tag",
+    "quantity",
+    "row",
+    "note",
+    "status",
+    "assigned_user",
+)
+AUDIT_CHANGE_ENTRY_FIELDS = (
+    "event_id",
+    "item_id",
+    "field",
+    "old",
+    "new",
+    "timestamp",
+    "actor",
+    "action",
+    "item_label",
+)
+AUDIT_CHANGE_SELECT = """
+    SELECT audit_changes.event_id, audit_changes.item_id, audit_changes.field,
+           audit_changes.old_value, audit_changes.new_value, audit_changes.timestamp,
+           audit_events.actor, audit_events.action,
+           CASE WHEN items.id IS NULL THEN NULL ELSE items.make || ' (' || items.model || ')' END
+    FROM {schema}.audit_changes AS audit_changes
+    JOIN {schema}.audit_events AS audit_events ON audit_events.id = audit_changes.event_id
+    LEFT JOIN items ON items.id = audit_changes.item_id
+"""
+
+
+def _page_audit_changes(
+    conn: sqlite3.Connection,
+    filters: List[str],
+    params: List[Any],
+    scope: str,
+    limit: int,
+    cursor: Optional[str],
+) -> Dict[str, Any]:
+    after = decode_cursor(cursor, scope, 2)
+    filters = list(filters)
+    params = list(params)
+    if after is not None:
+        filters.append("(audit_changes.timestamp, audit_changes.event_id) < (?, ?)")
+        params.extend(after)
+    query = (
+        f"{AUDIT_CHANGE_SELECT} WHERE {' AND '.join(filters)}"
+        " ORDER BY audit_changes.timestamp DESC, audit_changes.event_id DESC LIMIT ?"
+    )
+    rows = []
+    for schema in AUDIT_SCHEMAS:
+        rows.extend(tuple_cursor(conn, query.format(schema=schema), params + [limit + 1]).fetchall())
+    rows.sort(key=lambda row: (row[5], row[0]), reverse=True)
+    rows = rows[: limit + 1]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, [rows[-1][5], rows[-1][0]])
+    return {
+        "changes": [dict(zip(AUDIT_CHANGE_ENTRY_FIELDS, row)) for row in rows],
+        "next_cursor": next_cursor,
+    }
+
+
+def fetch_assignee_history(
+    conn: sqlite3.Connection,
+    assignee: str,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    page = _page_audit_changes(
+        conn,
+        [
+            "audit_changes.field = 'assigned_user'",
+            """
+            audit_changes.event_id IN (
+                SELECT event_id FROM {schema}.audit_changes WHERE field = 'assigned_user' AND new_value = ?
+                UNION ALL
+                SELECT event_id FROM {schema}.audit_changes WHERE field = 'assigned_user' AND old_value = ?
+            )
+            """,
+        ],
+        [assignee, assignee],
+        f"audit:assignee:{assignee.lower()}",
+        limit,
+        cursor,
+    )
+    for change in page["changes"]:
+        change["assigned"] = isinstance(change["new"], str) and change["new"].lower() == assignee.lower()
+    items = conn.execute(
+        " UNION ".join(
+            f"SELECT item_id FROM {schema}.audit_changes WHERE field = 'assigned_user' AND new_value = ?"
+            for schema in AUDIT_SCHEMAS
+        )
+        + " ORDER BY item_id ASC",
+        [assignee] * len(AUDIT_SCHEMAS),
+    ).fetchall()
+    return {"assignee": assignee, "item_ids": [row["item_id"] for row in items], **page}
+
+
+def fetch_field_history(
+    conn: sqlite3.Connection,
+    field: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    item_id: Optional[int] = None,
+    value: Optional[str] = None,
+) -> Dict[str, Any]:
+    if field not in AUDIT_CHANGE_FIELDS:
+        raise HTTPException(status_code=400, detail=f"field must be one of: {', '.join(AUDIT_CHANGE_FIELDS)}")
+    filters = ["audit_changes.field = ?"]
+    params: List[Any] = [field]
+    if item_id is not None:
+        filters.append("audit_changes.item_id = ?")
+        params.append(item_id)
+    if value is not None:
+        filters.append("(audit_changes.new_value = ? OR audit_changes.old_value = ?)")
+        params.extend([value, value])
+    if since:
+        filters.append("audit_changes.timestamp >= ?")
+        params.append(since)
+    if until:
+        filters.append("audit_changes.timestamp < ?")
+        params.append(until)
+    scope = f"audit:field:{field}:{item_id}:{value}:{since}:{until}"
+    return {"field": field, **_page_audit_changes(conn, filters, params, scope, limit, cursor)}
@@ -0,0 +1,174 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from ..common import dumps_json, row_to_item
+from ..database.db import db_connection
+from ..database.writer import add_commit_listener
+from .item_service import build_history
+
+EVENT_STREAM_BUFFER = int(os.getenv("STOCKROOM_EVENT_STREAM_BUFFER", "256"))
+EVENT_STREAM_HEARTBEAT_SECONDS = float(os.getenv("STOCKROOM_EVENT_STREAM_HEARTBEAT", "15"))
+EVENT_STREAM_POLL_SECONDS = float(os.getenv("STOCKROOM_EVENT_STREAM_POLL", "2"))
+EVENT_STREAM_BACKFILL_LIMIT = int(os.getenv("STOCKROOM_EVENT_STREAM_BACKFILL", "1000"))
+EVENT_STREAM_BATCH_SIZE = 500
+
+
+def fetch_item_events(conn: sqlite3.Connection, after_id: int, limit: int) -> List[Dict[str, Any]]:
+    events = conn.execute(
+        "SELECT * FROM audit_events WHERE id > ? ORDER BY id ASC LIMIT ?",
+        (after_id, limit),
+    ).fetchall()
+    if not events:
+        return []
+    item_ids = sorted({event["item_id"] for event in events})
+    items = {
+        row["id"]: row_to_item(row)
+        for row in conn.execute(
+            "SELECT * FROM items WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(item_ids),),
+        ).fetchall()
+    }
+    payloads = build_history(events)
+    for payload, event in zip(payloads, events):
+        payload["item_id"] = event["item_id"]
+        payload["item"] = items.get(event["item_id"])
+    return payloads
+
+
+def format_event(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines.append(f"data: {dumps_json(data).decode('utf-8')}")
+    return "\n".join(lines) + "\n\n"
+
+
+class Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, buffer_size: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(maxsize=buffer_size + 1)
+        self.buffer_size = buffer_size
+        self.overflowed = False
+
+    def offer(self, events: List[Dict[str, Any]]) -> None:
+        for event in events:
+            if self.overflowed:
+                return
+            if self.queue.qsize() >= self.buffer_size:
+                self.overflowed = True
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+                self.queue.put_nowait(None)
+                return
+            self.queue.put_nowait(event)
+
+
+class EventBroker:
+    def __init__(self, buffer_size: int = EVENT_STREAM_BUFFER, poll_seconds: float = EVENT_STREAM_POLL_SECONDS):
+        self.buffer_size = max(1, buffer_size)
+        self.poll_seconds = poll_seconds
+        self._subscribers: Set[Subscriber] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._last_id = 0
+        self._stats = {"connections": 0, "published": 0, "delivered": 0, "overflows": 0, "errors": 0}
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> Subscriber:
+        subscriber = Subscriber(loop, self.buffer_size)
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                add_commit_listener(self.notify)
+                self._thread = threading.Thread(target=self._run, name="stockroom-event-stream", daemon=True)
+                self._thread.start()
+            self._subscribers.add(subscriber)
+            self._stats["connections"] += 1
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            if subscriber.overflowed:
+                self._stats["overflows"] += 1
+
+    def notify(self) -> None:
+        self._wake.set()
+
+    def close(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+        self._wake.set()
+        if thread is not None:
+            thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "subscribers": len(self._subscribers),
+                "buffer_size": self.buffer_size,
+                "last_event_id": self._last_id,
+            }
+
+    def _publish(self, events: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._stats["published"] += len(events)
+            self._stats["delivered"] += len(events) * len(subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.offer, events)
+            except RuntimeError:
+                self.unsubscribe(subscriber)
+
+    def _poll(self, skip_existing: bool = False) -> None:
+        with db_connection() as conn:
+            if skip_existing or not self._subscribers:
+                row = conn.execute("SELECT MAX(id) FROM audit_events").fetchone()
+                self._last_id = row[0] or 0
+                return
+            while True:
+                events = fetch_item_events(conn, self._last_id, EVENT_STREAM_BATCH_SIZE)
+                if not events:
+                    return
+                self._last_id = events[-1]["id"]
+                self._publish(events)
+                if len(events) < EVENT_STREAM_BATCH_SIZE:
+                    return
+
+    def _run(self) -> None:
+        skip_existing = True
+        while not self._stopping:
+            self._wake.clear()
+            try:
+                self._poll(skip_existing)
+                skip_existing = False
+            except Exception:
+                with self._lock:
+                    self._stats["errors"] += 1
+            self._wake.wait(self.poll_seconds)
+
+
+event_broker = EventBroker()
+
+
+def load_event_backlog(after_id: int) -> Optional[List[Dict[str, Any]]]:
+    with db_connection() as conn:
+        events = fetch_item_events(conn, after_id, EVENT_STREAM_BACKFILL_LIMIT + 1)
+    if len(events) > EVENT_STREAM_BACKFILL_LIMIT:
+        return None
+    return events
+
+
+def close_event_stream() -> None:
+    event_broker.close()
+
+
+def get_event_stream_stats() -> Dict[str, Any]:
+    return event_broker.stats()
@@ -1,10 +1,125 @@
 import json
 import sqlite3
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import HTTPException
 
-from ..common import create_audit_event, now_iso, row_to_item
+from ..common import (
+    cable_signature_keys,
+    capitalize_first,
+    column_index,
+    create_audit_events,
+    decode_cursor,
+    encode_cursor,
+    history_serializer,
+    is_cable_category,
+    item_serializer,
+    normalize_cable_ends,
+    normalize_cable_length,
+    now_iso,
+    require_nonempty,
+    row_to_item,
+    tuple_cursor,
+)
+from ..core.constants import STATUS_DEPLOYED, STATUS_IN_STOCK, STATUS_RETIRED
+from ..database.archive import AUDIT_SCHEMAS
+from ..database.data_version import NEXT_CHANGE_SEQ_SQL
+from ..models import ItemCreate
+
+
+def normalize_service_tag(category: str, value: Optional[str]) -> str:
+    if value is None:
+        if is_cable_category(category):
+            return "N/A"
+        raise HTTPException(status_code=400, detail="service_tag is required")
+    cleaned = value.strip()
+    if cleaned:
+        return cleaned
+    if is_cable_category(category):
+        return "N/A"
+    raise HTTPException(status_code=400, detail="service_tag is required")
+
+
+def prepare_new_item(payload: ItemCreate) -> Dict[str, Any]:
+    category = capitalize_first(require_nonempty(payload.category, "category"))
+    make = require_nonempty(payload.make, "make")
+    model = require_nonempty(payload.model, "model")
+    if is_cable_category(category):
+        make = normalize_cable_ends(make)
+        model = normalize_cable_length(model)
+    return {
+        "category": category,
+        "make": make,
+        "model": model,
+        "service_tag": normalize_service_tag(category, payload.service_tag),
+        "quantity": 0 if is_cable_category(category) else 1,
+        "row": payload.row.strip() if payload.row else None,
+        "note": payload.note.strip() if payload.note else None,
+    }
+
+
+def new_item_changes(item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    changes = {
+        "category": {"old": None, "new": item["category"]},
+        "make": {"old": None, "new": item["make"]},
+        "model": {"old": None, "new": item["model"]},
+        "service_tag": {"old": None, "new": item["service_tag"]},
+        "quantity": {"old": None, "new": item["quantity"]},
+        "row": {"old": None, "new": item["row"]},
+        "note": {"old": None, "new": item["note"]},
+        "status": {"old": None, "new": STATUS_IN_STOCK},
+    }
+    if not is_cable_category(item["category"]):
+        changes["assigned_user"] = {"old": None, "new": None}
+    return changes
+
+
+def insert_new_items(conn: sqlite3.Connection, items: List[Dict[str, Any]], actor: str) -> List[int]:
+    if not items:
+        return []
+    created_at = now_iso()
+    last_id = conn.execute(
+        """
+        SELECT MAX(
+            COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'items'), 0),
+            COALESCE((SELECT MAX(id) FROM items), 0)
+        )
+        """
+    ).fetchone()[0]
+    item_ids = list(range(last_id + 1, last_id + 1 + len(items)))
+    conn.executemany(
+        f"""
+        INSERT INTO items (
+            id, category, make, model, service_tag, quantity, row, note, status, assigned_user,
+            created_at, created_by, updated_at, cable_ends_key, cable_length_key, change_seq
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {NEXT_CHANGE_SEQ_SQL})
+        """,
+        [
+            (
+                item_id,
+                item["category"],
+                item["make"],
+                item["model"],
+                item["service_tag"],
+                item["quantity"],
+                item["row"],
+                item["note"],
+                STATUS_IN_STOCK,
+                None,
+                created_at,
+                actor,
+                created_at,
+                *cable_signature_keys(item["category"], item["make"], item["model"]),
+            )
+            for item_id, item in zip(item_ids, items)
+        ],
+    )
+    create_audit_events(
+        conn,
+        [(item_id, actor, "add", new_item_changes(item), None) for item_id, item in zip(item_ids, items)],
+        timestamp=created_at,
+    )
+    return item_ids
 
 
 def get_item_or_404(conn: sqlite3.Connection, item_id: int) -> sqlite3.Row:
@@ -18,48 +133,257 @@ def get_item_response(conn: sqlite3.Connection, item_id: int) -> Dict[str, Any]:
     return {"item": row_to_item(get_item_or_404(conn, item_id))}
 
 
-def apply_item_status_change(
-    conn: sqlite3.Connection,
+LIFECYCLE_ACTIONS = ("deploy", "return", "retire", "restore")
+
+
+def plan_lifecycle_change(
     row: sqlite3.Row,
-    *,
-    item_id: int,
-    next_status: str,
-    next_assigned_user: Optional[str],
-    actor: str,
     action: str,
-    note: Optional[str],
-    include_assigned_user_change: bool = True,
+    *,
+    assigned_user: Optional[str] = None,
+    zero_stock: bool = False,
 ) -> Dict[str, Any]:
+    is_cable = is_cable_category(row["category"])
+    old_quantity = int(row["quantity"] or 0)
+    next_quantity = old_quantity
+    include_assigned_user_change = not is_cable
+    if action == "deploy":
+        if is_cable:
+            raise HTTPException(
+                status_code=400,
+                detail="Cable items do not use deploy/assigned user tracking",
+            )
+        if row["status"] == STATUS_RETIRED:
+            raise HTTPException(status_code=400, detail="Item is retired")
+        if row["status"] == STATUS_DEPLOYED and assigned_user == row["assigned_user"]:
+            raise HTTPException(status_code=400, detail="No changes to apply")
+        next_status, next_assigned_user = STATUS_DEPLOYED, assigned_user
+    elif action == "return":
+        if row["status"] == STATUS_RETIRED:
+            raise HTTPException(status_code=400, detail="Item is retired")
+        if row["status"] == STATUS_IN_STOCK and row["assigned_user"] is None:
+            raise HTTPException(status_code=400, detail="Item already in stock")
+        next_status, next_assigned_user = STATUS_IN_STOCK, None
+    elif action == "retire":
+        if row["status"] == STATUS_DEPLOYED and not is_cable:
+            raise HTTPException(status_code=400, detail="Item is deployed")
+        if row["status"] == STATUS_RETIRED:
+            raise HTTPException(status_code=400, detail="Item already retired")
+        next_status, next_assigned_user = STATUS_RETIRED, None
+        if is_cable and zero_stock and old_quantity > 0:
+            next_quantity = 0
+    elif action == "restore":
+        if row["status"] != STATUS_RETIRED:
+            raise HTTPException(status_code=400, detail="Item is not retired")
+        next_status, next_assigned_user = STATUS_IN_STOCK, None
+    else:
+        raise HTTPException(status_code=400, detail="Invalid item action")
     changes = {"status": {"old": row["status"], "new": next_status}}
     if include_assigned_user_change:
         changes["assigned_user"] = {"old": row["assigned_user"], "new": next_assigned_user}
-    conn.execute(
-        "UPDATE items SET status = ?, assigned_user = ?, updated_at = ? WHERE id = ?",
-        (next_status, next_assigned_user, now_iso(), item_id),
+    if next_quantity != old_quantity:
+        changes["quantity"] = {"old": old_quantity, "new": next_quantity}
+    return {
+        "status": next_status,
+        "assigned_user": next_assigned_user,
+        "quantity": next_quantity,
+        "changes": changes,
+    }
+
+
+def apply_lifecycle_changes(
+    conn: sqlite3.Connection,
+    planned: List[Tuple[int, Dict[str, Any]]],
+    *,
+    actor: str,
+    action: str,
+    note: Optional[str],
+) -> None:
+    updated_at = now_iso()
+    conn.executemany(
+        "UPDATE items SET status = ?, assigned_user = ?, quantity = ?, updated_at = ?, "
+        f"change_seq = {NEXT_CHANGE_SEQ_SQL} WHERE id = ?",
+        [
+            (plan["status"], plan["assigned_user"], plan["quantity"], updated_at, item_id)
+            for item_id, plan in planned
+        ],
     )
-    create_audit_event(
+    create_audit_events(
         conn,
-        item_id,
-        actor,
-        action,
-        changes=changes,
-        note=note,
+        [(item_id, actor, action, plan["changes"], note) for item_id, plan in planned],
+        timestamp=updated_at,
     )
-    conn.commit()
-    return get_item_response(conn, item_id)
 
 
 def build_history(events: List[sqlite3.Row]) -> List[Dict[str, Any]]:
-    history = []
-    for event in events:
-        history.append(
-            {
-                "id": event["id"],
-                "actor": event["actor"],
-                "timestamp": event["timestamp"],
-                "action": event["action"],
-                "changes": json.loads(event["changes"]) if event["changes"] else None,
-                "note": event["note"],
-            }
+    loads = json.loads
+    return [
+        {
+            "id": event["id"],
+            "actor": event["actor"],
+            "timestamp": event["timestamp"],
+            "action": event["action"],
+            "changes": loads(event["changes"]) if event["changes"] else None,
+            "note": event["note"],
+        }
+        for event in events
+    ]
+
+
+HISTORY_DEFAULT_LIMIT = 100
+HISTORY_MAX_LIMIT = 500
+
+
+def item_history_scope(item_id: int) -> str:
+    return f"history:item:{item_id}"
+
+
+def category_history_scope(category: str) -> str:
+    return f"history:category:{category.lower()}"
+
+
+def _page_audit_events(
+    conn: sqlite3.Connection,
+    query: str,
+    params: List[Any],
+    scope: str,
+    limit: int,
+    cursor: Optional[str],
+    extra: Optional[Dict[str, str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    after = decode_cursor(cursor, scope, 1)
+    if after is not None:
+        query += " AND audit_events.id < ?"
+        params = params + [after[0]]
+    query += " ORDER BY audit_events.id DESC LIMIT ?"
+    history: List[Dict[str, Any]] = []
+    for schema in AUDIT_SCHEMAS:
+        events_cursor = tuple_cursor(
+            conn,
+            query.format(audit_events=f"{schema}.audit_events"),
+            params + [limit + 1 - len(history)],
         )
-    return history
+        serialize = history_serializer(events_cursor.description, extra)
+        history.extend(serialize(row) for row in events_cursor.fetchall())
+        if len(history) > limit:
+            break
+    next_cursor = None
+    if len(history) > limit:
+        history = history[:limit]
+        next_cursor = encode_cursor(scope, [history[-1]["id"]])
+    return history, next_cursor
+
+
+def fetch_item_history(
+    conn: sqlite3.Connection,
+    item_id: int,
+    limit: int = HISTORY_DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    history, next_cursor = _page_audit_events(
+        conn,
+        "SELECT * FROM {audit_events} AS audit_events WHERE item_id = ?",
+        [item_id],
+        item_history_scope(item_id),
+        limit,
+        cursor,
+    )
+    return {"history": history, "next_cursor": next_cursor}
+
+
+def fetch_category_history(
+    conn: sqlite3.Connection,
+    category: str,
+    limit: int = HISTORY_DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    history, next_cursor = _page_audit_events(
+        conn,
+        """
+        SELECT audit_events.*, items.make AS item_make, items.model AS item_model
+        FROM {audit_events} AS audit_events
+        JOIN items ON items.id = audit_events.item_id
+        WHERE lower(items.category) = lower(?)
+        """,
+        [category],
+        category_history_scope(category),
+        limit,
+        cursor,
+        {"item_id": "item_id", "item_make": "item_make", "item_model": "item_model"},
+    )
+    for entry in history:
+        entry["item_label"] = f'{entry.pop("item_make")} ({entry.pop("item_model")})'.strip()
+    return {"history": history, "next_cursor": next_cursor}
+
+
+CHANGES_DEFAULT_LIMIT = 500
+CHANGES_MAX_LIMIT = 5000
+
+
+def fetch_item_changes(
+    conn: sqlite3.Connection,
+    since: Optional[str],
+    limit: int = CHANGES_DEFAULT_LIMIT,
+) -> Dict[str, Any]:
+    conn.execute("BEGIN")
+    try:
+        state = conn.execute("SELECT epoch, version FROM data_version WHERE id = 1").fetchone()
+        epoch, version = state["epoch"], state["version"]
+        after = decode_cursor(since, "items:changes", 3)
+        if after is not None and after[0] != epoch:
+            raise HTTPException(status_code=410, detail="Cursor is from another database, reload all items")
+        after_seq, after_id = (after[1], after[2]) if after is not None else (None, None)
+        if after_seq is None:
+            position, position_params = "", []
+        elif after_id is None:
+            position, position_params = "WHERE change_seq > ?", [after_seq]
+        else:
+            position = "WHERE change_seq > ? OR (change_seq = ? AND {id} > ?)"
+            position_params = [after_seq, after_seq, after_id]
+
+        items_cursor = tuple_cursor(
+            conn,
+            f"SELECT * FROM items {position.format(id='id')} ORDER BY change_seq ASC, id ASC LIMIT ?",
+            position_params + [limit + 1],
+        )
+        columns = column_index(items_cursor.description)
+        serialize = item_serializer(items_cursor.description)
+        seq_index, id_index = columns["change_seq"], columns["id"]
+        items = [(row[seq_index], row[id_index], serialize(row), False) for row in items_cursor.fetchall()]
+        tombstones: List[sqlite3.Row] = []
+        if after is not None:
+            tombstones = conn.execute(
+                f"""
+                SELECT * FROM item_tombstones {position.format(id='item_id')}
+                ORDER BY change_seq ASC, item_id ASC LIMIT ?
+                """,
+                position_params + [limit + 1],
+            ).fetchall()
+    finally:
+        conn.rollback()
+
+    changes = sorted(
+        items
+        + [
+            (
+                row["change_seq"],
+                row["item_id"],
+                {"id": row["item_id"], "merged_into": row["merged_into"], "deleted_at": row["deleted_at"]},
+                True,
+            )
+            for row in tombstones
+        ],
+        key=lambda change: (change[0], change[1]),
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if has_more:
+        next_cursor = encode_cursor("items:changes", [epoch, changes[-1][0], changes[-1][1]])
+    else:
+        next_cursor = encode_cursor("items:changes", [epoch, version, None])
+    return {
+        "items": [change for _, _, change, deleted in changes if not deleted],
+        "deleted": [change for _, _, change, deleted in changes if deleted],
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+    }
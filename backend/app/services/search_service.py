@@ -0,0 +1,34 @@
+import html
+import re
+from typing import Optional
+
+SEARCH_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+SEARCH_HIGHLIGHT_OPEN = "<mark>"
+SEARCH_HIGHLIGHT_CLOSE = "</mark>"
+SEARCH_MARKER_OPEN = "\x02"
+SEARCH_MARKER_CLOSE = "\x03"
+SEARCH_SNIPPET_TOKENS = 8
+
+
+def build_item_search_match(q: Optional[str]) -> Optional[str]:
+    tokens = SEARCH_TOKEN_PATTERN.findall((q or "").lower())
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def item_search_snippet_sql() -> str:
+    return (
+        f"snippet(items_fts, -1, char({ord(SEARCH_MARKER_OPEN)}), char({ord(SEARCH_MARKER_CLOSE)}), "
+        f"'...', {SEARCH_SNIPPET_TOKENS})"
+    )
+
+
+def render_search_snippet(snippet: Optional[str]) -> Optional[str]:
+    if snippet is None:
+        return None
+    return (
+        html.escape(snippet)
+        .replace(SEARCH_MARKER_OPEN, SEARCH_HIGHLIGHT_OPEN)
+        .replace(SEARCH_MARKER_CLOSE, SEARCH_HIGHLIGHT_CLOSE)
+    )
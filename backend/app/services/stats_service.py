@@ -0,0 +1,61 @@
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+from ..core.constants import STATUS_DEPLOYED, STATUS_IN_STOCK, STATUS_RETIRED
+
+STATUS_STAT_KEYS = {
+    STATUS_IN_STOCK: "in_stock",
+    STATUS_DEPLOYED: "deployed",
+    STATUS_RETIRED: "retired",
+}
+
+
+def _empty_counts() -> Dict[str, int]:
+    return {"items": 0, "count": 0, "in_stock": 0, "deployed": 0, "retired": 0}
+
+
+def fetch_item_stats(
+    conn: sqlite3.Connection,
+    category: Optional[str] = None,
+    include_models: bool = False,
+) -> Dict[str, Any]:
+    query = "SELECT category, status, make, model, item_count, unit_count FROM item_rollup"
+    params: List[Any] = []
+    if category:
+        query += " WHERE lower(category) = lower(?)"
+        params.append(category)
+    query += " ORDER BY category ASC, make ASC, model ASC, status ASC"
+    rows = conn.execute(query, params).fetchall()
+
+    totals = _empty_counts()
+    categories: Dict[str, Dict[str, int]] = {}
+    models: List[Dict[str, Any]] = []
+    for row in rows:
+        status_key = STATUS_STAT_KEYS.get(row["status"])
+        for counts in (totals, categories.setdefault(row["category"], _empty_counts())):
+            counts["items"] += row["item_count"]
+            counts["count"] += row["unit_count"]
+            if status_key:
+                counts[status_key] += row["unit_count"]
+        if include_models:
+            models.append(
+                {
+                    "category": row["category"],
+                    "make": row["make"],
+                    "model": row["model"],
+                    "status": row["status"],
+                    "items": row["item_count"],
+                    "count": row["unit_count"],
+                }
+            )
+
+    response: Dict[str, Any] = {
+        "totals": totals,
+        "categories": [
+            {"category": name, **counts}
+            for name, counts in sorted(categories.items(), key=lambda entry: entry[0].lower())
+        ],
+    }
+    if include_models:
+        response["models"] = models
+    return response
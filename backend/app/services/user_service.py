@@ -1,8 +1,13 @@
 import sqlite3
+from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException
 
-from ..common import require_nonempty
+from ..common import decode_cursor, encode_cursor, require_nonempty, tuple_cursor
+
+USER_AUDIT_DEFAULT_LIMIT = 100
+USER_AUDIT_MAX_LIMIT = 1000
+USER_AUDIT_FIELDS = ("id", "actor", "target_user", "timestamp", "action", "details", "old_value", "new_value")
 
 
 def serialize_user(row: sqlite3.Row):
@@ -40,3 +45,51 @@ def can_reset_password(actor: sqlite3.Row, target: sqlite3.Row) -> bool:
     if actor["role"] == "admin":
         return target["username"] == actor["username"] or target["role"] == "user"
     return target["username"] == actor["username"]
+
+
+def fetch_user_audit_logs(
+    conn: sqlite3.Connection,
+    limit: int = USER_AUDIT_DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    actor: Optional[str] = None,
+    target_user: Optional[str] = None,
+    action: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
+    filters: List[str] = []
+    params: List[Any] = []
+    if actor:
+        filters.append("lower(actor) = ?")
+        params.append(actor.lower())
+    if target_user:
+        filters.append("lower(target_user) = ?")
+        params.append(target_user.lower())
+    if action:
+        filters.append("action = ?")
+        params.append(action)
+    if since:
+        filters.append("timestamp >= ?")
+        params.append(since)
+    if until:
+        filters.append("timestamp < ?")
+        params.append(until)
+    scope = f"user-audit:{(actor or '').lower()}:{(target_user or '').lower()}:{action}:{since}:{until}"
+    after = decode_cursor(cursor, scope, 2)
+    if after is not None:
+        filters.append("(timestamp, id) < (?, ?)")
+        params.extend(after)
+    where = f"WHERE {' AND '.join(filters)}" if filters else ""
+    rows = tuple_cursor(
+        conn,
+        f"""
+        SELECT {', '.join(USER_AUDIT_FIELDS)} FROM user_audit_logs {where}
+        ORDER BY timestamp DESC, id DESC LIMIT ?
+        """,
+        params + [limit + 1],
+    ).fetchall()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(scope, [rows[-1][3], rows[-1][0]])
+    return {"logs": [dict(zip(USER_AUDIT_FIELDS, row)) for row in rows], "next_cursor": next_cursor}
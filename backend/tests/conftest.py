@@ -0,0 +1,69 @@
+import os
+import secrets
+import sqlite3
+import tempfile
+
+os.environ.setdefault("STOCKROOM_PASSWORD_WORKERS", "0")
+os.environ.setdefault("STOCKROOM_DB_POOL_SIZE", "2")
+os.environ.setdefault("STOCKROOM_DB_POOL_TIMEOUT", "2")
+os.environ.setdefault("STOCKROOM_DB_PATH", os.path.join(tempfile.mkdtemp(prefix="stockroom-tests-"), "app.db"))
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.principal_cache import principal_cache
+from app.core.security import create_access_token
+from app.database import db
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("template") / "app.db")
+    original = db.DB_PATH
+    db.DB_PATH = path
+    try:
+        db.init_db()
+    finally:
+        db.close_db()
+        db.DB_PATH = original
+    return path
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "app.db")
+    monkeypatch.setattr(db, "DB_PATH", path)
+    principal_cache.invalidate()
+    yield path
+    db.close_db()
+
+
+@pytest.fixture
+def seeded_db(db_path, template_db):
+    source = sqlite3.connect(template_db)
+    target = sqlite3.connect(db_path)
+    try:
+        source.backup(target)
+        target.execute("UPDATE data_version SET epoch = ? WHERE id = 1", (secrets.token_hex(4),))
+        target.commit()
+    finally:
+        source.close()
+        target.close()
+    return db_path
+
+
+def bearer_headers(username: str) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': username})}"}
+
+
+@pytest.fixture
+def auth_headers():
+    return bearer_headers
+
+
+@pytest.fixture
+def client(seeded_db):
+    with TestClient(app) as client:
+        client.headers.update(bearer_headers("owner"))
+        yield client
@@ -0,0 +1,63 @@
+import json
+
+from app.database import db
+
+OLD_TIMESTAMP = "2001-02-03T04:05:06"
+
+
+def age_audit_history():
+    def write(conn):
+        conn.execute("UPDATE audit_events SET timestamp = ?", (OLD_TIMESTAMP,))
+        conn.execute("UPDATE audit_changes SET timestamp = ?", (OLD_TIMESTAMP,))
+        return conn.execute("SELECT COUNT(*) FROM audit_events").fetchone()[0]
+
+    return db.run_write(write)
+
+
+def test_archived_events_stay_readable(client):
+    assert client.post("/api/items/1/deploy", json={"assigned_user": "Robin Vale"}).status_code == 200
+    assert client.post("/api/items/1/return", json={}).status_code == 200
+    history_before = client.get("/api/items/1/history", params={"limit": 100}).json()["history"]
+    aged = age_audit_history()
+
+    response = client.post("/api/system/audit-archive", params={"days": 365})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["archived"] == aged
+    assert body["audit_archive"]["archive"]["events"] == aged
+    assert client.post("/api/system/audit-archive", params={"days": 365}).json()["archived"] == 0
+
+    history_after = client.get("/api/items/1/history", params={"limit": 100}).json()["history"]
+    assert [entry["id"] for entry in history_after] == [entry["id"] for entry in history_before]
+    assignee = client.get("/api/audit/assignees/Robin Vale").json()
+    assert assignee["item_ids"] == [1]
+    assert len(assignee["changes"]) == 2
+    exported = client.get("/api/export/audit-events").text.splitlines()
+    exported_ids = {json.loads(line)["id"] for line in exported}
+    assert {entry["id"] for entry in history_before} <= exported_ids
+
+
+def test_new_events_after_archival_page_across_both_files(client):
+    assert client.post("/api/items/1/deploy", json={"assigned_user": "Robin Vale"}).status_code == 200
+    age_audit_history()
+    assert client.post("/api/system/audit-archive", params={"days": 365}).json()["archived"] > 0
+    assert client.post("/api/items/1/return", json={}).status_code == 200
+    full = client.get("/api/items/1/history", params={"limit": 100}).json()["history"]
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/items/1/history", params=params).json()
+        seen.extend(entry["id"] for entry in page["history"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [entry["id"] for entry in full]
+    assert full[0]["action"] == "return"
+
+
+def test_archival_requires_admin(client, auth_headers):
+    response = client.post("/api/system/audit-archive", headers=auth_headers("user"))
+    assert response.status_code == 403
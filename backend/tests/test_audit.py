@@ -0,0 +1,52 @@
+def collect(client, path, limit=1, **params):
+    entries = []
+    cursor = None
+    while True:
+        page_params = {"limit": limit, **params}
+        if cursor:
+            page_params["cursor"] = cursor
+        response = client.get(path, params=page_params)
+        assert response.status_code == 200
+        page = response.json()
+        entries.extend(page["changes"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return entries
+
+
+def test_assignee_history_follows_items(client):
+    assert client.post("/api/items/1/deploy", json={"assigned_user": "Jamie Fox"}).status_code == 200
+    assert client.post("/api/items/1/return", json={}).status_code == 200
+    assert client.post("/api/items/3/deploy", json={"assigned_user": "jamie fox"}).status_code == 200
+    body = client.get("/api/audit/assignees/Jamie Fox").json()
+    assert body["item_ids"] == [1, 3]
+    assert [(change["item_id"], change["assigned"]) for change in body["changes"]] == [
+        (3, True),
+        (1, False),
+        (1, True),
+    ]
+    paged = collect(client, "/api/audit/assignees/jamie fox")
+    assert [change["event_id"] for change in paged] == [change["event_id"] for change in body["changes"]]
+    assert client.get("/api/audit/assignees/Nobody Here").json()["changes"] == []
+
+
+def test_field_history_filters(client):
+    assert client.post("/api/items/1/deploy", json={"assigned_user": "Jamie Fox"}).status_code == 200
+    assert client.post("/api/items/1/return", json={}).status_code == 200
+    assert client.put("/api/items/1", json={"row": "Z9"}).status_code == 200
+    statuses = collect(client, "/api/audit/fields/status", item_id=1)
+    assert [(change["old"], change["new"]) for change in statuses[:2]] == [
+        ("Deployed", "In Stock"),
+        ("In Stock", "Deployed"),
+    ]
+    assert all(change["item_id"] == 1 for change in statuses)
+    deployed = collect(client, "/api/audit/fields/status", limit=50, value="deployed")
+    assert all("Deployed" in (change["old"], change["new"]) for change in deployed)
+    rows = collect(client, "/api/audit/fields/row", item_id=1)
+    assert rows[0]["new"] == "Z9"
+    assert collect(client, "/api/audit/fields/status", item_id=1, until="2000-01-01T00:00:00") == []
+
+
+def test_field_history_rejects_unknown_fields(client):
+    assert client.get("/api/audit/fields/password_hash").status_code == 400
+    assert client.get("/api/audit/fields/status", params={"since": "yesterday"}).status_code == 400
@@ -0,0 +1,46 @@
+from app.core import security
+from app.database import db
+from app.database.pool import get_pool
+from app.routes import users
+
+
+def connections_in_use():
+    return get_pool(db.DB_PATH).stats()["in_use"]
+
+
+def test_login_issues_a_token(client):
+    response = client.post("/api/token", data={"username": "Owner", "password": "owner"})
+    assert response.status_code == 200
+    token = response.json()["access_token"]
+    assert client.get("/api/me", headers={"Authorization": f"Bearer {token}"}).json()["username"] == "owner"
+    assert client.post("/api/token", data={"username": "owner", "password": "wrong"}).status_code == 401
+    assert client.post("/api/token", data={"username": "nobody", "password": "owner"}).status_code == 401
+
+
+def test_login_verifies_without_holding_a_connection(client, monkeypatch):
+    observed = []
+    verify = security.verify_password
+
+    def checked_verify(password, password_hash):
+        observed.append(connections_in_use())
+        return verify(password, password_hash)
+
+    monkeypatch.setattr(security, "verify_password", checked_verify)
+    assert client.post("/api/token", data={"username": "owner", "password": "owner"}).status_code == 200
+    assert observed == [0]
+
+
+def test_password_reset_hashes_without_holding_a_connection(client, monkeypatch):
+    observed = []
+    hash_password = users.hash_password
+
+    def checked_hash(password):
+        observed.append(connections_in_use())
+        return hash_password(password)
+
+    monkeypatch.setattr(users, "hash_password", checked_hash)
+    response = client.put("/api/users/user/reset-password", json={"new_password": "changed"})
+    assert response.status_code == 200
+    assert observed == [0]
+    assert client.post("/api/token", data={"username": "user", "password": "changed"}).status_code == 200
+    assert client.put("/api/users/ghost/reset-password", json={"new_password": "x"}).status_code == 404
@@ -0,0 +1,44 @@
+def item(client, item_id):
+    return client.get(f"/api/items/{item_id}", params={"history_limit": 100}).json()
+
+
+def test_best_effort_applies_what_it_can(client):
+    response = client.post(
+        "/api/items/bulk/deploy",
+        json={"ids": [1, 2, 3, 3, 999], "assigned_user": "alice carter", "mode": "best_effort"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["applied"], body["failed"]) == (2, 2)
+    outcomes = [(result["id"], result["ok"]) for result in body["results"]]
+    assert outcomes == [(1, True), (2, False), (3, True), (999, False)]
+    assert [body["results"][index]["error"] for index in (1, 3)] == ["No changes to apply", "Item not found"]
+    for item_id in (1, 3):
+        detail = item(client, item_id)
+        assert (detail["item"]["status"], detail["item"]["assigned_user"]) == ("Deployed", "Alice Carter")
+        assert detail["history"][0]["action"] == "deploy"
+
+
+def test_all_or_nothing_changes_nothing_on_error(client):
+    history_before = len(item(client, 1)["history"])
+    response = client.post("/api/items/bulk/deploy", json={"ids": [1, 2], "assigned_user": "Alice Carter"})
+    assert response.status_code == 400
+    assert [result["id"] for result in response.json()["detail"]["results"]] == [2]
+    detail = item(client, 1)
+    assert detail["item"]["status"] == "In Stock"
+    assert len(detail["history"]) == history_before
+
+
+def test_bulk_return_and_retire(client):
+    assert client.post("/api/items/bulk/return", json={"ids": [2, 4]}).json()["applied"] == 2
+    for item_id in (2, 4):
+        returned = item(client, item_id)["item"]
+        assert (returned["status"], returned["assigned_user"]) == ("In Stock", None)
+    assert client.post("/api/items/bulk/retire", json={"ids": [2, 4]}).json()["applied"] == 2
+    assert client.post("/api/items/bulk/restore", json={"ids": [2]}).json()["applied"] == 1
+    assert [item(client, item_id)["item"]["status"] for item_id in (2, 4)] == ["In Stock", "Retired"]
+
+
+def test_bulk_deploy_requires_assignee(client):
+    assert client.post("/api/items/bulk/deploy", json={"ids": [1]}).status_code == 400
+    assert client.post("/api/items/bulk/deploy", json={"ids": []}).status_code == 422
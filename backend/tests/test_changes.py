@@ -0,0 +1,58 @@
+from app.common import encode_cursor
+from app.database import db
+
+
+def sync(client, since, limit=100):
+    params = {"limit": limit}
+    if since:
+        params["since"] = since
+    response = client.get("/api/items/changes", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_changes_since_cursor(client):
+    full = sync(client, None)
+    assert full["has_more"] is False and full["deleted"] == []
+    assert len(full["items"]) == client.get("/api/items", params={"limit": 1}).json()["total"]
+    assert client.post("/api/items/1/deploy", json={"assigned_user": "Alex Kim"}).status_code == 200
+    assert client.put("/api/items/5", json={"note": "Battery swapped"}).status_code == 200
+    delta = sync(client, full["next_cursor"])
+    assert [(item["id"], item["status"]) for item in delta["items"]] == [(1, "Deployed"), (5, "In Stock")]
+    assert delta["items"][1]["note"] == "Battery swapped"
+    assert sync(client, delta["next_cursor"])["items"] == []
+
+
+def test_changes_page_without_gaps(client):
+    cursor = sync(client, None)["next_cursor"]
+    assert client.post("/api/items/bulk/retire", json={"ids": [1, 3, 5, 7, 9, 10]}).json()["applied"] == 6
+    seen = []
+    while True:
+        page = sync(client, cursor, limit=4)
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+    assert sorted(seen) == [1, 3, 5, 7, 9, 10]
+    assert len(seen) == len(set(seen))
+
+
+def test_deleted_items_are_reported_once(client):
+    cursor = sync(client, None)["next_cursor"]
+
+    def delete(conn):
+        conn.execute("DELETE FROM audit_events WHERE item_id = 9")
+        conn.execute("DELETE FROM items WHERE id = 9")
+
+    db.run_write(delete)
+    delta = sync(client, cursor)
+    assert delta["items"] == []
+    assert [(entry["id"], entry["merged_into"]) for entry in delta["deleted"]] == [(9, None)]
+    assert sync(client, delta["next_cursor"])["deleted"] == []
+    assert all(item["id"] != 9 for item in sync(client, None)["items"])
+
+
+def test_foreign_and_malformed_cursors(client):
+    other = encode_cursor("items:changes", ["00000000", 1, None])
+    assert client.get("/api/items/changes", params={"since": other}).status_code == 410
+    assert client.get("/api/items/changes", params={"since": "garbage"}).status_code == 400
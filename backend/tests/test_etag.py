@@ -0,0 +1,41 @@
+import pytest
+
+
+def current_etag(client):
+    response = client.get("/api/items/1")
+    assert response.status_code == 200
+    return response.headers["ETag"]
+
+
+def test_matching_etag_returns_not_modified(client):
+    etag = current_etag(client)
+    response = client.get("/api/items/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize(
+    "path, params, status_code",
+    [
+        ("/api/items/999999", {}, 404),
+        ("/api/items/999999/history", {}, 404),
+        ("/api/items/1", {"history_cursor": "garbage"}, 400),
+        ("/api/items/1/history", {"cursor": "garbage"}, 400),
+        ("/api/items", {"cursor": "garbage"}, 400),
+        ("/api/items", {"sort": "relevance"}, 400),
+        ("/api/items/category/cable/history", {"cursor": "garbage"}, 400),
+        ("/api/items/category/cable/summary", {"history_cursor": "garbage"}, 400),
+    ],
+)
+def test_errors_win_over_not_modified(client, path, params, status_code):
+    etag = current_etag(client)
+    response = client.get(path, params=params, headers={"If-None-Match": etag})
+    assert response.status_code == status_code
+
+
+def test_write_changes_etag(client):
+    etag = current_etag(client)
+    assert client.post("/api/items/1/deploy", json={"assigned_user": "Alex Kim"}).status_code == 200
+    response = client.get("/api/items/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,56 @@
+def add_cable(client, make, model):
+    response = client.post("/api/items", json={"category": "Cable", "make": make, "model": model})
+    assert response.status_code == 201
+    return response.json()["item"]["id"]
+
+
+def test_item_history_pages_follow_cursor(client):
+    for _ in range(3):
+        assert client.post("/api/items/1/deploy", json={"assigned_user": "Alex Kim"}).status_code == 200
+        assert client.post("/api/items/1/return", json={}).status_code == 200
+    full = client.get("/api/items/1/history", params={"limit": 100}).json()
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/items/1/history", params=params).json()
+        seen.extend(entry["id"] for entry in page["history"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert len(seen) >= 6
+    assert seen == [entry["id"] for entry in full["history"]]
+
+
+def test_history_cursor_is_scoped_to_its_item(client):
+    for _ in range(2):
+        client.post("/api/items/1/deploy", json={"assigned_user": "Alex Kim"})
+        client.post("/api/items/1/return", json={})
+    cursor = client.get("/api/items/1/history", params={"limit": 1}).json()["next_cursor"]
+    assert cursor is not None
+    assert client.get("/api/items/3/history", params={"cursor": cursor}).status_code == 400
+
+
+def test_category_history_pages_across_items(client):
+    cable_ids = [add_cable(client, "HDMI-HDMI", "3ft"), add_cable(client, "HDMI-DisplayPort", "6ft")]
+    for cable_id in cable_ids:
+        for delta in (5, -2, 1):
+            assert client.post(f"/api/items/{cable_id}/quantity", json={"delta": delta}).status_code == 200
+    full = client.get("/api/items/category/cable/history", params={"limit": 100}).json()["history"]
+    assert {entry["item_id"] for entry in full} == set(cable_ids)
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/items/category/cable/history", params=params).json()
+        seen.extend(entry["id"] for entry in page["history"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [entry["id"] for entry in full]
+    summary = client.get("/api/items/category/cable/summary", params={"history_limit": 3}).json()
+    assert summary["history_next_cursor"] is not None
@@ -0,0 +1,93 @@
+import json
+import sqlite3
+
+from app.database import db
+from app.database.pool import get_pool
+from app.routes import imports
+
+CSV_HEADER = "category,make,model,service_tag,row,note\n"
+
+
+def item_count(client):
+    return client.get("/api/items", params={"limit": 1}).json()["total"]
+
+
+def post_csv(client, body, **params):
+    return client.post("/api/items/import", params=params, content=body, headers={"Content-Type": "text/csv"})
+
+
+def test_csv_import_reports_row_failures(client):
+    before = item_count(client)
+    body = (
+        CSV_HEADER
+        + "Laptop,Dell,Latitude 7440,IMP001,F1,\n"
+        + "Laptop,,Latitude 7440,IMP002,,missing make\n"
+        + "Cable,HDMI-HDMI,10ft,,,\n"
+        + "Cable,HDMI - HDMI,10 ft,,,same cable\n"
+    )
+    report = post_csv(client, body).json()
+    assert (report["total_rows"], report["imported"], report["failed"]) == (4, 2, 2)
+    assert [error["row"] for error in report["errors"]] == [2, 4]
+    assert item_count(client) == before + 2
+    found = client.get("/api/items", params={"q": "IMP001"}).json()["items"]
+    assert [item["row"] for item in found] == ["F1"]
+
+
+def test_dry_run_validates_without_writing(client):
+    before = item_count(client)
+    body = CSV_HEADER + "Monitor,Dell,U2724D,IMP100,,\nMonitor,Dell,U2724D,,,\n"
+    report = post_csv(client, body, dry_run="true").json()
+    assert report["dry_run"] is True
+    assert (report["imported"], report["failed"]) == (1, 1)
+    assert item_count(client) == before
+
+
+def test_ndjson_import_spans_chunks(client, monkeypatch):
+    monkeypatch.setattr(imports, "IMPORT_CHUNK_SIZE", 2)
+    in_use = []
+    prepare = imports.prepare_import_record
+
+    def checked_prepare(record):
+        in_use.append(get_pool(db.DB_PATH).stats()["in_use"])
+        return prepare(record)
+
+    monkeypatch.setattr(imports, "prepare_import_record", checked_prepare)
+    records = [
+        {"category": "Dock", "make": "Dell", "model": "WD22TB4", "service_tag": f"NDJ{index}"} for index in range(5)
+    ]
+    records.append({"category": "Cable", "make": "USB-HDMI", "model": "2ft"})
+    records.append({"category": "Cable", "make": "HDMI-USB", "model": "2 ft"})
+    body = "\n".join(json.dumps(record) for record in records) + "\nnot json\n"
+    response = client.post("/api/items/import", content=body, headers={"Content-Type": "application/x-ndjson"})
+    report = response.json()
+    assert (report["total_rows"], report["imported"], report["failed"]) == (8, 6, 2)
+    assert [error["row"] for error in report["errors"]] == [7, 8]
+    assert set(in_use) == {0}
+    assert client.get("/api/items", params={"q": "WD22TB4"}).json()["total"] == 5
+
+
+def test_failed_chunk_returns_partial_report(client, monkeypatch):
+    monkeypatch.setattr(imports, "IMPORT_CHUNK_SIZE", 2)
+    insert = imports.insert_new_items
+    calls = []
+
+    def flaky_insert(conn, items, actor):
+        calls.append(len(items))
+        if len(calls) == 2:
+            raise sqlite3.OperationalError("disk I/O error")
+        return insert(conn, items, actor)
+
+    monkeypatch.setattr(imports, "insert_new_items", flaky_insert)
+    before = item_count(client)
+    body = CSV_HEADER + "".join(f"Part,Crucial,DDR5 32GB,PRT{index},,\n" for index in range(5))
+    response = post_csv(client, body)
+    assert response.status_code == 500
+    detail = response.json()["detail"]
+    assert detail["imported"] == 2
+    assert detail["failed_chunk"] == {"index": 1, "first_row": 3, "last_row": 4}
+    assert item_count(client) == before + 2
+
+
+def test_import_requires_a_known_format(client):
+    response = client.post("/api/items/import", content=b"x", headers={"Content-Type": "text/plain"})
+    assert response.status_code == 415
@@ -0,0 +1,133 @@
+import sqlite3
+
+from app.database import db
+from app.database.migrations import MIGRATIONS, get_pending_migrations
+from app.database.pool import connect
+
+BASELINE_SCHEMA = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    role TEXT NOT NULL DEFAULT 'user'
+);
+CREATE TABLE items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT NOT NULL,
+    make TEXT NOT NULL,
+    model TEXT NOT NULL,
+    service_tag TEXT NOT NULL,
+    quantity INTEGER NOT NULL DEFAULT 1,
+    row TEXT,
+    note TEXT,
+    status TEXT NOT NULL,
+    assigned_user TEXT,
+    created_at TEXT NOT NULL,
+    created_by TEXT NOT NULL,
+    updated_at TEXT
+);
+CREATE TABLE audit_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INTEGER NOT NULL,
+    actor TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    action TEXT NOT NULL,
+    changes TEXT,
+    note TEXT,
+    FOREIGN KEY(item_id) REFERENCES items(id)
+);
+CREATE INDEX idx_audit_item_id ON audit_events(item_id);
+CREATE TABLE user_audit_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    actor TEXT NOT NULL,
+    target_user TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    action TEXT NOT NULL,
+    details TEXT,
+    old_value TEXT,
+    new_value TEXT
+);
+CREATE INDEX idx_user_audit_timestamp ON user_audit_logs(timestamp DESC);
+CREATE UNIQUE INDEX idx_items_cable_unique_signature
+ON items(lower(make), lower(model))
+WHERE lower(category) = 'cable';
+"""
+
+BASELINE_ITEMS = [
+    ("Laptop", "Dell", "Latitude 5420", "L5A2K7Q", 1, "A1", "In Stock", None),
+    ("Cable", "HDMI-DisplayPort", "6ft", "N/A", 4, "C1", "In Stock", None),
+    ("Cable", "DisplayPort - HDMI", "6 ft", "N/A", 3, None, "In Stock", None),
+    ("Monitor", "Dell", "P2422H", "M4P1T7H", 1, "C2", "Deployed", "Taylor Brooks"),
+]
+
+
+def create_baseline_database(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(BASELINE_SCHEMA)
+    for index, item in enumerate(BASELINE_ITEMS, start=1):
+        timestamp = f"2023-01-0{index}T00:00:00"
+        conn.execute(
+            """
+            INSERT INTO items (category, make, model, service_tag, quantity, row, status, assigned_user,
+                               created_at, created_by, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'owner', ?)
+            """,
+            (*item, timestamp, timestamp),
+        )
+        conn.execute(
+            "INSERT INTO audit_events (item_id, actor, timestamp, action, changes) VALUES (?, 'owner', ?, 'add', ?)",
+            (index, timestamp, '{"status": {"old": null, "new": "In Stock"}}'),
+        )
+    conn.commit()
+    conn.close()
+
+
+def test_baseline_database_upgrades_to_current_schema(db_path):
+    create_baseline_database(db_path)
+    db.init_db()
+    conn = connect(db_path)
+    try:
+        versions = [row[0] for row in conn.execute("SELECT version FROM schema_migrations ORDER BY version")]
+        assert versions == [version for version, _, _ in MIGRATIONS]
+        assert get_pending_migrations(conn) == []
+
+        cables = conn.execute("SELECT * FROM items WHERE category = 'Cable'").fetchall()
+        assert len(cables) == 1
+        cable = cables[0]
+        assert (cable["make"], cable["model"], cable["quantity"]) == ("DisplayPort-HDMI", "6 ft", 7)
+        assert (cable["cable_ends_key"], cable["cable_length_key"]) == ("displayport-hdmi", "6 ft")
+        assert [row[0] for row in conn.execute("SELECT item_id FROM audit_events WHERE item_id IN (2, 3)")] == [2, 2]
+
+        tombstone = conn.execute("SELECT * FROM item_tombstones WHERE item_id = 3").fetchone()
+        assert tombstone["merged_into"] == 2
+
+        monitor = conn.execute("SELECT * FROM items WHERE id = 4").fetchone()
+        assert monitor["assigned_user"] == "Taylor Brooks"
+        version = conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()[0]
+        conn.execute("UPDATE items SET note = 'checked' WHERE id = 4")
+        assert conn.execute("SELECT change_seq FROM items WHERE id = 4").fetchone()[0] == version + 1
+        conn.rollback()
+        assert conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 3
+        assert conn.execute("SELECT rowid FROM items_fts WHERE items_fts MATCH 'latitude'").fetchall()[0][0] == 1
+    finally:
+        conn.close()
+
+
+def test_migrations_are_idempotent(db_path):
+    create_baseline_database(db_path)
+    db.init_db()
+    conn = connect(db_path)
+    try:
+        before = conn.execute("SELECT id, quantity, change_seq FROM items ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    db.init_db()
+    conn = connect(db_path)
+    try:
+        after = conn.execute("SELECT id, quantity, change_seq FROM items ORDER BY id").fetchall()
+        applied = conn.execute("SELECT COUNT(*) FROM schema_migrations").fetchone()[0]
+    finally:
+        conn.close()
+    assert [tuple(row) for row in after] == [tuple(row) for row in before]
+    assert applied == len(MIGRATIONS)
@@ -0,0 +1,51 @@
+import pytest
+from fastapi import HTTPException
+
+from app.common import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("items:id:desc", ["2024-01-01T00:00:00", 42])
+    assert "=" not in cursor
+    assert decode_cursor(cursor, "items:id:desc", 2) == ["2024-01-01T00:00:00", 42]
+    assert decode_cursor(None, "items:id:desc", 2) is None
+
+
+@pytest.mark.parametrize(
+    "cursor, scope, size",
+    [
+        (encode_cursor("items:id:desc", [1, 2]), "items:id:asc", 2),
+        (encode_cursor("items:id:desc", [1]), "items:id:desc", 2),
+        ("not-a-cursor", "items:id:desc", 2),
+        (encode_cursor("items:id:desc", [{"a": 1}, 2]), "items:id:desc", 2),
+        (encode_cursor("items:id:desc", [[1], 2]), "items:id:desc", 2),
+    ],
+)
+def test_cursor_rejects_foreign_or_malformed(cursor, scope, size):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, scope, size)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("sort, direction", [("id", "desc"), ("row", "asc"), ("updated", "desc")])
+def test_item_list_pages_cover_every_item_once(client, sort, direction):
+    expected = client.get("/api/items", params={"sort": sort, "direction": direction}).json()["items"]
+    seen = []
+    cursor = None
+    while True:
+        params = {"sort": sort, "direction": direction, "limit": 7}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get("/api/items", params=params).json()
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [item["id"] for item in expected]
+
+
+def test_crafted_cursor_is_rejected_before_sql(client):
+    cursor = encode_cursor("items:id:desc", [{"a": 1}, 2])
+    response = client.get("/api/items", params={"limit": 5, "cursor": cursor})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
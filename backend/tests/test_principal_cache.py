@@ -0,0 +1,27 @@
+from app.database import db
+from app.database.pool import get_pool
+
+
+def pool_acquisitions():
+    stats = get_pool(db.DB_PATH).stats()
+    return stats["hits"] + stats["misses"] + stats["waits"]
+
+
+def test_cached_principal_does_not_borrow_a_connection(client):
+    assert client.get("/api/me").json() == {"username": "owner", "role": "owner"}
+    before = pool_acquisitions()
+    for _ in range(3):
+        assert client.get("/api/me").status_code == 200
+    assert pool_acquisitions() == before
+
+
+def test_role_change_invalidates_cached_principal(client, auth_headers):
+    headers = auth_headers("user")
+    assert client.get("/api/me", headers=headers).json()["role"] == "user"
+    user_id = next(user["id"] for user in client.get("/api/users").json()["users"] if user["username"] == "user")
+    assert client.put(f"/api/users/{user_id}/role", json={"role": "admin"}).status_code == 200
+    assert client.get("/api/me", headers=headers).json()["role"] == "admin"
+
+
+def test_unknown_principal_is_rejected(client, auth_headers):
+    assert client.get("/api/me", headers=auth_headers("ghost")).status_code == 401
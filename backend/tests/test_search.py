@@ -0,0 +1,31 @@
+import pytest
+
+
+@pytest.mark.parametrize("q", ["", "   ", "!!!", "-*"])
+def test_search_without_tokens_returns_nothing(client, q):
+    response = client.get("/api/items", params={"q": q})
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "total": 0, "next_cursor": None}
+
+
+def test_search_matches_prefixes(client):
+    body = client.get("/api/items", params={"q": "latit", "sort": "relevance"}).json()
+    assert body["total"] > 0
+    assert all("Latitude" in item["model"] for item in body["items"])
+
+
+def test_search_snippet_escapes_item_text(client):
+    created = client.post(
+        "/api/items",
+        json={"category": "Dock", "make": "Dell", "model": "<Probe> WD22", "service_tag": "K9T4X2P"},
+    )
+    assert created.status_code == 201
+    items = client.get("/api/items", params={"q": "probe"}).json()["items"]
+    assert len(items) == 1
+    snippet = items[0]["search_snippet"]
+    assert "<Probe>" not in snippet
+    assert "&lt;<mark>Probe</mark>&gt;" in snippet
+
+
+def test_relevance_sort_requires_a_query(client):
+    assert client.get("/api/items", params={"sort": "relevance"}).status_code == 400
@@ -0,0 +1,41 @@
+from app.database import db
+from app.database.pool import connect
+from app.database.rollup import rebuild_item_rollup
+from app.services import fetch_item_stats
+
+
+def rebuilt_stats():
+    conn = connect(db.DB_PATH)
+    try:
+        conn.execute("BEGIN")
+        rebuild_item_rollup(conn)
+        return fetch_item_stats(conn, include_models=True)
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def test_rollup_tracks_every_kind_of_write(client):
+    cable = client.post("/api/items", json={"category": "Cable", "make": "HDMI-HDMI", "model": "3ft"}).json()["item"]
+    assert client.post(f"/api/items/{cable['id']}/quantity", json={"delta": 12}).status_code == 200
+    assert client.post(f"/api/items/{cable['id']}/quantity", json={"delta": -5}).status_code == 200
+    laptop = {"category": "Laptop", "make": "Lenovo", "model": "T14", "service_tag": "STAT1"}
+    assert client.post("/api/items", json=laptop).status_code == 201
+    assert client.post("/api/items/1/deploy", json={"assigned_user": "Alex Kim"}).status_code == 200
+    assert client.post("/api/items/bulk/return", json={"ids": [2, 4]}).status_code == 200
+    assert client.post("/api/items/bulk/retire", json={"ids": [2, 3]}).status_code == 200
+    assert client.put("/api/items/5", json={"model": "Latitude 9440"}).status_code == 200
+    assert client.post(f"/api/items/{cable['id']}/retire", json={"zero_stock": True}).status_code == 200
+
+    stats = client.get("/api/items/stats", params={"include_models": "true"}).json()
+    assert stats == rebuilt_stats()
+    cables = next(entry for entry in stats["categories"] if entry["category"] == "Cable")
+    assert (cables["items"], cables["count"], cables["retired"]) == (1, 0, 0)
+    total = client.get("/api/items", params={"limit": 1}).json()["total"]
+    assert stats["totals"]["items"] == total
+
+
+def test_category_filter(client):
+    stats = client.get("/api/items/stats", params={"category": "laptop"}).json()
+    assert [entry["category"] for entry in stats["categories"]] == ["Laptop"]
+    assert stats["totals"]["items"] == stats["categories"][0]["items"]
@@ -0,0 +1,40 @@
+import time
+
+from app.core.stream_tickets import StreamTicketStore
+
+
+def test_ticket_is_single_use():
+    store = StreamTicketStore(ttl=30)
+    ticket = store.issue("owner")
+    assert store.redeem(ticket) == "owner"
+    assert store.redeem(ticket) is None
+    assert store.redeem("unknown") is None
+    assert store.stats()["redeemed"] == 1
+    assert store.stats()["rejected"] == 2
+
+
+def test_ticket_expires():
+    store = StreamTicketStore(ttl=0.01)
+    ticket = store.issue("owner")
+    time.sleep(0.02)
+    assert store.redeem(ticket) is None
+    assert store.stats()["expired"] == 1
+
+
+def test_outstanding_tickets_are_bounded():
+    store = StreamTicketStore(ttl=30, size=2)
+    first = store.issue("a")
+    store.issue("b")
+    store.issue("c")
+    assert store.redeem(first) is None
+    assert store.stats()["outstanding"] == 2
+    assert store.stats()["evictions"] == 1
+
+
+def test_issue_endpoint_requires_a_token(client):
+    response = client.post("/api/events/ticket")
+    assert response.status_code == 200
+    assert response.json()["expires_in"] > 0
+    client.headers.pop("Authorization")
+    assert client.post("/api/events/ticket").status_code == 401
+    assert client.get("/api/events/stream", params={"ticket": "forged"}).status_code == 401
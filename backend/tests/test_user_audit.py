@@ -0,0 +1,94 @@
+from app.database import db
+
+
+def create_user(client, username, role="user"):
+    response = client.post("/api/users", json={"username": username, "password": username, "role": role})
+    assert response.status_code == 201
+    return response.json()["user"]
+
+
+def set_log_timestamps(target_user, timestamps):
+    def write(conn):
+        ids = [
+            row[0]
+            for row in conn.execute(
+                "SELECT id FROM user_audit_logs WHERE target_user = ? ORDER BY id", (target_user,)
+            ).fetchall()
+        ]
+        for log_id, timestamp in zip(ids, timestamps):
+            conn.execute("UPDATE user_audit_logs SET timestamp = ? WHERE id = ?", (timestamp, log_id))
+
+    db.run_write(write)
+
+
+def fetch_logs(client, **params):
+    response = client.get("/api/user-audit-logs", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_filters_by_actor_target_and_action(client, auth_headers):
+    created = create_user(client, "dana")
+    assert client.put(f"/api/users/{created['id']}/role", json={"role": "admin"}).status_code == 200
+    response = client.put(
+        "/api/users/dana/reset-password", json={"new_password": "changed"}, headers=auth_headers("dana")
+    )
+    assert response.status_code == 200
+
+    logs = fetch_logs(client, target_user="DANA")["logs"]
+    assert [log["action"] for log in logs] == ["password_reset", "role_changed", "user_created"]
+    by_dana = fetch_logs(client, actor="dana")["logs"]
+    assert [log["action"] for log in by_dana] == ["password_reset"]
+    role_changes = fetch_logs(client, target_user="dana", action="role_changed")["logs"]
+    assert [(log["old_value"], log["new_value"]) for log in role_changes] == [("user", "admin")]
+
+
+def test_since_and_until_normalize_offsets(client):
+    created = create_user(client, "erin")
+    client.put(f"/api/users/{created['id']}/role", json={"role": "admin"})
+    client.put(f"/api/users/{created['id']}/role", json={"role": "user"})
+    set_log_timestamps("erin", ["2026-03-01T09:00:00", "2026-03-01T11:00:00", "2026-03-01T13:00:00"])
+
+    def actions(**params):
+        return [log["new_value"] for log in fetch_logs(client, target_user="erin", **params)["logs"]]
+
+    assert actions(since="2026-03-01T10:00:00") == ["user", "admin"]
+    assert actions(until="2026-03-01T12:00:00") == ["admin", "user"]
+    assert actions(since="2026-03-01T10:00:00+02:00") == ["user", "admin", "user"]
+    assert actions(since="2026-03-01T04:00:00-06:00", until="2026-03-01T12:00:00Z") == ["admin"]
+    assert actions(since="2026-03-02") == []
+
+
+def test_invalid_timestamp_is_rejected(client):
+    response = client.get("/api/user-audit-logs", params={"since": "yesterday"})
+    assert response.status_code == 400
+
+
+def test_cursor_pages_through_filtered_logs(client):
+    for index in range(5):
+        create_user(client, f"paged{index}")
+    expected = [log["id"] for log in fetch_logs(client, action="user_created", limit=100)["logs"]]
+    seen = []
+    cursor = None
+    while True:
+        params = {"action": "user_created", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        page = fetch_logs(client, **params)
+        seen.extend(log["id"] for log in page["logs"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+    assert len(seen) >= 5
+
+    first = fetch_logs(client, action="user_created", limit=2)
+    response = client.get(
+        "/api/user-audit-logs", params={"action": "role_changed", "cursor": first["next_cursor"]}
+    )
+    assert response.status_code == 400
+
+
+def test_requires_admin(client, auth_headers):
+    response = client.get("/api/user-audit-logs", headers=auth_headers("user"))
+    assert response.status_code == 403
@@ -0,0 +1,160 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from app.database import db
+from app.database import writer as writer_module
+from app.database.data_version import get_data_version
+from app.database.pool import connect
+from app.database.writer import WriteQueue, WriteTimeoutError
+
+
+@pytest.fixture
+def writer(seeded_db):
+    queue = WriteQueue(seeded_db)
+    yield queue
+    queue.close()
+
+
+def read_one(db_path, query, params=()):
+    conn = connect(db_path)
+    try:
+        return conn.execute(query, params).fetchone()
+    finally:
+        conn.close()
+
+
+def insert_user(username):
+    def job(conn):
+        conn.execute(
+            "INSERT INTO users (username, password_hash, created_at, role) VALUES (?, 'x', '2024-01-01', 'user')",
+            (username,),
+        )
+        return username
+
+    return job
+
+
+def test_failed_job_rolls_back_without_touching_its_batch(db_path, writer):
+    version = read_one(db_path, "SELECT version FROM data_version WHERE id = 1")[0]
+    gate = threading.Event()
+    blocker = threading.Thread(target=writer.submit, args=(lambda conn: gate.wait(5),))
+    blocker.start()
+    time.sleep(0.05)
+
+    def failing(conn):
+        insert_user("rolled-back")(conn)
+        raise ValueError("boom")
+
+    results = {}
+
+    def submit(name, job):
+        try:
+            results[name] = writer.submit(job)
+        except Exception as exc:
+            results[name] = exc
+
+    threads = [
+        threading.Thread(target=submit, args=("bad", failing)),
+        threading.Thread(target=submit, args=("good", insert_user("kept"))),
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    gate.set()
+    for thread in [blocker, *threads]:
+        thread.join()
+
+    assert isinstance(results["bad"], ValueError)
+    assert results["good"] == "kept"
+    assert read_one(db_path, "SELECT 1 FROM users WHERE username = 'rolled-back'") is None
+    assert read_one(db_path, "SELECT 1 FROM users WHERE username = 'kept'") is not None
+    assert read_one(db_path, "SELECT version FROM data_version WHERE id = 1")[0] > version
+
+
+def test_failed_batch_leaves_data_version_alone(db_path, writer):
+    conn = connect(db_path)
+    try:
+        version = get_data_version(conn)
+    finally:
+        conn.close()
+
+    def failing(conn):
+        raise sqlite3.IntegrityError("nope")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        writer.submit(failing)
+    conn = connect(db_path)
+    try:
+        assert get_data_version(conn) == version
+    finally:
+        conn.close()
+    assert writer.submit(lambda conn: 1) == 1
+
+
+def test_timed_out_pending_job_is_cancelled(db_path, writer):
+    gate = threading.Event()
+    blocker = threading.Thread(target=writer.submit, args=(lambda conn: gate.wait(5),))
+    blocker.start()
+    time.sleep(0.05)
+    with pytest.raises(WriteTimeoutError):
+        writer.submit(insert_user("late"), timeout=0.05)
+    gate.set()
+    blocker.join()
+    assert writer.submit(lambda conn: "after") == "after"
+    assert read_one(db_path, "SELECT 1 FROM users WHERE username = 'late'") is None
+
+
+def test_running_job_is_waited_for_past_the_timeout(db_path, writer):
+    def slow(conn):
+        time.sleep(0.3)
+        return insert_user("slow")(conn)
+
+    assert writer.submit(slow, timeout=0.05) == "slow"
+    assert read_one(db_path, "SELECT 1 FROM users WHERE username = 'slow'") is not None
+
+
+def test_writer_survives_commit_failure(db_path, writer, monkeypatch):
+    failures = [sqlite3.OperationalError("disk I/O error")]
+    bump = writer_module.bump_data_version
+
+    def flaky_bump(conn):
+        if failures:
+            raise failures.pop()
+        bump(conn)
+
+    monkeypatch.setattr(writer_module, "bump_data_version", flaky_bump)
+    with pytest.raises(sqlite3.OperationalError):
+        writer.submit(insert_user("lost"))
+    assert writer.alive
+    assert writer.submit(insert_user("saved")) == "saved"
+    assert read_one(db_path, "SELECT 1 FROM users WHERE username = 'lost'") is None
+    assert writer.stats()["commit_errors"] == 1
+
+
+def test_reads_are_served_while_writes_wait(client):
+    gate = threading.Event()
+    blocker = threading.Thread(target=db.run_write, args=(lambda conn: gate.wait(10),))
+    blocker.start()
+    time.sleep(0.05)
+    payload = {"assigned_user": "Alex Kim"}
+    writes = [
+        threading.Thread(target=client.post, args=(f"/api/items/{item_id}/deploy",), kwargs={"json": payload})
+        for item_id in (1, 3, 5, 7)
+    ]
+    for thread in writes:
+        thread.start()
+    time.sleep(0.2)
+    try:
+        started = time.perf_counter()
+        assert client.get("/api/items/2").status_code == 200
+        assert client.get("/api/items", params={"limit": 5}).status_code == 200
+        assert time.perf_counter() - started < 1
+    finally:
+        gate.set()
+        for thread in [blocker, *writes]:
+            thread.join()
+    deployed = [client.get(f"/api/items/{item_id}").json()["item"]["status"] for item_id in (1, 3, 5, 7)]
+    assert deployed == ["Deployed"] * 4
@@ -8,6 +8,8 @@ export default function CableOverviewModal({
   category,
   items,
   history,
+  hasMoreHistory,
+  onLoadMoreHistory,
   onClose,
   onAdjustQuantity,
   onRequestSetQuantity,
@@ -218,6 +220,11 @@ export default function CableOverviewModal({
                 })}
               </div>
             )}
+            {hasMoreHistory ? (
+              <button type="button" className="secondary" onClick={onLoadMoreHistory} disabled={busy}>
+                Load older history
+              </button>
+            ) : null}
           </div>
         </div>
     </Modal>
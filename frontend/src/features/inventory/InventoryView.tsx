@@ -61,6 +61,8 @@ export default function InventoryView({
     cableCategory,
     cableSummaryItems,
     cableSummaryHistory,
+    cableSummaryHistoryCursor,
+    historyCursor,
   } = state;
   const {
     filteredAndSortedItems,
@@ -111,6 +113,8 @@ export default function InventoryView({
     closeItemModal,
     closeAddModal,
     loadItemDetail,
+    loadMoreHistory,
+    loadMoreCableHistory,
     openCableModal,
     closeCableModal,
     adjustCableQuantity,
@@ -732,6 +736,11 @@ export default function InventoryView({
                     ))}
                   </div>
                 )}
+                {historyCursor ? (
+                  <button type="button" className="secondary" onClick={loadMoreHistory} disabled={busy}>
+                    Load older history
+                  </button>
+                ) : null}
               </div>
             </div>
             </div>
@@ -771,6 +780,8 @@ export default function InventoryView({
         category={cableCategory}
         items={cableSummaryItems}
         history={cableSummaryHistory}
+        hasMoreHistory={Boolean(cableSummaryHistoryCursor)}
+        onLoadMoreHistory={loadMoreCableHistory}
         onClose={closeCableModal}
         onAdjustQuantity={adjustCableQuantity}
         onRequestSetQuantity={(item) => {
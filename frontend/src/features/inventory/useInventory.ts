@@ -88,6 +88,7 @@ export default function useInventory({
   const [selectedId, setSelectedId] = useState(null);
   const [selectedItem, setSelectedItem] = useState(null);
   const [history, setHistory] = useState([]);
+  const [historyCursor, setHistoryCursor] = useState(null);
   const [addForm, setAddForm] = useState(createItemForm);
   const [editForm, setEditForm] = useState(createItemForm);
   const [showAddModal, setShowAddModal] = useState(false);
@@ -115,6 +116,7 @@ export default function useInventory({
   const [cableCategory, setCableCategory] = useState(CABLE_CATEGORY);
   const [cableSummaryItems, setCableSummaryItems] = useState([]);
   const [cableSummaryHistory, setCableSummaryHistory] = useState([]);
+  const [cableSummaryHistoryCursor, setCableSummaryHistoryCursor] = useState(null);
 
   const getStatusBadgeClass = (status) => {
     if (status === STATUS_IN_STOCK) {
@@ -428,6 +430,7 @@ export default function useInventory({
       setError("");
       setSelectedItem(data.item);
       setHistory(data.history || []);
+      setHistoryCursor(data.history_next_cursor || null);
       setEditForm({
         category: data.item.category,
         make: data.item.make,
@@ -453,6 +456,25 @@ export default function useInventory({
     }
   };
 
+  const loadMoreHistory = async () => {
+    if (!selectedItem || !historyCursor) {
+      return;
+    }
+    await runGuardedAction({ setBusy, setError, action: async () => {
+      const res = await apiRequest(
+        `/items/${selectedItem.id}/history?cursor=${encodeURIComponent(historyCursor)}`,
+        {},
+        token
+      );
+      if (!res.ok) {
+        throw new Error(await readApiErrorMessage(res, "Failed to load older history"));
+      }
+      const data = await res.json();
+      setHistory((prev) => [...prev, ...(data.history || [])]);
+      setHistoryCursor(data.next_cursor || null);
+    }});
+  };
+
   useEffect(() => {
     if (!token) {
       return;
@@ -702,6 +724,28 @@ export default function useInventory({
     setCableCategory(data.category || normalizedCategory);
     setCableSummaryItems(data.items || []);
     setCableSummaryHistory(data.history || []);
+    setCableSummaryHistoryCursor(data.history_next_cursor || null);
+  };
+
+  const loadMoreCableHistory = async () => {
+    if (!cableSummaryHistoryCursor) {
+      return;
+    }
+    await runGuardedAction({ setBusy, setError, action: async () => {
+      const res = await apiRequest(
+        `/items/category/${encodeURIComponent(cableCategory)}/history?cursor=${encodeURIComponent(
+          cableSummaryHistoryCursor
+        )}`,
+        {},
+        token
+      );
+      if (!res.ok) {
+        throw new Error(await readApiErrorMessage(res, "Failed to load older history"));
+      }
+      const data = await res.json();
+      setCableSummaryHistory((prev) => [...prev, ...(data.history || [])]);
+      setCableSummaryHistoryCursor(data.next_cursor || null);
+    }});
   };
 
   const openCableModal = async (category = CABLE_CATEGORY) => {
@@ -715,6 +759,7 @@ export default function useInventory({
     setShowCableModal(false);
     setCableSummaryItems([]);
     setCableSummaryHistory([]);
+    setCableSummaryHistoryCursor(null);
   };
 
   const adjustCableQuantity = async (itemId, delta, note = "") => {
@@ -895,6 +940,7 @@ export default function useInventory({
     setSelectedId(null);
     setSelectedItem(null);
     setHistory([]);
+    setHistoryCursor(null);
     setEditUnlocked(false);
     setRetireItem(null);
     setRetireForm(createRetireForm());
@@ -918,6 +964,7 @@ export default function useInventory({
     setSelectedId(null);
     setSelectedItem(null);
     setHistory([]);
+    setHistoryCursor(null);
     setAddForm(createItemForm());
     setEditForm(createItemForm());
     setShowAddModal(false);
@@ -941,6 +988,7 @@ export default function useInventory({
     setCableCategory(CABLE_CATEGORY);
     setCableSummaryItems([]);
     setCableSummaryHistory([]);
+    setCableSummaryHistoryCursor(null);
   };
 
   return {
@@ -950,6 +998,7 @@ export default function useInventory({
       selectedId,
       selectedItem,
       history,
+      historyCursor,
       addForm,
       editForm,
       showAddModal,
@@ -973,6 +1022,7 @@ export default function useInventory({
       cableCategory,
       cableSummaryItems,
       cableSummaryHistory,
+      cableSummaryHistoryCursor,
     },
     derived: {
       filteredAndSortedItems,
@@ -1029,6 +1079,8 @@ export default function useInventory({
       closeItemModal,
       closeAddModal,
       loadItemDetail,
+      loadMoreHistory,
+      loadMoreCableHistory,
       resetInventoryState,
     },
     refs: {